@@ -0,0 +1,243 @@
+"""Benchmarks for the Graphics primitives and animations on a simulated display
+
+Run with: python -m piledmatrix.benchmark --help
+"""
+from time import perf_counter
+from piledmatrix.directions import DIR_L, DIR_RD
+from piledmatrix.driver import DisplayUnit, PackedFramebuffer
+from piledmatrix.driver.simulator import RecordingTransport
+from piledmatrix.graphics import Graphics, PIXEL_OFF, PIXEL_ON, PIXEL_INVERT, transitions
+
+GEOMETRIES = [(1, 1), (4, 1), (8, 2), (16, 4)]
+
+# Draw modes of the --draw-mode option; "invert" changes the picture with every repeat of an operation, with "on" and
+# "off" the repeats draw the same picture again, which "delta" and "dense" flushes send nothing of
+DRAW_MODES = {"on": PIXEL_ON, "off": PIXEL_OFF, "invert": PIXEL_INVERT}
+
+
+def _checkerboard(display):
+    return [[(x + y) & 1 for y in display.rows] for x in display.columns]
+
+
+def _fill(gfx):
+    gfx.fill()
+    gfx.render()
+
+
+def _draw_line(gfx):
+    display = gfx.display
+    gfx.draw_line(0, 0, len(display.columns) - 1, len(display.rows) - 1)
+    gfx.render()
+
+
+def _draw_shapes(gfx):
+    display = gfx.display
+    width, height = len(display.columns), len(display.rows)
+    gfx.draw_rect(0, 0, width, height)
+    gfx.draw_circle(width // 2, height // 2, min(width, height) // 2 - 1, True)
+    gfx.draw_triangle(0, height - 1, width // 2, 0, width - 1, height - 1, False)
+    gfx.render()
+
+
+def _draw_char(gfx):
+    gfx.draw_char(0, 0, ord("A"))
+    gfx.render()
+
+
+def _draw_string(gfx):
+    gfx.draw_string(0, 0, "0123456789ABCDEFGHIJ")
+    gfx.render()
+
+
+def _seed_text(gfx):
+    # Text on every band of 8 rows, each one offset, for the cases shifting what is on the display
+    for y in range(0, len(gfx.display.rows), 8):
+        gfx.draw_string(-y, y, "0123456789ABCDEFGHIJ")
+
+
+def _move(gfx):
+    # Rotate the display content by one column, the column leaving at the left coming in at the right
+    display = gfx.display
+    width, height = len(display.columns), len(display.rows)
+    gfx.move(0, 0, width - 1, height - 1, DIR_L, 1, columns=[display.framebuffer.get_column(0, 0, height)])
+    gfx.render()
+
+
+def _play(gfx, frames):
+    # Like Graphics.play, without waiting between the frames
+    for _frame in frames:
+        gfx.render()
+
+
+def _scroll_bitmap(gfx):
+    _play(gfx, gfx.scroll_bitmap_frames(_checkerboard(gfx.display), DIR_L, 1))
+
+
+def _scroll_vector(gfx):
+    _play(gfx, gfx.scroll_vector_frames(_checkerboard(gfx.display), -1, 0.5, 1))
+
+
+def _marquee(gfx):
+    _play(gfx, gfx.marquee_frames("0123456789ABCDEFGHIJ"))
+
+
+def _animate_wipe(gfx):
+    _play(gfx, gfx.wipe_frames(_checkerboard(gfx.display), DIR_RD))
+
+
+def _animate_dissolve(gfx):
+    _play(gfx, gfx.transition_frames(_checkerboard(gfx.display), transitions.dissolve(*gfx._size())))
+
+
+def _animate_slide(gfx):
+    _play(gfx, gfx.slide_frames(_checkerboard(gfx.display), DIR_L))
+
+
+def _animate_rain(gfx):
+    _play(gfx, gfx.rain_frames(_checkerboard(gfx.display)))
+
+
+# (name, operation); every operation draws in the draw mode of the run and renders at least once
+CASES = [
+    ("fill", _fill),
+    ("draw_line", _draw_line),
+    ("draw_shapes", _draw_shapes),
+    ("draw_char", _draw_char),
+    ("draw_string", _draw_string),
+    ("move", _move),
+    ("scroll_bitmap", _scroll_bitmap),
+    ("scroll_vector", _scroll_vector),
+    ("marquee", _marquee),
+    ("animate_wipe", _animate_wipe),
+    ("animate_dissolve", _animate_dissolve),
+    ("animate_slide", _animate_slide),
+    ("animate_rain", _animate_rain),
+]
+
+# name: drawing done once before the case is timed
+SETUPS = {
+    "move": _seed_text,
+}
+
+
+class _TimedDisplay(object):
+    # Accumulates the time the display spends in send_buffer
+
+    def __init__(self, display):
+        self.flush_time = 0.0
+        send_buffer = display.send_buffer
+
+        def timed_send_buffer(mode=None, data=None):
+            start = perf_counter()
+            try:
+                send_buffer(mode, data)
+            finally:
+                self.flush_time += perf_counter() - start
+        display.send_buffer = timed_send_buffer
+
+
+def framebuffer_class(name):
+    # Framebuffer class for the --framebuffer option: "packed" or "numpy"
+    if name == "numpy":
+        from piledmatrix.driver.npframebuffer import NumpyFramebuffer
+        return NumpyFramebuffer
+    if name == "packed":
+        return PackedFramebuffer
+    raise ValueError("unknown framebuffer: {0}".format(name))
+
+
+def run_case(name, operation, geometry, min_time=0.2, max_ops=10000, framebuffer=PackedFramebuffer,
+             send_mode=None, setup=None, draw_mode="invert"):
+    # Run one operation repeatedly (at least once) on a fresh simulated display and return its figures as a dict
+    # Times are per operation in seconds, bytes and transactions per operation
+    # setup: function drawing the start picture with the Graphics object of the case
+    # send_mode: send mode of every render (see Graphics.set_send_mode), None for "full"
+    # draw_mode: key of DRAW_MODES, the draw mode of the operation (and of setup)
+    transport = RecordingTransport(keep_transactions=False)
+    display = DisplayUnit(geometry[0], geometry[1], framebuffer=framebuffer, transport=transport)
+    display.init()
+    gfx = Graphics(display)
+    gfx.set_draw_mode(DRAW_MODES[draw_mode])
+    if send_mode is not None:
+        gfx.set_send_mode(send_mode)
+    timer = _TimedDisplay(display)
+    result = {"case": name, "geometry": "{0}x{1}".format(*geometry), "draw_mode": draw_mode}
+    try:
+        if setup is not None:
+            setup(gfx)
+        operation(gfx)
+        transport.reset()
+        timer.flush_time = 0.0
+        ops = 0
+        start = perf_counter()
+        while True:
+            operation(gfx)
+            ops += 1
+            elapsed = perf_counter() - start
+            if ops >= max_ops or elapsed >= min_time:
+                break
+    except Exception as error:
+        result["error"] = "{0}: {1}".format(type(error).__name__, error)
+        return result
+    finally:
+        display.release()
+    result.update({
+        "ops": ops,
+        "ops_per_sec": ops / elapsed if elapsed > 0 else float("inf"),
+        "build_time": max(0.0, elapsed - timer.flush_time) / ops,
+        "flush_time": timer.flush_time / ops,
+        "bytes": transport.bytes_sent / float(ops),
+        "transactions": transport.transaction_count / float(ops),
+        "bus_time": transport.bus_time / ops,
+    })
+    return result
+
+
+def run(cases=None, geometries=None, min_time=0.2, max_ops=10000, framebuffer=PackedFramebuffer, send_mode=None,
+        draw_modes=None):
+    # Run the named cases (all by default) on every geometry in every draw mode (by default "invert"),
+    # returns a list of result dicts
+    results = []
+    for name, operation in CASES:
+        if cases and name not in cases:
+            continue
+        for geometry in geometries or GEOMETRIES:
+            for draw_mode in draw_modes or ["invert"]:
+                results.append(run_case(name, operation, geometry, min_time, max_ops, framebuffer, send_mode,
+                                        SETUPS.get(name), draw_mode))
+    return results
+
+
+def _key(entry):
+    # Results of runs before the draw mode was recorded were all drawn in "invert"
+    return entry["case"], entry["geometry"], entry.get("draw_mode", "invert")
+
+
+def compare(results, baseline):
+    # Pair results with a baseline run (both lists of result dicts); returns (result, ops_per_sec ratio) tuples,
+    # the ratio being None where either run failed or the case (in that geometry and draw mode) is missing in the
+    # baseline
+    previous = dict((_key(entry), entry) for entry in baseline)
+    pairs = []
+    for entry in results:
+        old = previous.get(_key(entry))
+        ratio = None
+        if old is not None and "error" not in old and "error" not in entry:
+            ratio = entry["ops_per_sec"] / old["ops_per_sec"]
+        pairs.append((entry, ratio))
+    return pairs
+
+
+def format_results(results, baseline=None):
+    lines = ["{0:<16} {1:>6} {2:>6} {3:>11} {4:>11} {5:>11} {6:>10} {7:>8}{8}".format(
+        "case", "size", "draw", "ops/s", "build us", "flush us", "bytes", "xfers", "  vs base" if baseline else "")]
+    for entry, ratio in compare(results, baseline or []):
+        if "error" in entry:
+            lines.append("{0:<16} {1:>6} {2:>6} {3}".format(entry["case"], entry["geometry"],
+                                                            entry.get("draw_mode", "invert"), entry["error"]))
+            continue
+        lines.append("{0:<16} {1:>6} {2:>6} {3:>11.1f} {4:>11.1f} {5:>11.1f} {6:>10.1f} {7:>8.1f}{8}".format(
+            entry["case"], entry["geometry"], entry.get("draw_mode", "invert"), entry["ops_per_sec"],
+            entry["build_time"] * 1e6, entry["flush_time"] * 1e6, entry["bytes"], entry["transactions"],
+            "" if not baseline else ("        -" if ratio is None else "  {0:>6.2f}x".format(ratio))))
+    return "\n".join(lines)
@@ -0,0 +1,52 @@
+import argparse
+import json
+import sys
+from piledmatrix.benchmark import CASES, DRAW_MODES, GEOMETRIES, format_results, framebuffer_class, run
+from piledmatrix.driver import SEND_MODES
+
+
+def _geometry(value):
+    blocks_per_row, _x, blocks_per_column = value.lower().partition("x")
+    return int(blocks_per_row), int(blocks_per_column)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m piledmatrix.benchmark",
+                                     description="Benchmark Graphics primitives on a simulated MAX7219 display")
+    parser.add_argument("cases", nargs="*", metavar="case",
+                        help="cases to run, any of: " + ", ".join(name for name, _operation in CASES))
+    parser.add_argument("-g", "--geometry", action="append", type=_geometry,
+                        help="blocks per row x blocks per column, e.g. 4x1 (repeatable, default: {0})".format(
+                            " ".join("{0}x{1}".format(*geometry) for geometry in GEOMETRIES)))
+    parser.add_argument("-t", "--min-time", type=float, default=0.2,
+                        help="seconds to run each case, at least one operation (default 0.2)")
+    parser.add_argument("-n", "--max-ops", type=int, default=10000, help="operations per case at most")
+    parser.add_argument("--framebuffer", choices=("packed", "numpy"), default="packed",
+                        help="framebuffer of the simulated display (numpy needs numpy installed)")
+    parser.add_argument("--send-mode", choices=SEND_MODES,
+                        help="send mode of every flush (default: the one of each case, \"full\")")
+    parser.add_argument("-d", "--draw-mode", action="append", choices=sorted(DRAW_MODES),
+                        help="draw mode of the operations (repeatable, default: invert, which changes the picture "
+                             "with every operation)")
+    parser.add_argument("--json", metavar="FILE", help="write the results as JSON to FILE ('-' for stdout)")
+    parser.add_argument("--compare", metavar="FILE", help="JSON results of an earlier run to compare against")
+    args = parser.parse_args(argv)
+
+    results = run(args.cases, args.geometry, args.min_time, args.max_ops, framebuffer_class(args.framebuffer),
+                  args.send_mode, args.draw_mode)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+    if args.json == "-":
+        json.dump({"results": results}, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print(format_results(results, baseline))
+        if args.json:
+            with open(args.json, "w") as json_file:
+                json.dump({"results": results}, json_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,4 @@
 """LED matrix driver"""
 from piledmatrix.driver.max7219 import *
+from piledmatrix.driver.transport import *
+from piledmatrix.driver.geometry import *
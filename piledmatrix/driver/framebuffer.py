@@ -0,0 +1,364 @@
+"""Packed framebuffers"""
+
+PIXEL_OFF = 0
+PIXEL_ON = 1
+PIXEL_INVERT = 2
+
+
+class PackedFramebuffer(object):
+    # Pixels are held column by column in a bytearray, one byte per 8-pixel block column.
+    # The top pixel of a block column is the MSB, so every byte already is a MAX7219 digit register value
+    # and packing a frame for the wire is a gather of whole bytes instead of a per-pixel loop.
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.stride = (height + 7) // 8
+        self.data = bytearray(self.width * self.stride)
+
+    def index(self, x, y):
+        # Byte offset in 'data' holding the pixel at 'x'/'y'
+        return x * self.stride + (y >> 3)
+
+    def get_pixel(self, x, y):
+        return (self.data[x * self.stride + (y >> 3)] >> (7 - (y & 7))) & 1
+
+    def set_pixel(self, x, y, value):
+        index = x * self.stride + (y >> 3)
+        if value:
+            self.data[index] |= 0x80 >> (y & 7)
+        else:
+            self.data[index] &= ~(0x80 >> (y & 7)) & 0xFF
+
+    def invert_pixel(self, x, y):
+        self.data[x * self.stride + (y >> 3)] ^= 0x80 >> (y & 7)
+
+    def clear(self):
+        self.fill(0)
+
+    def fill(self, value):
+        # Switch every pixel on (truthy value) or off
+        self.data[:] = (b"\xff" if value else b"\x00") * len(self.data)
+        self._clear_padding()
+
+    def invert(self):
+        self.data[:] = self.data.translate(_INVERT_TABLE)
+        self._clear_padding()
+
+    def blit_column(self, x, y, bits, count=8, xor=False):
+        # Write 'count' pixels of column 'x' from row 'y' down, taken from the int 'bits' (MSB = row 'y')
+        # They replace the pixels, or are XORed onto them; anything outside the framebuffer is clipped
+        if not 0 <= x < self.width:
+            return
+        if y < 0:
+            count += y
+            bits &= (1 << max(count, 0)) - 1
+            y = 0
+        if y + count > self.height:
+            bits >>= y + count - self.height
+            count = self.height - y
+        if count <= 0:
+            return
+        stride = self.stride
+        start = x * stride
+        shift = stride * 8 - y - count
+        if stride == 1:
+            column = self.data[start]
+        else:
+            column = int.from_bytes(self.data[start:start + stride], "big")
+        if xor:
+            column ^= bits << shift
+        else:
+            mask = ((1 << count) - 1) << shift
+            column = (column & ~mask) | ((bits << shift) & mask)
+        if stride == 1:
+            self.data[start] = column
+        else:
+            self.data[start:start + stride] = column.to_bytes(stride, "big")
+
+    def blit_columns(self, x, y, columns, xor=False):
+        # blit_column for a run of 8 pixel high columns (a bytes-like object) starting at column 'x'
+        # A run at a row that is a multiple of 8 is written as whole bytes
+        first = max(0, -x)
+        last = min(len(columns), self.width - x)
+        if first >= last:
+            return
+        if y >= 0 and y & 7 == 0 and y + 8 <= self.height:
+            stride = self.stride
+            start = (x + first) * stride + (y >> 3)
+            stop = start + (last - first) * stride
+            columns = bytes(bytearray(columns[first:last]))
+            if xor:
+                old = self.data[start:stop:stride]
+                columns = (int.from_bytes(old, "big") ^ int.from_bytes(columns, "big")).to_bytes(len(old), "big")
+            self.data[start:stop:stride] = columns
+            return
+        for index in range(first, last):
+            self.blit_column(x + index, y, columns[index], 8, xor)
+
+    def get_column(self, x, y=0, count=None):
+        # 'count' pixels (default: down to the bottom) of column 'x' from row 'y' down as an int (MSB = row 'y'),
+        # the counterpart of blit_column; the pixels have to lie inside the framebuffer
+        if count is None:
+            count = self.height - y
+        stride = self.stride
+        column = int.from_bytes(self.data[x * stride:(x + 1) * stride], "big")
+        return (column >> (stride * 8 - y - count)) & ((1 << count) - 1)
+
+    def blit_bitmap(self, x, y, bitmap, mode=PIXEL_ON):
+        # Draw a 2d [x][y] bitmap of truthy/falsy pixels with its upper left corner at 'x'/'y', clipped:
+        # PIXEL_ON copies it, PIXEL_OFF copies it inverted and PIXEL_INVERT XORs it onto the framebuffer
+        if mode not in (PIXEL_OFF, PIXEL_ON, PIXEL_INVERT):
+            return
+        for bitmap_x, column in enumerate(bitmap):
+            if not 0 <= x + bitmap_x < self.width:
+                continue
+            bits = _bits(column)
+            count = len(column)
+            if mode == PIXEL_OFF:
+                bits ^= (1 << count) - 1
+            self.blit_column(x + bitmap_x, y, bits, count, mode == PIXEL_INVERT)
+
+    def fill_rect(self, x, y, width, height, mode=PIXEL_ON):
+        # Switch the pixels of a rectangle on (PIXEL_ON), off (PIXEL_OFF) or invert them (PIXEL_INVERT), clipped
+        # This is the span core of the drawing primitives: each 8 pixel block row of the rectangle is one
+        # translate of a strided slice, with a table ORing, AND-NOTing or XORing the mask of its rows
+        x, y, width, height = self._clip(x, y, width, height)
+        if not width or not height or mode not in (PIXEL_OFF, PIXEL_ON, PIXEL_INVERT):
+            return
+        stride = self.stride
+        data = self.data
+        if width == self.width and height == self.height and not height & 7:
+            # The whole framebuffer
+            data[:] = data.translate(_span_table(mode, 0xFF))
+            return
+        bottom = y + height
+        for row in range(y >> 3, ((bottom - 1) >> 3) + 1):
+            mask = (0xFF >> max(y - row * 8, 0)) & ~(0xFF >> min(bottom - row * 8, 8)) & 0xFF
+            table = _span_table(mode, mask)
+            start = x * stride + row
+            if width == 1:
+                data[start] = table[data[start]]
+            else:
+                stop = start + width * stride
+                data[start:stop:stride] = data[start:stop:stride].translate(table)
+
+    def blend(self, source, target, mask):
+        # Take every pixel from 'target' where the mask (bytes in the format of packed()) is on, else from 'source';
+        # both are framebuffers of the same size
+        mask = int.from_bytes(mask, "big")
+        bits = (int.from_bytes(source.packed(), "big") & ~mask) | (int.from_bytes(target.packed(), "big") & mask)
+        self.data[:] = bits.to_bytes(len(self.data), "big")
+
+    def shift_region(self, x, y, width, height, dx=0, dy=0, incoming=None):
+        # Move the content of a rectangle 'dx' pixel to the right (negative: left) and 'dy' pixel down (negative: up)
+        # Pixels moved out of the rectangle are dropped; the vacated pixels are set from 'incoming', packed columns
+        # (ints, MSB = top) from left to right: along x the |dx| columns of 'height' pixels of the vacated strip,
+        # along y the 'width' columns of |dy| pixels, and along both all 'width' columns of 'height' pixels of the
+        # rectangle, of which only the vacated pixels are used. Missing columns (or all if it is None) are off.
+        # A horizontal move of whole block rows moves slices of the packed bytes (a single one for the full height)
+        x, y, width, height = self._clip(x, y, width, height)
+        if not width or not height or not (dx or dy):
+            return
+        incoming = incoming or ()
+        if dx and dy:
+            self._shift_diagonal(x, y, width, height, dx, dy, incoming)
+            return
+        if dx:
+            distance = min(abs(dx), width)
+            keep = width - distance
+            first_new = x + keep if dx < 0 else x
+            if y & 7 == 0 and (height & 7 == 0 or y + height == self.height):
+                self._move_columns(x + distance if dx < 0 else x, x if dx < 0 else x + distance, keep, y, height)
+            else:
+                # Column by column, reading every column before it is overwritten
+                order = range(x, x + keep) if dx < 0 else range(x + width - 1, x + distance - 1, -1)
+                step = distance if dx < 0 else -distance
+                for column in order:
+                    self.blit_column(column, y, self.get_column(column + step, y, height), height)
+            for index in range(distance):
+                self.blit_column(first_new + index, y, incoming[index] if index < len(incoming) else 0, height)
+            return
+        distance = min(abs(dy), height)
+        mask = (1 << height) - 1
+        for index in range(width):
+            bits = self.get_column(x + index, y, height)
+            new = incoming[index] if index < len(incoming) else 0
+            if dy > 0:
+                bits = (bits >> distance) | (new << (height - distance))
+            else:
+                bits = ((bits << distance) & mask) | new
+            self.blit_column(x + index, y, bits, height)
+
+    def _shift_diagonal(self, x, y, width, height, dx, dy, incoming):
+        # shift_region along both axes in one pass: every column is read once, shifted and written once
+        mask = (1 << height) - 1
+        distance = min(abs(dy), height)
+        # Rows of a column which keep moved pixels, the others are vacated
+        kept = mask >> distance if dy > 0 else (mask << distance) & mask
+        columns = [self.get_column(column, y, height) for column in range(x, x + width)]
+        for index in range(width):
+            new = incoming[index] & mask if index < len(incoming) else 0
+            source = index - dx
+            if 0 <= source < width:
+                bits = columns[source] >> distance if dy > 0 else (columns[source] << distance) & mask
+                new = bits | (new & ~kept)
+            self.blit_column(x + index, y, new, height)
+
+    def _move_columns(self, source, target, count, y, height):
+        # Copy 'count' columns of the block rows from 'y' down over 'height' pixels from column 'source' on to
+        # column 'target' on, as slices of the packed bytes
+        stride = self.stride
+        data = self.data
+        if y == 0 and height == self.height:
+            data[target * stride:(target + count) * stride] = data[source * stride:(source + count) * stride]
+            return
+        for row in range(y >> 3, (y + height + 7) >> 3):
+            data[target * stride + row:(target + count) * stride + row:stride] = \
+                data[source * stride + row:(source + count) * stride + row:stride]
+
+    def _clip(self, x, y, width, height):
+        # Rectangle 'x'/'y' 'width' x 'height' cut to the framebuffer, width and height 0 if nothing is left
+        left, top = max(x, 0), max(y, 0)
+        right, bottom = min(x + width, self.width), min(y + height, self.height)
+        return left, top, max(right - left, 0), max(bottom - top, 0)
+
+    def get_columns(self, y=0):
+        # The 8 pixel high band from row 'y' down as one column byte per column (rows outside read as off)
+        stride = self.stride
+        if y >= 0 and y & 7 == 0 and y + 8 <= self.height:
+            return bytes(self.data[y >> 3::stride])
+        columns = bytearray(self.width)
+        shift = stride * 8 - y - 8
+        for x in range(self.width):
+            column = int.from_bytes(self.data[x * stride:(x + 1) * stride], "big")
+            columns[x] = (column >> shift if shift >= 0 else column << -shift) & 0xFF
+        return bytes(columns)
+
+    def shift_columns(self, columns, y=0, right=False):
+        # Shift the 8 pixel high band at row 'y' by len(columns) columns to the left, the column bytes
+        # 'columns' entering at the right edge; or (right=True) to the right, entering at the left edge.
+        # 'columns' are in display order (left to right). A band at a multiple of 8 is moved as whole bytes.
+        width = self.width
+        band = self.get_columns(y)
+        if right:
+            band = (bytes(columns) + band)[:width]
+        else:
+            band = (band + bytes(columns))[-width:]
+        self.blit_columns(0, y, band)
+
+    def packed(self):
+        # Column-major bytes in wire format, see the class comment
+        return self.data
+
+    def load(self, data):
+        # Replace the whole content with bytes previously returned by packed()
+        self.data[:] = data
+
+    def window(self, x, y, width, height):
+        # The rectangle at 'x'/'y' (inside the framebuffer) in the format of packed() of a 'width' x 'height'
+        # framebuffer; whole block rows are cut out as slices of the packed bytes
+        stride = self.stride
+        data = self.data
+        if y == 0 and height == self.height:
+            return bytes(data[x * stride:(x + width) * stride])
+        window_stride = (height + 7) // 8
+        if y & 7 == 0:
+            window = bytearray(width * window_stride)
+            start = x * stride + (y >> 3)
+            for row in range(window_stride):
+                window[row::window_stride] = data[start + row:start + row + width * stride:stride]
+            unused = window_stride * 8 - height
+            if unused:
+                last = window_stride - 1
+                window[last::window_stride] = window[last::window_stride].translate(_and_table((0xFF << unused) & 0xFF))
+            return bytes(window)
+        unused = window_stride * 8 - height
+        return b"".join((self.get_column(column, y, height) << unused).to_bytes(window_stride, "big")
+                        for column in range(x, x + width))
+
+    def to_list(self):
+        # Unpack into a 2d list [x][y] of 0/1, the format of the original list buffer
+        get_pixel = self.get_pixel
+        return [[get_pixel(x, y) for y in range(self.height)] for x in range(self.width)]
+
+    def _clear_padding(self):
+        # Bits below the last row of a display whose height is not a multiple of 8 always stay off
+        unused = self.stride * 8 - self.height
+        if unused:
+            mask = (0xFF << unused) & 0xFF
+            last = self.stride - 1
+            self.data[last::self.stride] = self.data[last::self.stride].translate(_and_table(mask))
+
+    def __len__(self):
+        return self.width
+
+    def __getitem__(self, x):
+        # buffer[x][y] compatibility with the former list of lists
+        if x < 0:
+            x += self.width
+        if not 0 <= x < self.width:
+            raise IndexError("framebuffer column out of range")
+        return ColumnView(self, x)
+
+
+class ColumnView(object):
+    # One column of a PackedFramebuffer that reads and writes like the former list buffer[x]
+
+    def __init__(self, framebuffer, x):
+        self.framebuffer = framebuffer
+        self.x = x
+
+    def __len__(self):
+        return self.framebuffer.height
+
+    def _row(self, y):
+        if y < 0:
+            y += self.framebuffer.height
+        if not 0 <= y < self.framebuffer.height:
+            raise IndexError("framebuffer row out of range")
+        return y
+
+    def __getitem__(self, y):
+        if isinstance(y, slice):
+            return [self.framebuffer.get_pixel(self.x, row) for row in range(*y.indices(len(self)))]
+        return self.framebuffer.get_pixel(self.x, self._row(y))
+
+    def __setitem__(self, y, value):
+        self.framebuffer.set_pixel(self.x, self._row(y), value)
+
+    def __iter__(self):
+        for y in range(self.framebuffer.height):
+            yield self.framebuffer.get_pixel(self.x, y)
+
+
+def _bits(pixels):
+    # Int of a sequence of truthy/falsy pixels, the first one in the MSB
+    bits = 0
+    for pixel in pixels:
+        bits = bits << 1 | (1 if pixel else 0)
+    return bits
+
+
+# (mode, mask): translate table applying 'mask' to a byte in draw mode 'mode'
+_span_tables = {}
+
+
+def _span_table(mode, mask):
+    table = _span_tables.get((mode, mask))
+    if table is None:
+        if mode == PIXEL_ON:
+            table = bytes(bytearray(value | mask for value in range(256)))
+        elif mode == PIXEL_OFF:
+            table = bytes(bytearray(value & ~mask & 0xFF for value in range(256)))
+        else:
+            table = bytes(bytearray(value ^ mask for value in range(256)))
+        table = _span_tables[(mode, mask)] = table
+    return table
+
+
+def _and_table(mask):
+    return bytes(bytearray(value & mask for value in range(256)))
+
+
+_INVERT_TABLE = bytes(bytearray(value ^ 0xFF for value in range(256)))
@@ -0,0 +1,142 @@
+"""Layout of the MAX7219 modules of a display: where each one sits, how it is turned and how it is wired
+
+A Geometry is compiled once into the framebuffer byte offsets of every digit register. Turned or mirrored modules
+take their registers from copies of the frame with the bits of every byte reversed or the 8 x 8 blocks transposed,
+made with a handful of whole-frame operations per flush, so any layout flushes at about the cost of the default one.
+"""
+
+# Byte with its bits in reverse order
+_REVERSE_TABLE = bytes(bytearray(int("{0:08b}".format(value)[::-1], 2) for value in range(256)))
+
+# Sources of the digit registers: the framebuffer bytes, bits reversed, blocks transposed, transposed and reversed
+_COLUMNS, _COLUMNS_REVERSED, _ROWS, _ROWS_REVERSED = range(4)
+
+
+class Module(object):
+    # One MAX7219 with its 8 x 8 LED matrix at block column 'x', block row 'y' of the display
+    # rotation: 0, 90, 180 or 270 degrees clockwise from the default orientation, in which digit register 0 drives
+    # the leftmost column with its MSB at the top; flip_x and flip_y mirror the module before it is turned
+    # chain: index of the Chain (in DisplayUnit's chains) driving it
+
+    def __init__(self, x, y, rotation=0, flip_x=False, flip_y=False, chain=0):
+        if rotation not in (0, 90, 180, 270):
+            raise ValueError("rotation has to be 0, 90, 180 or 270, not {0}".format(rotation))
+        self.x = x
+        self.y = y
+        self.rotation = rotation
+        self.flip_x = flip_x
+        self.flip_y = flip_y
+        self.chain = chain
+
+    def pixel(self, digit, bit):
+        # Position in the block of the LED driven by bit 'bit' (0 = MSB) of register 'digit'
+        x, y = 7 - digit if self.flip_x else digit, 7 - bit if self.flip_y else bit
+        for _turn in range(self.rotation // 90):
+            x, y = 7 - y, x
+        return x, y
+
+    def line(self, digit):
+        # (source, line): the block column (or row, for a module turned by 90 or 270 degrees) register 'digit'
+        # drives, and which copy of the frame holds it with the MSB in the right place
+        (x, y), (last_x, _last_y) = self.pixel(digit, 0), self.pixel(digit, 7)
+        if x == last_x:
+            return (_COLUMNS_REVERSED if y else _COLUMNS), x
+        return (_ROWS_REVERSED if x else _ROWS), y
+
+    def __repr__(self):
+        return "Module({0}, {1}, rotation={2}, flip_x={3}, flip_y={4}, chain={5})".format(
+            self.x, self.y, self.rotation, self.flip_x, self.flip_y, self.chain)
+
+
+class Geometry(object):
+    # The modules of a display of 'blocks_per_row' x 'blocks_per_column' blocks in wiring order: the chips of the
+    # first chain from the Raspberry Pi on, then those of the next chain. Every block needs exactly one module.
+
+    def __init__(self, blocks_per_row, blocks_per_column, modules):
+        self.blocks_per_row = blocks_per_row
+        self.blocks_per_column = blocks_per_column
+        modules = sorted(modules, key=lambda module: module.chain)
+        positions = set((module.x, module.y) for module in modules)
+        if len(modules) != blocks_per_row * blocks_per_column or len(positions) != len(modules) or \
+                not all(0 <= x < blocks_per_row and 0 <= y < blocks_per_column for x, y in positions):
+            raise ValueError("the modules do not cover {0} x {1} blocks once each".format(
+                blocks_per_row, blocks_per_column))
+        self.modules = modules
+        self._compile()
+
+    @classmethod
+    def default(cls, blocks_per_row, blocks_per_column, rotation=0, flip_x=False, flip_y=False):
+        # The wiring DisplayUnit assumes without a geometry: down every block column, the columns from left to right
+        return cls(blocks_per_row, blocks_per_column,
+                   [Module(x, y, rotation, flip_x, flip_y) for x in range(blocks_per_row)
+                    for y in range(blocks_per_column)])
+
+    @classmethod
+    def serpentine(cls, blocks_per_row, blocks_per_column, rotation=0):
+        # Wired along the block rows from the top, left to right and back; the modules of every second row are
+        # mounted upside down (turned by a further 180 degrees)
+        modules = []
+        for y in range(blocks_per_column):
+            backwards = y % 2 == 1
+            for x in (reversed(range(blocks_per_row)) if backwards else range(blocks_per_row)):
+                modules.append(Module(x, y, (rotation + 180) % 360 if backwards else rotation))
+        return cls(blocks_per_row, blocks_per_column, modules)
+
+    def chain_sizes(self):
+        # Number of modules of every chain index
+        sizes = [0] * (max(module.chain for module in self.modules) + 1)
+        for module in self.modules:
+            sizes[module.chain] += 1
+        return sizes
+
+    def _compile(self):
+        # The offset of every digit register in the bytes returned by source(), and which frame copies it needs
+        stride = self.blocks_per_column
+        size = self.blocks_per_row * 8 * stride
+        self._offsets = []
+        sources = set()
+        for module in self.modules:
+            offsets = []
+            for digit in range(8):
+                source, line = module.line(digit)
+                sources.add(source)
+                if source in (_COLUMNS, _COLUMNS_REVERSED):
+                    offset = (module.x * 8 + line) * stride + module.y
+                else:
+                    # Transposed frame: the block rows one after another, every block as its 8 rows
+                    offset = module.y * self.blocks_per_row * 8 + module.x * 8 + line
+                offsets.append(source * size + offset)
+            self._offsets.append(offsets)
+        self._copies = max(sources)
+        # Masks of the three steps of the 8 x 8 bit matrix transpose, repeated for every block
+        blocks = self.blocks_per_row * self.blocks_per_column
+        self._transpose_masks = [(shift, int.from_bytes(bytes.fromhex(mask) * blocks, "big")) for shift, mask in
+                                 ((7, "00AA00AA00AA00AA"), (14, "0000CCCC0000CCCC"), (28, "00000000F0F0F0F0"))]
+
+    def index(self, block, digit):
+        # Offset of the byte for register 'digit' of module 'block' (in wiring order) in the bytes of source()
+        return self._offsets[block][digit]
+
+    def source(self, data):
+        # The bytes the digit registers are gathered from: the framebuffer bytes 'data' (see PackedFramebuffer),
+        # followed by as many of the copies (bits reversed, blocks transposed, both) as the modules need
+        copies = self._copies
+        if copies == _COLUMNS:
+            return data
+        parts = [bytes(data), bytes(data).translate(_REVERSE_TABLE)]
+        if copies >= _ROWS:
+            parts.append(self._transpose(data))
+        if copies == _ROWS_REVERSED:
+            parts.append(parts[2].translate(_REVERSE_TABLE))
+        return b"".join(parts)
+
+    def _transpose(self, data):
+        # The frame as 8 x 8 blocks with rows and columns swapped, all blocks at once in one big int:
+        # the blocks of every block row are 8 consecutive bytes of its band (every stride-th byte)
+        stride = self.blocks_per_column
+        bands = b"".join(bytes(data[row::stride]) for row in range(stride))
+        bits = int.from_bytes(bands, "big")
+        for shift, mask in self._transpose_masks:
+            swap = (bits ^ (bits >> shift)) & mask
+            bits ^= swap ^ (swap << shift)
+        return bits.to_bytes(len(bands), "big")
@@ -1,5 +1,8 @@
-from copy import deepcopy
-from spidev import SpiDev
+from operator import itemgetter
+from threading import Condition, RLock, Thread
+from piledmatrix.driver.framebuffer import PackedFramebuffer
+from piledmatrix.driver.geometry import Geometry
+from piledmatrix.driver.transport import SpiTransport
 
 MAX7219_NOOP_REG = 0x0
 MAX7219_DIGIT0_REG = 0x1
@@ -22,40 +25,229 @@ MAX7219_SHUTDOWN_NO = 0x1
 
 DEFAULT_BRIGHTNESS = 4
 
+# Modes of DisplayUnit.send_buffer
+SEND_MODES = ("full", "delta", "dense")
+
 # 'No operation' tuple: 0x0 sent to register MAX7219_NOOP_REG
 _NO_OP_DATA = [MAX7219_NOOP_REG, 0x0]
+_NO_OP_BYTES = bytes(bytearray(_NO_OP_DATA))
+
+
+def _gather(indices):
+    # Callable picking the bytes at 'indices' out of a bytes-like object, always returning a tuple
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda data: (data[index],)
+    return itemgetter(*indices)
+
 
-_spi = SpiDev()
+class Chain(object):
+    # One cascade of MAX7219 chips on its own SPI device
+    # blocks: number of chips in the cascade; None takes all blocks not claimed by the preceding chains
+    # transport: Transport to use instead of the SPI device given by bus, device, max_speed_hz and mode
+    # The chip next to the Raspberry Pi drives the first of the chain's blocks
 
-def _spi_open():
-    _spi.open(0, 0)
+    def __init__(self, bus=0, device=0, blocks=None, max_speed_hz=None, mode=None, transport=None):
+        if transport is None:
+            transport = SpiTransport(bus, device, max_speed_hz, mode)
+        self.transport = transport
+        self.block_count = blocks
+        self.blocks = None
 
-def _spi_close():
-    _spi.close()
+    def _bind(self, blocks, digit_indices):
+        # Attach the chain to the display blocks it drives
+        # digit_indices[digit]: framebuffer byte offsets of that digit register, in the order they are sent
+        self.blocks = blocks
+        self.gathers = [_gather(indices) for indices in digit_indices]
+        # The whole frame, eight rows of [register,data] * blocks, preallocated for all flushes
+        self.row_length = 2 * len(blocks)
+        self.registers = [bytes(bytearray([MAX7219_DIGIT0_REG + digit])) * len(blocks) for digit in range(8)]
+        self.frame = bytearray(8 * self.row_length)
+        self.transport.bind(len(blocks))
+        # Per-digit register rows of the last flush, None while the content of the chips is unknown
+        self.sent_rows = None
+
+    def send_to(self, position, register, data):
+        # Write one register of the chip at 'position' in the chain, all others get a NO-OP
+        padded_data = _NO_OP_DATA * (len(self.blocks) - position - 1) + [register, data] + _NO_OP_DATA * position
+        self.transport.send_bytes(padded_data)
+
+    def send_to_all(self, register, data):
+        self.transport.send_bytes([register, data] * len(self.blocks))
+
+    def dirty_blocks(self, data, dirty):
+        last_block = self.blocks[-1]
+        for digit, gather in enumerate(self.gathers):
+            row = gather(data)
+            sent_row = None if self.sent_rows is None else self.sent_rows[digit]
+            if row != sent_row:
+                blocks = dirty.setdefault(digit, [])
+                blocks += [last_block - position for position in range(len(row))
+                           if sent_row is None or row[position] != sent_row[position]]
+
+    def pack(self, data, mode):
+        # Fill the frame from the framebuffer bytes 'data' and return the (offset, length) rows to transmit
+        # "delta" returns only the changed digit rows, unchanged blocks in them get a NO-OP; "dense" packs the
+        # changed registers of all digits into as few rows as possible. Both send everything ("full") while the
+        # content of the chips is unknown.
+        frame = self.frame
+        row_length = self.row_length
+        if mode == "full" or self.sent_rows is None:
+            rows = []
+            for digit, gather in enumerate(self.gathers):
+                row = gather(data)
+                offset = digit * row_length
+                frame[offset:offset + row_length:2] = self.registers[digit]
+                frame[offset + 1:offset + row_length:2] = row
+                rows.append(row)
+            self.sent_rows = rows
+            return [(digit * row_length, row_length) for digit in range(8)]
+        if mode == "dense":
+            return self._pack_dense(data)
+        segments = []
+        for digit, gather in enumerate(self.gathers):
+            row = gather(data)
+            sent_row = self.sent_rows[digit]
+            if row == sent_row:
+                continue
+            offset = digit * row_length
+            frame[offset:offset + row_length:2] = self.registers[digit]
+            frame[offset + 1:offset + row_length:2] = row
+            for position in range(len(row)):
+                if row[position] == sent_row[position]:
+                    frame[offset + 2 * position:offset + 2 * position + 2] = _NO_OP_BYTES
+            segments.append((offset, row_length))
+            self.sent_rows[digit] = row
+        return segments
+
+    def _pack_dense(self, data):
+        # Every transmission writes one register to each chip, and the registers need not be the same digit:
+        # the chips get their changed registers one per row, so the frame takes as many rows as the chip with the
+        # most changes needs instead of one row per changed digit
+        writes = [[] for _position in range(len(self.blocks))]
+        for digit, gather in enumerate(self.gathers):
+            row = gather(data)
+            sent_row = self.sent_rows[digit]
+            if row == sent_row:
+                continue
+            register = MAX7219_DIGIT0_REG + digit
+            for position in range(len(row)):
+                if row[position] != sent_row[position]:
+                    writes[position].append((register, row[position]))
+            self.sent_rows[digit] = row
+        frame = self.frame
+        row_length = self.row_length
+        count = max(len(position_writes) for position_writes in writes)
+        frame[:count * row_length] = _NO_OP_BYTES * (count * len(writes))
+        for position, position_writes in enumerate(writes):
+            offset = 2 * position
+            for register, value in position_writes:
+                frame[offset] = register
+                frame[offset + 1] = value
+                offset += row_length
+        return [(index * row_length, row_length) for index in range(count)]
+
+    def write(self, segments):
+        self.transport.send_segments(self.frame, segments)
 
-def _send_bytes(datalist):
-    # Send sequence of bytes (should be [register,data] tuples) via SPI port, then raise CS
-    # Included for ease of remembering the syntax rather than the native spidev command,
-    # but also to avoid reassigning to 'datalist' argument
-    _spi.xfer2(datalist[:])
 
 class DisplayUnit(object):
 
-    def __init__(self, blocks_per_row, blocks_per_column):
+    def __init__(self, blocks_per_row, blocks_per_column, framebuffer=PackedFramebuffer,
+                 bus=0, device=0, max_speed_hz=None, mode=None, chains=None, transport=None, double_buffered=False,
+                 geometry=None):
+        # framebuffer: class (or any callable taking width and height) creating the pixel store
+        # bus, device, max_speed_hz, mode: SPI device of a display driven by a single chain
+        # transport: Transport of a display driven by a single chain, replacing the SPI device
+        # chains: list of Chain splitting the blocks over several SPI devices instead, flushed in parallel
+        # double_buffered: send_buffer only hands a snapshot of the framebuffer to a flush thread, see send_buffer
+        # geometry: Geometry of turned, mirrored or differently wired modules; by default every block column is
+        # wired from the top down, the columns from left to right, and the modules are not turned
         self.blocks_per_row = blocks_per_row
         self.blocks_per_column = blocks_per_column
         self.blocks = range(self.blocks_per_row * self.blocks_per_column)
         self.rows = range(self.blocks_per_column * 8)
         self.columns = range(self.blocks_per_row * 8)
-        self.buffer = [[0 for _col in self.rows] for _row in self.columns]
+        self.framebuffer = framebuffer(len(self.columns), len(self.rows))
+        if geometry is None:
+            geometry = Geometry.default(blocks_per_row, blocks_per_column)
+        if (geometry.blocks_per_row, geometry.blocks_per_column) != (blocks_per_row, blocks_per_column):
+            raise ValueError("geometry of {0} x {1} blocks for a display of {2} x {3}".format(
+                geometry.blocks_per_row, geometry.blocks_per_column, blocks_per_row, blocks_per_column))
+        self.geometry = geometry
+        if chains is None:
+            chains = [Chain(bus, device, None, max_speed_hz, mode, transport)]
+        self.chains = chains
+        self._bind_chains()
+        self._executor = None
+        # Framebuffer bytes of the last flush, None while the content of the chips is unknown
+        self._sent_data = None
+        # Held while the chips are written to, by the flush thread as well as by send_to and send_to_all
+        self._bus_lock = RLock()
+        self.double_buffered = double_buffered
+        self._flush_thread = None
+        self._flush_condition = Condition()
+        # Front buffer of the double buffered mode: (framebuffer bytes, mode) waiting for the flush thread
+        self._front = None
+        self._flushing = False
+        self._flush_error = None
+
+    @property
+    def buffer(self):
+        # Compatibility view: display.buffer[x][y] reads and writes pixels of the framebuffer
+        return self.framebuffer
+
+    def _block_index(self, block, digit):
+        # Offset of the byte holding register 'digit' of 'block' in the bytes the registers are gathered from,
+        # the framebuffer bytes followed by the copies the geometry needs (see Geometry.source)
+        return self.geometry.index(block, digit)
+
+    def _bind_chains(self):
+        sizes = self.geometry.chain_sizes()
+        if len(sizes) > 1 and len(sizes) != len(self.chains):
+            raise ValueError("geometry for {0} chains, display with {1}".format(len(sizes), len(self.chains)))
+        first = 0
+        for index, chain in enumerate(self.chains):
+            count = chain.block_count
+            if len(sizes) > 1:
+                if count is not None and count != sizes[index]:
+                    raise ValueError("chain {0} drives {1} blocks, the geometry {2}".format(
+                        index, count, sizes[index]))
+                count = sizes[index]
+            if count is None:
+                count = len(self.blocks) - first
+            if count <= 0 or first + count > len(self.blocks):
+                raise ValueError("chain {0} does not fit into {1} blocks".format(index, len(self.blocks)))
+            blocks = range(first, first + count)
+            # The data shifts through the whole chain, so the last block is sent first
+            chain._bind(blocks, [[self._block_index(block, digit) for block in reversed(blocks)] for digit in range(8)])
+            first += count
+        if first != len(self.blocks):
+            raise ValueError("chains drive {0} of {1} blocks".format(first, len(self.blocks)))
+
+    def _chain_of(self, block):
+        for chain in self.chains:
+            if block in chain.blocks:
+                return chain
+
+    def _digit_register_written(self, register, chains):
+        if MAX7219_DIGIT0_REG <= register <= MAX7219_DIGIT7_REG:
+            self._sent_data = None
+            for chain in chains:
+                chain.sent_rows = None
 
     def send_to(self, block, register, data):
         if block in self.blocks:
-            padded_data = _NO_OP_DATA * (len(self.blocks) - block - 1) + [register, data] + _NO_OP_DATA * block
-            _send_bytes(padded_data)
+            chain = self._chain_of(block)
+            with self._bus_lock:
+                self._digit_register_written(register, [chain])
+                chain.send_to(block - chain.blocks[0], register, data)
 
     def send_to_all(self, register, data):
-        _send_bytes([register, data] * len(self.blocks))
+        with self._bus_lock:
+            self._digit_register_written(register, self.chains)
+            for chain in self.chains:
+                chain.send_to_all(register, data)
 
     def clear_blocks(self, blocks):
         # Clear one or more specified MAX7219 matrices (argument(s) to be specified as a list even if just one)
@@ -77,48 +269,153 @@ class DisplayUnit(object):
 
     def clone_buffer(self):
         # returns the whole buffer array
-        return deepcopy(self.buffer)
+        return self.framebuffer.to_list()
 
     def clear_buffer(self):
-        for x in self.columns:
-            for y in self.rows:
-                self.buffer[x][y] = 0
-
-    def send_buffer(self):
-        for block_col in range(8):
-            column_data = []
-            for block in reversed(self.blocks):
-                buffer_row = self.buffer[(block // self.blocks_per_column) * 8 + block_col]
-                column_offset = (block % self.blocks_per_column) * 8
-                data_byte = 0x00
-                if buffer_row[column_offset + 0]:
-                    data_byte |= 0x80
-                if buffer_row[column_offset + 1]:
-                    data_byte |= 0x40
-                if buffer_row[column_offset + 2]:
-                    data_byte |= 0x20
-                if buffer_row[column_offset + 3]:
-                    data_byte |= 0x10
-                if buffer_row[column_offset + 4]:
-                    data_byte |= 0x08
-                if buffer_row[column_offset + 5]:
-                    data_byte |= 0x04
-                if buffer_row[column_offset + 6]:
-                    data_byte |= 0x02
-                if buffer_row[column_offset + 7]:
-                    data_byte |= 0x01
-                column_data += [block_col + 1, data_byte]
-            _send_bytes(column_data)
+        self.framebuffer.clear()
+
+    def dirty_blocks(self):
+        # Return {digit: [block, ...]} of the digit registers whose framebuffer bytes differ from the last flush
+        # All registers are dirty while the content of the chips is unknown
+        data = self.framebuffer.packed()
+        dirty = {}
+        if self._sent_data is not None and data == self._sent_data:
+            return dirty
+        source = self.geometry.source(data)
+        for chain in self.chains:
+            chain.dirty_blocks(source, dirty)
+        return dirty
+
+    def frame_data(self):
+        # Snapshot of the frame send_buffer would send, to be passed to send_buffer as 'data' later or from another
+        # thread; aio renders any target implementing this pair
+        return bytes(self.framebuffer.packed())
+
+    def pack_frame(self, mode="full", data=None):
+        # Prepare the next flush from the framebuffer (or from bytes previously returned by its packed())
+        # and return it as a list of (chain, rows) for write_frame; see send_buffer for the modes
+        if mode not in SEND_MODES:
+            raise ValueError("unknown send mode: {0}".format(mode))
+        if data is None:
+            data = self.framebuffer.packed()
+        if mode != "full" and self._sent_data is not None and data == self._sent_data:
+            return []
+        pending = []
+        source = self.geometry.source(data)
+        for chain in self.chains:
+            segments = chain.pack(source, mode)
+            if segments:
+                pending.append((chain, segments))
+        self._sent_data = bytes(data)
+        return pending
+
+    def write_frame(self, pending):
+        # Transmit a frame returned by pack_frame, all chains at the same time
+        if len(pending) == 1:
+            chain, segments = pending[0]
+            chain.write(segments)
+        elif pending:
+            if self._executor is None:
+                # Imported here, so displays with a single chain do not pay for importing concurrent.futures
+                from concurrent.futures import ThreadPoolExecutor
+                self._executor = ThreadPoolExecutor(max_workers=len(self.chains))
+            futures = [self._executor.submit(chain.write, segments) for chain, segments in pending]
+            for future in futures:
+                future.result()
+
+    def send_buffer(self, mode=None, data=None):
+        # mode: "full" (also None) transmits every digit register of every block,
+        # "delta" only the digit registers changed since the last flush; unchanged blocks of a transmitted
+        # digit get a NO-OP and nothing is sent at all if the framebuffer did not change,
+        # "dense" like "delta", but with the changed registers of different digits sent in the same transmission.
+        # The MAX7219 cannot shift its content, so a scroll still rewrites every register that changed; "dense"
+        # needs as many transmissions per chain as its chip with the most changed registers, which saves most on
+        # long chains where the chips change in different columns (text scrolling over a sparse background)
+        # Double buffered, the framebuffer content becomes the front buffer and the call returns at once while the
+        # flush thread transmits it; drawing can go on meanwhile. A frame still waiting when the next one is sent
+        # is dropped in favour of the newer one (sent "full" if either of them asked for it).
+        # data: bytes in the format of framebuffer.packed() to send instead of the framebuffer
+        if mode is None:
+            mode = "full"
+        if self._flush_thread is None:
+            with self._bus_lock:
+                self.write_frame(self.pack_frame(mode, data))
+            return
+        if mode not in SEND_MODES:
+            raise ValueError("unknown send mode: {0}".format(mode))
+        with self._flush_condition:
+            self._raise_flush_error()
+            if self._front is not None and self._front[1] == "full":
+                mode = "full"
+            self._front = (bytes(self.framebuffer.packed() if data is None else data), mode)
+            self._flush_condition.notify_all()
+
+    def wait_flushed(self):
+        # Block until the flush thread transmitted the last frame handed to it by send_buffer
+        with self._flush_condition:
+            while self._front is not None or self._flushing:
+                self._flush_condition.wait()
+            self._raise_flush_error()
+
+    def _raise_flush_error(self):
+        # Re-raise an exception of the flush thread in the drawing thread
+        error = self._flush_error
+        if error is not None:
+            self._flush_error = None
+            raise error
+
+    def _flush_loop(self):
+        condition = self._flush_condition
+        while True:
+            with condition:
+                while self._front is None and self._flush_thread is not None:
+                    condition.wait()
+                if self._front is None:
+                    return
+                data, mode = self._front
+                self._front = None
+                self._flushing = True
+            try:
+                with self._bus_lock:
+                    self.write_frame(self.pack_frame(mode, data))
+            except Exception as error:
+                self._flush_error = error
+            finally:
+                with condition:
+                    self._flushing = False
+                    condition.notify_all()
+
+    def _start_flush_thread(self):
+        self._flush_thread = Thread(target=self._flush_loop, name="piledmatrix-flush")
+        self._flush_thread.daemon = True
+        self._flush_thread.start()
+
+    def _stop_flush_thread(self):
+        # Let the flush thread transmit the last frame, then end it
+        thread = self._flush_thread
+        with self._flush_condition:
+            self._flush_thread = None
+            self._flush_condition.notify_all()
+        thread.join()
 
     def init(self):
         # Initialise all of the MAX7219 chips (see datasheet for details of registers)
-        _spi_open()
+        for chain in self.chains:
+            chain.transport.open()
         self.clear_all_blocks()
         self.send_to_all(MAX7219_SCANLIMIT_REG, MAX7219_SCAN_ALL)
         self.send_to_all(MAX7219_DECODEMODE_REG, MAX7219_DECODE_NONE)
         self.send_to_all(MAX7219_DISPLAY_TEST_REG, MAX7219_DISPLAY_TEST_NO)
         self.send_to_all(MAX7219_SHUTDOWN_REG, MAX7219_SHUTDOWN_NO)
         self.set_brightness(DEFAULT_BRIGHTNESS)
+        if self.double_buffered and self._flush_thread is None:
+            self._start_flush_thread()
 
     def release(self):
-        _spi_close()
+        if self._flush_thread is not None:
+            self._stop_flush_thread()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        for chain in self.chains:
+            chain.transport.close()
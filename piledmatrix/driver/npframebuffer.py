@@ -0,0 +1,223 @@
+"""Framebuffer backed by a NumPy array (optional, needs numpy)
+
+Use it with DisplayUnit(..., framebuffer=NumpyFramebuffer). Drawing bitmaps, moving regions and copying
+rectangles become slice operations on the whole array, which pays off on large walls; packed() packs the
+frame for the wire with numpy.packbits.
+"""
+from piledmatrix.driver.framebuffer import PIXEL_OFF, PIXEL_ON, PIXEL_INVERT
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class NumpyFramebuffer(object):
+    # Same interface as PackedFramebuffer; the pixels are a bool array 'pixels' indexed [x, y]
+
+    def __init__(self, width, height):
+        if numpy is None:
+            raise ImportError("NumpyFramebuffer needs numpy")
+        self.width = width
+        self.height = height
+        self.stride = (height + 7) // 8
+        self.pixels = numpy.zeros((width, height), dtype=bool)
+
+    def index(self, x, y):
+        # Byte offset in packed() holding the pixel at 'x'/'y'
+        return x * self.stride + (y >> 3)
+
+    def get_pixel(self, x, y):
+        return int(self.pixels[x, y])
+
+    def set_pixel(self, x, y, value):
+        self.pixels[x, y] = bool(value)
+
+    def invert_pixel(self, x, y):
+        self.pixels[x, y] = not self.pixels[x, y]
+
+    def clear(self):
+        self.fill(0)
+
+    def fill(self, value):
+        self.pixels.fill(bool(value))
+
+    def invert(self):
+        numpy.logical_not(self.pixels, out=self.pixels)
+
+    def _write(self, x, y, pixels, xor=False):
+        # Replace the pixels of the rectangle at 'x'/'y' by the bool array 'pixels' (or XOR them), clipped
+        width, height = pixels.shape
+        left, top = max(x, 0), max(y, 0)
+        right, bottom = min(x + width, self.width), min(y + height, self.height)
+        if left >= right or top >= bottom:
+            return
+        pixels = pixels[left - x:right - x, top - y:bottom - y]
+        if xor:
+            self.pixels[left:right, top:bottom] ^= pixels
+        else:
+            self.pixels[left:right, top:bottom] = pixels
+
+    def blit_column(self, x, y, bits, count=8, xor=False):
+        # Write 'count' pixels of column 'x' from row 'y' down, taken from the int 'bits' (MSB = row 'y')
+        column = numpy.array([(bits >> (count - 1 - index)) & 1 for index in range(count)], dtype=bool)
+        self._write(x, y, column.reshape(1, count), xor)
+
+    def blit_columns(self, x, y, columns, xor=False):
+        # blit_column for a run of 8 pixel high columns (a bytes-like object) starting at column 'x'
+        if not len(columns):
+            return
+        self._write(x, y, _unpack(columns, 8), xor)
+
+    def get_column(self, x, y=0, count=None):
+        # 'count' pixels (default: down to the bottom) of column 'x' from row 'y' down as an int (MSB = row 'y')
+        if count is None:
+            count = self.height - y
+        bits = 0
+        for pixel in self.pixels[x, y:y + count].tolist():
+            bits = bits << 1 | pixel
+        return bits
+
+    def blit_bitmap(self, x, y, bitmap, mode=PIXEL_ON):
+        # Draw a 2d [x][y] bitmap (or array) with its upper left corner at 'x'/'y', clipped:
+        # PIXEL_ON copies it, PIXEL_OFF copies it inverted and PIXEL_INVERT XORs it onto the framebuffer
+        # Columns of different lengths are drawn one by one, each only as far down as it goes
+        if mode not in (PIXEL_OFF, PIXEL_ON, PIXEL_INVERT):
+            return
+        if not isinstance(bitmap, numpy.ndarray) and len(set(len(column) for column in bitmap)) > 1:
+            for bitmap_x, column in enumerate(bitmap):
+                self.blit_bitmap(x + bitmap_x, y, [column], mode)
+            return
+        pixels = numpy.asarray(bitmap, dtype=bool)
+        if pixels.ndim != 2 or not pixels.size:
+            return
+        if mode == PIXEL_OFF:
+            pixels = ~pixels
+        self._write(x, y, pixels, mode == PIXEL_INVERT)
+
+    def fill_rect(self, x, y, width, height, mode=PIXEL_ON):
+        # Switch the pixels of a rectangle on (PIXEL_ON), off (PIXEL_OFF) or invert them (PIXEL_INVERT), clipped
+        x, y, width, height = self._clip(x, y, width, height)
+        region = self.pixels[x:x + width, y:y + height]
+        if mode == PIXEL_ON:
+            region.fill(True)
+        elif mode == PIXEL_OFF:
+            region.fill(False)
+        elif mode == PIXEL_INVERT:
+            numpy.logical_not(region, out=region)
+
+    def blend(self, source, target, mask):
+        # Take every pixel from 'target' where the mask (bytes in the format of packed()) is on, else from 'source';
+        # both are framebuffers of the same size
+        mask = _unpack(mask, self.stride * 8)[:, :self.height]
+        numpy.copyto(self.pixels, numpy.where(mask, target.pixels, source.pixels))
+
+    def shift_region(self, x, y, width, height, dx=0, dy=0, incoming=None):
+        # Move the content of a rectangle 'dx' pixel to the right (negative: left) and 'dy' pixel down (negative: up)
+        # Pixels moved out of the rectangle are dropped; the vacated pixels are set from 'incoming', packed columns
+        # (ints, MSB = top) from left to right: along x the |dx| columns of 'height' pixels of the vacated strip,
+        # along y the 'width' columns of |dy| pixels, and along both all 'width' columns of 'height' pixels of the
+        # rectangle, of which only the vacated pixels are used. Missing columns (or all if it is None) are off.
+        x, y, width, height = self._clip(x, y, width, height)
+        if not width or not height or not (dx or dy):
+            return
+        if dx and dy:
+            count, bits = width, height
+        elif dx:
+            count, bits = min(abs(dx), width), height
+        else:
+            count, bits = width, min(abs(dy), height)
+        pixels = numpy.zeros((count, bits), dtype=bool)
+        for index, column in enumerate((incoming or ())[:count]):
+            pixels[index] = [(column >> (bits - 1 - row)) & 1 for row in range(bits)]
+        self._shift(x, y, width, height, dx, dy, pixels)
+
+    def _shift(self, x, y, width, height, dx, dy, pixels):
+        # shift_region of a rectangle inside the framebuffer, the vacated strip set to the bool array 'pixels'
+        # (along both axes: the vacated pixels taken from 'pixels' of the size of the rectangle)
+        region = self.pixels[x:x + width, y:y + height]
+        if dx and dy:
+            moved = pixels.copy()
+            shift_x, shift_y = max(-width, min(dx, width)), max(-height, min(dy, height))
+            moved[max(shift_x, 0):width + min(shift_x, 0), max(shift_y, 0):height + min(shift_y, 0)] = \
+                region[max(-shift_x, 0):width - max(shift_x, 0), max(-shift_y, 0):height - max(shift_y, 0)]
+            region[:] = moved
+        elif dx:
+            distance = min(abs(dx), width)
+            if dx < 0:
+                region[:width - distance] = region[distance:].copy()
+                region[width - distance:] = pixels
+            else:
+                region[distance:] = region[:width - distance].copy()
+                region[:distance] = pixels
+        else:
+            distance = min(abs(dy), height)
+            if dy > 0:
+                region[:, distance:] = region[:, :height - distance].copy()
+                region[:, :distance] = pixels
+            else:
+                region[:, :height - distance] = region[:, distance:].copy()
+                region[:, height - distance:] = pixels
+
+    def _clip(self, x, y, width, height):
+        # Rectangle 'x'/'y' 'width' x 'height' cut to the framebuffer, width and height 0 if nothing is left
+        left, top = max(x, 0), max(y, 0)
+        right, bottom = min(x + width, self.width), min(y + height, self.height)
+        return left, top, max(right - left, 0), max(bottom - top, 0)
+
+    def get_columns(self, y=0):
+        # The 8 pixel high band from row 'y' down as one column byte per column (rows outside read as off)
+        band = numpy.zeros((self.width, 8), dtype=bool)
+        top, bottom = max(y, 0), min(y + 8, self.height)
+        if top < bottom:
+            band[:, top - y:bottom - y] = self.pixels[:, top:bottom]
+        return numpy.packbits(band, axis=1).tobytes()
+
+    def shift_columns(self, columns, y=0, right=False):
+        # Shift the 8 pixel high band at row 'y' by len(columns) columns to the left, the column bytes
+        # 'columns' entering at the right edge; or (right=True) to the right, entering at the left edge
+        count = min(len(columns), self.width)
+        if not count:
+            return
+        incoming = _unpack(columns, 8)
+        incoming = incoming[:count] if right else incoming[len(columns) - count:]
+        top, bottom = max(y, 0), min(y + 8, self.height)
+        if top >= bottom:
+            return
+        self._shift(0, top, self.width, bottom - top, count if right else -count, 0, incoming[:, top - y:bottom - y])
+
+    def packed(self):
+        # Column-major bytes in wire format, see PackedFramebuffer
+        pixels = self.pixels
+        if self.height & 7:
+            pixels = numpy.zeros((self.width, self.stride * 8), dtype=bool)
+            pixels[:, :self.height] = self.pixels
+        return numpy.packbits(pixels, axis=1).tobytes()
+
+    def load(self, data):
+        # Replace the whole content with bytes previously returned by packed()
+        self.pixels[:] = _unpack(data, self.stride * 8)[:, :self.height]
+
+    def window(self, x, y, width, height):
+        # The rectangle at 'x'/'y' (inside the framebuffer) in the format of packed() of a 'width' x 'height'
+        # framebuffer
+        pixels = numpy.zeros((width, (height + 7) // 8 * 8), dtype=bool)
+        pixels[:, :height] = self.pixels[x:x + width, y:y + height]
+        return numpy.packbits(pixels, axis=1).tobytes()
+
+    def to_list(self):
+        # Unpack into a 2d list [x][y] of 0/1, the format of the original list buffer
+        return self.pixels.astype(numpy.uint8).tolist()
+
+    def __len__(self):
+        return self.width
+
+    def __getitem__(self, x):
+        # buffer[x][y] compatibility with the former list of lists: a writable view of column 'x'
+        return self.pixels[x]
+
+
+def _unpack(data, height):
+    # bool array [x, y] of column bytes, 'height' // 8 bytes per column
+    data = numpy.frombuffer(bytes(data), dtype=numpy.uint8).reshape(-1, height // 8)
+    return numpy.unpackbits(data, axis=1).astype(bool)
@@ -0,0 +1,131 @@
+"""Software stand-ins for the SPI bus and the MAX7219 chips"""
+from piledmatrix.driver.transport import Transport
+
+# Modeled SPI clock, the spidev default for the Raspberry Pi
+DEFAULT_SPEED_HZ = 500000
+
+
+class RecordingTransport(Transport):
+    # Records every transaction (the bytes sent between CS falling and rising) and counts the traffic,
+    # forwarding everything to 'transport' if given.
+    # Modeled bus time: 8 clocks per byte at max_speed_hz, plus transaction_overhead seconds per CS cycle
+    # and call_overhead seconds per call into the kernel.
+
+    def __init__(self, transport=None, max_speed_hz=DEFAULT_SPEED_HZ, transaction_overhead=0.0,
+                 call_overhead=0.0, keep_transactions=True):
+        self.transport = transport
+        self.max_speed_hz = max_speed_hz
+        self.transaction_overhead = transaction_overhead
+        self.call_overhead = call_overhead
+        self.keep_transactions = keep_transactions
+        self.reset()
+
+    def reset(self):
+        self.transactions = []
+        self.bytes_sent = 0
+        self.transaction_count = 0
+        self.call_count = 0
+
+    @property
+    def bus_time(self):
+        return (self.bytes_sent * 8.0 / self.max_speed_hz + self.transaction_count * self.transaction_overhead
+                + self.call_count * self.call_overhead)
+
+    def bind(self, blocks):
+        if self.transport is not None:
+            self.transport.bind(blocks)
+
+    def open(self):
+        if self.transport is not None:
+            self.transport.open()
+
+    def close(self):
+        if self.transport is not None:
+            self.transport.close()
+
+    def _record(self, data):
+        data = bytes(bytearray(data))
+        self.bytes_sent += len(data)
+        self.transaction_count += 1
+        if self.keep_transactions:
+            self.transactions.append(data)
+        self.transaction(data)
+
+    def transaction(self, data):
+        # Called with the bytes of every transaction
+        pass
+
+    def send_bytes(self, data):
+        self.call_count += 1
+        self._record(data)
+        if self.transport is not None:
+            self.transport.send_bytes(data)
+
+    def send_segments(self, frame, segments):
+        self.call_count += 1
+        for offset, length in segments:
+            self._record(frame[offset:offset + length])
+        if self.transport is not None:
+            self.transport.send_segments(frame, segments)
+
+
+class SimulatedChip(object):
+    # Register state of one MAX7219
+
+    def __init__(self):
+        self.digits = bytearray(8)
+        self.decode_mode = 0
+        self.intensity = 0
+        self.scan_limit = 0
+        self.shutdown = 0
+        self.display_test = 0
+        self.writes = 0
+
+    def write(self, register, data):
+        if register == 0x0:
+            return
+        self.writes += 1
+        if 0x1 <= register <= 0x8:
+            self.digits[register - 1] = data
+        elif register == 0x9:
+            self.decode_mode = data
+        elif register == 0xA:
+            self.intensity = data & 0xF
+        elif register == 0xB:
+            self.scan_limit = data & 0x7
+        elif register == 0xC:
+            self.shutdown = data & 0x1
+        elif register == 0xF:
+            self.display_test = data & 0x1
+
+
+class SimulatedTransport(RecordingTransport):
+    # A cascade of MAX7219 chips in software, chip 0 being the one next to the Raspberry Pi.
+    # Every 16 bit word shifts through the chips like on the real cascade, including words left over
+    # in the shift registers by shorter transactions, and all chips latch their word when CS rises.
+
+    def __init__(self, blocks=None, **kwargs):
+        RecordingTransport.__init__(self, **kwargs)
+        self.chips = []
+        self._shift = []
+        if blocks is not None:
+            self.bind(blocks)
+
+    def bind(self, blocks):
+        if len(self.chips) != blocks:
+            self.chips = [SimulatedChip() for _block in range(blocks)]
+            self._shift = [(0x0, 0x0)] * blocks
+
+    def transaction(self, data):
+        if len(data) % 2:
+            raise ValueError("odd number of bytes in a MAX7219 transaction")
+        words = [(data[index], data[index + 1]) for index in range(0, len(data), 2)]
+        # The last word sent ends up in chip 0, everything else is pushed further down the cascade
+        words.reverse()
+        self._shift = (words + self._shift)[:len(self.chips)]
+        for chip, (register, value) in zip(self.chips, self._shift):
+            chip.write(register, value)
+
+    def digits(self, block):
+        # The eight digit register values of the chip at position 'block'
+        return bytes(self.chips[block].digits)
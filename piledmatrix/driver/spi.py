@@ -0,0 +1,68 @@
+"""Batched SPI writes through the spidev ioctl interface"""
+import ctypes
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+_SPI_IOC_MAGIC = ord("k")
+_IOC_WRITE = 1
+_IOC_SIZEBITS = 14
+
+
+class SpiIocTransfer(ctypes.Structure):
+    # struct spi_ioc_transfer from linux/spi/spidev.h
+    _fields_ = [
+        ("tx_buf", ctypes.c_uint64),
+        ("rx_buf", ctypes.c_uint64),
+        ("len", ctypes.c_uint32),
+        ("speed_hz", ctypes.c_uint32),
+        ("delay_usecs", ctypes.c_uint16),
+        ("bits_per_word", ctypes.c_uint8),
+        ("cs_change", ctypes.c_uint8),
+        ("tx_nbits", ctypes.c_uint8),
+        ("rx_nbits", ctypes.c_uint8),
+        ("word_delay_usecs", ctypes.c_uint8),
+        ("pad", ctypes.c_uint8),
+    ]
+
+
+def spi_ioc_message(count):
+    # SPI_IOC_MESSAGE(count) request number
+    size = count * ctypes.sizeof(SpiIocTransfer)
+    if size >= 1 << _IOC_SIZEBITS:
+        size = 0
+    return (_IOC_WRITE << 30) | (size << 16) | (_SPI_IOC_MAGIC << 8)
+
+
+class SegmentWriter(object):
+    # Writes segments of one preallocated frame in a single SPI_IOC_MESSAGE ioctl.
+    # Chip select is raised between the segments (cs_change) so each of them latches separately,
+    # and no receive buffer is passed, so nothing is read back.
+
+    def __init__(self, frame, max_segments):
+        if fcntl is None:
+            raise OSError("ioctl is not available on this platform")
+        self.frame = frame
+        # Keeps the bytearray exported (and thus its address fixed) while the writer exists
+        self._view = (ctypes.c_char * len(frame)).from_buffer(frame)
+        self._address = ctypes.addressof(self._view)
+        self._transfers = (SpiIocTransfer * max_segments)()
+
+    def write(self, fd, segments, speed_hz=0):
+        # segments: list of (offset, length) inside the frame
+        transfers = self._transfers
+        count = len(segments)
+        if count > len(transfers):
+            raise ValueError("too many segments")
+        for index, (offset, length) in enumerate(segments):
+            transfer = transfers[index]
+            transfer.tx_buf = self._address + offset
+            transfer.len = length
+            transfer.speed_hz = speed_hz
+            transfer.cs_change = 1 if index < count - 1 else 0
+        if count:
+            request = (SpiIocTransfer * count).from_buffer(transfers)
+            fcntl.ioctl(fd, spi_ioc_message(count), request)
+
@@ -0,0 +1,78 @@
+"""Transports carrying register writes to a cascade of MAX7219 chips"""
+from piledmatrix.driver.spi import SegmentWriter
+
+
+class Transport(object):
+    # How a Chain reaches its cascade. Subclasses implement send_bytes and usually open/close;
+    # send_segments may be overridden to batch several transactions in one call.
+
+    def bind(self, blocks):
+        # Called once with the number of chips in the cascade
+        pass
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send_bytes(self, data):
+        # Send sequence of bytes (should be [register,data] tuples) in one transaction, then raise CS
+        raise NotImplementedError
+
+    def send_segments(self, frame, segments):
+        # Send several [register,data] sequences, given as (offset, length) in 'frame', raising CS after each one
+        for offset, length in segments:
+            self.send_bytes(frame[offset:offset + length])
+
+
+class SpiTransport(Transport):
+    # One SPI device, /dev/spidev<bus>.<device>, opened with its own spidev handle
+    # max_speed_hz, mode: spidev settings, None keeps the driver defaults
+
+    def __init__(self, bus=0, device=0, max_speed_hz=None, mode=None):
+        self.bus = bus
+        self.device = device
+        self.max_speed_hz = max_speed_hz
+        self.mode = mode
+        self._spi = None
+        self._writer = None
+
+    def open(self):
+        # spidev is only imported here, so the rest of the library works on machines without it
+        from spidev import SpiDev
+        self._spi = SpiDev()
+        self._spi.open(self.bus, self.device)
+        if self.max_speed_hz is not None:
+            self._spi.max_speed_hz = self.max_speed_hz
+        if self.mode is not None:
+            self._spi.mode = self.mode
+
+    def close(self):
+        if self._spi is not None:
+            self._spi.close()
+            self._spi = None
+
+    def send_bytes(self, data):
+        self._spi.xfer2(list(data))
+
+    def send_segments(self, frame, segments):
+        # All segments go out in a single SPI_IOC_MESSAGE ioctl without reading anything back,
+        # falling back to one write per segment where that is not possible
+        if self._writer is None or self._writer.frame is not frame:
+            try:
+                self._writer = SegmentWriter(frame, 8)
+            except OSError:
+                self._writer = None
+        if self._writer is not None and len(segments) <= 8:
+            try:
+                self._writer.write(self._spi.fileno(), segments, self.max_speed_hz or 0)
+                return
+            except (OSError, IOError, AttributeError):
+                pass
+        for offset, length in segments:
+            segment = frame[offset:offset + length]
+            if hasattr(self._spi, "writebytes2"):
+                self._spi.writebytes2(segment)
+            else:
+                self._spi.xfer2(list(segment))
@@ -1,6 +1,58 @@
-from cp437 import CP437_FONT
-from lcd import LCD_FONT
-from sinclairs import SINCLAIRS_FONT
-from tiny import TINY_FONT
+"""Bitmap fonts, loaded on first use
 
-DEFAULT_FONT =  CP437_FONT
\ No newline at end of file
+The built-in fonts are available as CP437_FONT, LCD_FONT, SINCLAIRS_FONT and TINY_FONT (and DEFAULT_FONT),
+but their modules are only imported when one of them is first accessed.
+"""
+from importlib import import_module
+from piledmatrix.font.binary import Font, as_font
+
+# font name: (module, attribute) of the built-in fonts
+_BUILTIN = {
+    "cp437": ("piledmatrix.font.cp437", "CP437_FONT"),
+    "lcd": ("piledmatrix.font.lcd", "LCD_FONT"),
+    "sinclairs": ("piledmatrix.font.sinclairs", "SINCLAIRS_FONT"),
+    "tiny": ("piledmatrix.font.tiny", "TINY_FONT"),
+}
+DEFAULT_FONT_NAME = "cp437"
+
+# font name: Font, or a callable returning the Font when first used
+_registry = {}
+
+
+def register_font(name, font):
+    # Make 'font' available as get_font(name); 'font' may be a Font, a font in the list format,
+    # or a callable (e.g. a lambda loading a file) returning one on first use
+    _registry[name] = font
+
+
+def get_font(name=DEFAULT_FONT_NAME):
+    font = _registry.get(name)
+    if font is None:
+        if name not in _BUILTIN:
+            raise KeyError("unknown font: {0}".format(name))
+        module, attribute = _BUILTIN[name]
+        font = getattr(import_module(module), attribute)
+    elif not isinstance(font, Font) and callable(font):
+        font = font()
+    font = _registry[name] = as_font(font, name)
+    return font
+
+
+def load_font_file(path, name=None):
+    # Load a PSF or BDF font file, see piledmatrix.font.loader
+    from piledmatrix.font.loader import load_font_file
+    return load_font_file(path, name)
+
+
+def font_names():
+    return sorted(set(_BUILTIN) | set(_registry))
+
+
+def __getattr__(attribute):
+    # Lazy CP437_FONT, LCD_FONT, ... and DEFAULT_FONT
+    if attribute == "DEFAULT_FONT":
+        return get_font(DEFAULT_FONT_NAME)
+    for name, (_module, builtin_attribute) in _BUILTIN.items():
+        if attribute == builtin_attribute:
+            return get_font(name)
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, attribute))
@@ -0,0 +1,58 @@
+"""Compact binary representation of the 8x8 bitmap fonts"""
+
+GLYPH_COUNT = 256
+GLYPH_SIZE = 8
+
+
+class Font(object):
+    # 256 glyphs of 8 column bytes each (top pixel in the MSB), all in one 2 KB bytes object
+    # font[char_code][column] reads like the former nested lists
+
+    __slots__ = ("name", "data")
+
+    def __init__(self, name, data):
+        data = bytes(data)
+        if len(data) != GLYPH_COUNT * GLYPH_SIZE:
+            raise ValueError("font data must be {0} bytes, got {1}".format(GLYPH_COUNT * GLYPH_SIZE, len(data)))
+        self.name = name
+        self.data = data
+
+    @classmethod
+    def from_columns(cls, name, glyphs):
+        # Build a font from up to 256 sequences of up to 8 column values; missing glyphs and columns stay blank
+        data = bytearray(GLYPH_COUNT * GLYPH_SIZE)
+        for code, columns in enumerate(glyphs):
+            if code >= GLYPH_COUNT:
+                break
+            columns = bytearray(columns[:GLYPH_SIZE])
+            data[code * GLYPH_SIZE:code * GLYPH_SIZE + len(columns)] = columns
+        return cls(name, data)
+
+    def __len__(self):
+        return GLYPH_COUNT
+
+    def __getitem__(self, char_code):
+        if not 0 <= char_code < GLYPH_COUNT:
+            raise IndexError("character code out of range")
+        return self.data[char_code * GLYPH_SIZE:(char_code + 1) * GLYPH_SIZE]
+
+    def __iter__(self):
+        for char_code in range(GLYPH_COUNT):
+            yield self.data[char_code * GLYPH_SIZE:(char_code + 1) * GLYPH_SIZE]
+
+    def __repr__(self):
+        return "Font({0!r})".format(self.name)
+
+
+# id(list font): (list font, Font) of the converted fonts in the former list format
+_converted = {}
+
+
+def as_font(font, name=None):
+    # Return 'font' as a Font, converting a font in the former nested list format (once per list)
+    if isinstance(font, Font):
+        return font
+    entry = _converted.get(id(font))
+    if entry is None:
+        entry = _converted[id(font)] = (font, Font.from_columns(name, font))
+    return entry[1]
@@ -0,0 +1,116 @@
+"""Loading external PSF and BDF font files into the binary Font format
+
+Glyphs are placed at the top left of the 8x8 cell and cut to 8x8 pixels; only the first 256 glyphs
+(character codes 0x00 - 0xFF) are used.
+"""
+import os
+import struct
+from piledmatrix.font.binary import Font, GLYPH_COUNT
+
+_PSF1_MAGIC = b"\x36\x04"
+_PSF1_MODE512 = 0x01
+_PSF2_MAGIC = b"\x72\xb5\x4a\x86"
+
+
+def _columns(rows, width):
+    # Column bytes (top pixel in the MSB) of a glyph given as rows of ints whose MSB of a 'width' bit
+    # row is the leftmost pixel
+    columns = bytearray(8)
+    for y, row in enumerate(rows[:8]):
+        for x in range(min(width, 8)):
+            if row >> (width - 1 - x) & 1:
+                columns[x] |= 0x80 >> y
+    return columns
+
+
+def _rows(data, offset, height, row_bytes):
+    rows = []
+    for y in range(height):
+        start = offset + y * row_bytes
+        rows.append(int.from_bytes(data[start:start + row_bytes], "big"))
+    return rows
+
+
+def parse_psf(data, name=None):
+    # Font from the bytes of a PC Screen Font file, version 1 or 2
+    if data[:2] == _PSF1_MAGIC:
+        mode, height = struct.unpack_from("<BB", data, 2)
+        count = 512 if mode & _PSF1_MODE512 else 256
+        header_size, width, row_bytes = 4, 8, 1
+    elif data[:4] == _PSF2_MAGIC:
+        _version, header_size, _flags, count, _size, height, width = struct.unpack_from("<7I", data, 4)
+        row_bytes = (width + 7) // 8
+    else:
+        raise ValueError("not a PSF font")
+    glyph_size = height * row_bytes
+    glyphs = []
+    for code in range(min(count, GLYPH_COUNT)):
+        offset = header_size + code * glyph_size
+        if offset + glyph_size > len(data):
+            raise ValueError("truncated PSF font")
+        glyphs.append(_columns(_rows(data, offset, height, row_bytes), row_bytes * 8))
+    return Font.from_columns(name, glyphs)
+
+
+def parse_bdf(text, name=None):
+    # Font from the text of a Glyph Bitmap Distribution Format file
+    # Glyphs are positioned on the font bounding box, so their baselines line up
+    glyphs = [bytearray(8) for _code in range(GLYPH_COUNT)]
+    font_box = None
+    lines = iter(text.splitlines())
+    for line in lines:
+        fields = line.split()
+        if not fields:
+            continue
+        if fields[0] == "FONTBOUNDINGBOX":
+            font_box = [int(value) for value in fields[1:5]]
+        elif fields[0] == "STARTCHAR":
+            code, box, rows = None, None, []
+            for line in lines:
+                fields = line.split()
+                if not fields:
+                    continue
+                if fields[0] == "ENCODING":
+                    code = int(fields[1])
+                elif fields[0] == "BBX":
+                    box = [int(value) for value in fields[1:5]]
+                elif fields[0] == "BITMAP":
+                    for line in lines:
+                        if line.strip() == "ENDCHAR":
+                            break
+                        rows.append(line.strip())
+                    break
+            if code is None or not 0 <= code < GLYPH_COUNT or box is None:
+                continue
+            if font_box is None:
+                raise ValueError("BDF glyph before FONTBOUNDINGBOX")
+            width, height, x_offset, y_offset = box
+            row_bits = len(rows[0]) * 4 if rows else 8
+            left = x_offset - font_box[2]
+            top = (font_box[1] + font_box[3]) - (y_offset + height)
+            columns = glyphs[code]
+            for y, row in enumerate(rows):
+                row = int(row, 16)
+                for x in range(width):
+                    cell_x, cell_y = left + x, top + y
+                    if 0 <= cell_x < 8 and 0 <= cell_y < 8 and row >> (row_bits - 1 - x) & 1:
+                        columns[cell_x] |= 0x80 >> cell_y
+    return Font.from_columns(name, glyphs)
+
+
+def load_font_file(path, name=None):
+    # Load a .psf (optionally gzip compressed) or .bdf file; 'name' defaults to the file name
+    if name is None:
+        name = os.path.basename(path).split(".")[0]
+    if path.endswith(".gz"):
+        import gzip
+        with gzip.open(path, "rb") as font_file:
+            data = font_file.read()
+    else:
+        with open(path, "rb") as font_file:
+            data = font_file.read()
+    if data[:2] == _PSF1_MAGIC or data[:4] == _PSF2_MAGIC:
+        return parse_psf(data, name)
+    if data.lstrip().startswith(b"STARTFONT"):
+        return parse_bdf(data.decode("latin-1"), name)
+    raise ValueError("unknown font format: {0}".format(path))
@@ -0,0 +1,49 @@
+"""Glyph metrics for drawing fonts with proportional widths"""
+
+
+class FontMetrics(object):
+    # Per-glyph metrics derived once from the font bitmaps:
+    # bearings[code]: first lit column of the glyph (0 for blank glyphs)
+    # widths[code]: columns from the first to the last lit one; blank glyphs (space) get 'blank_width',
+    # by default half of the widest glyph
+
+    def __init__(self, font, blank_width=None):
+        self.bearings = []
+        self.widths = []
+        blank_codes = []
+        for code, columns in enumerate(font):
+            lit = [index for index, column in enumerate(columns) if column]
+            if lit:
+                self.bearings.append(lit[0])
+                self.widths.append(lit[-1] - lit[0] + 1)
+            else:
+                self.bearings.append(0)
+                self.widths.append(0)
+                blank_codes.append(code)
+        if blank_width is None:
+            blank_width = max(1, max(self.widths) // 2)
+        for code in blank_codes:
+            self.widths[code] = blank_width
+
+    def advance(self, char_code, spacing=1):
+        # Columns from the start of this character to the start of the next one
+        return self.widths[char_code] + spacing
+
+    def measure(self, text, spacing=1):
+        # Width of 'text' in pixels, without spacing after the last character
+        if not text:
+            return 0
+        widths = self.widths
+        return sum([widths[ord(char)] for char in text]) + spacing * (len(text) - 1)
+
+
+# id(font): FontMetrics, keeping the font alive so its id stays unique
+_metrics = {}
+
+
+def font_metrics(font):
+    # Return the FontMetrics of 'font', computing them on first use
+    entry = _metrics.get(id(font))
+    if entry is None:
+        entry = _metrics[id(font)] = (font, FontMetrics(font))
+    return entry[1]
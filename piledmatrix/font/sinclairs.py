@@ -6,261 +6,263 @@
 # Note: Only contains characters 0x20 - 0x7E inclusive
 #       All others will appear as blanks
 
-SINCLAIRS_FONT = [
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x00
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x01
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x02
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x03
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x04
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x05
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x06
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x07
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x08
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x09
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x0A
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x0B
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x0C
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x0D
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x0E
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x0F
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x10
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x11
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x12
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x13
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x14
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x15
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x16
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x17
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x18
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x19
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x1A
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x1B
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x1C
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x1D
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x1E
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x1F
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # ' '
-  [ 0x00, 0x00, 0x00, 0x00, 0x5F, 0x00, 0x00, 0x00 ], # '!'
-  [ 0x00, 0x00, 0x00, 0x03, 0x00, 0x03, 0x00, 0x00 ], # '"'
-  [ 0x00, 0x24, 0x7E, 0x24, 0x24, 0x7E, 0x24, 0x00 ], # '#'
-  [ 0x00, 0x2E, 0x2A, 0x7F, 0x2A, 0x3A, 0x00, 0x00 ], # '$'
-  [ 0x00, 0x46, 0x26, 0x10, 0x08, 0x64, 0x62, 0x00 ], # '%'
-  [ 0x00, 0x20, 0x54, 0x4A, 0x54, 0x20, 0x50, 0x00 ], # '&'
-  [ 0x00, 0x00, 0x00, 0x04, 0x02, 0x00, 0x00, 0x00 ], # '''
-  [ 0x00, 0x00, 0x00, 0x3C, 0x42, 0x00, 0x00, 0x00 ], # '('
-  [ 0x00, 0x00, 0x00, 0x42, 0x3C, 0x00, 0x00, 0x00 ], # ')'
-  [ 0x00, 0x10, 0x54, 0x38, 0x54, 0x10, 0x00, 0x00 ], # '*'
-  [ 0x00, 0x10, 0x10, 0x7C, 0x10, 0x10, 0x00, 0x00 ], # '+'
-  [ 0x00, 0x00, 0x00, 0x80, 0x60, 0x00, 0x00, 0x00 ], # '
-  [ 0x00, 0x10, 0x10, 0x10, 0x10, 0x10, 0x00, 0x00 ], # '-'
-  [ 0x00, 0x00, 0x00, 0x60, 0x60, 0x00, 0x00, 0x00 ], # '.'
-  [ 0x00, 0x40, 0x20, 0x10, 0x08, 0x04, 0x00, 0x00 ], # '/'
-  [ 0x3C, 0x62, 0x52, 0x4A, 0x46, 0x3C, 0x00, 0x00 ], # '0'
-  [ 0x44, 0x42, 0x7E, 0x40, 0x40, 0x00, 0x00, 0x00 ], # '1'
-  [ 0x64, 0x52, 0x52, 0x52, 0x52, 0x4C, 0x00, 0x00 ], # '2'
-  [ 0x24, 0x42, 0x42, 0x4A, 0x4A, 0x34, 0x00, 0x00 ], # '3'
-  [ 0x30, 0x28, 0x24, 0x7E, 0x20, 0x20, 0x00, 0x00 ], # '4'
-  [ 0x2E, 0x4A, 0x4A, 0x4A, 0x4A, 0x32, 0x00, 0x00 ], # '5'
-  [ 0x3C, 0x4A, 0x4A, 0x4A, 0x4A, 0x30, 0x00, 0x00 ], # '6'
-  [ 0x02, 0x02, 0x62, 0x12, 0x0A, 0x06, 0x00, 0x00 ], # '7'
-  [ 0x34, 0x4A, 0x4A, 0x4A, 0x4A, 0x34, 0x00, 0x00 ], # '8'
-  [ 0x0C, 0x52, 0x52, 0x52, 0x52, 0x3C, 0x00, 0x00 ], # '9'
-  [ 0x00, 0x00, 0x00, 0x48, 0x00, 0x00, 0x00, 0x00 ], # ':'
-  [ 0x00, 0x00, 0x80, 0x64, 0x00, 0x00, 0x00, 0x00 ], # ';'
-  [ 0x00, 0x00, 0x10, 0x28, 0x44, 0x00, 0x00, 0x00 ], # '<'
-  [ 0x00, 0x28, 0x28, 0x28, 0x28, 0x28, 0x00, 0x00 ], # '='
-  [ 0x00, 0x00, 0x44, 0x28, 0x10, 0x00, 0x00, 0x00 ], # '>'
-  [ 0x00, 0x04, 0x02, 0x02, 0x52, 0x0A, 0x04, 0x00 ], # '?'
-  [ 0x00, 0x3C, 0x42, 0x5A, 0x56, 0x5A, 0x1C, 0x00 ], # '@'
-  [ 0x7C, 0x12, 0x12, 0x12, 0x12, 0x7C, 0x00, 0x00 ], # 'A'
-  [ 0x7E, 0x4A, 0x4A, 0x4A, 0x4A, 0x34, 0x00, 0x00 ], # 'B'
-  [ 0x3C, 0x42, 0x42, 0x42, 0x42, 0x24, 0x00, 0x00 ], # 'C'
-  [ 0x7E, 0x42, 0x42, 0x42, 0x24, 0x18, 0x00, 0x00 ], # 'D'
-  [ 0x7E, 0x4A, 0x4A, 0x4A, 0x4A, 0x42, 0x00, 0x00 ], # 'E'
-  [ 0x7E, 0x0A, 0x0A, 0x0A, 0x0A, 0x02, 0x00, 0x00 ], # 'F'
-  [ 0x3C, 0x42, 0x42, 0x52, 0x52, 0x34, 0x00, 0x00 ], # 'G'
-  [ 0x7E, 0x08, 0x08, 0x08, 0x08, 0x7E, 0x00, 0x00 ], # 'H'
-  [ 0x00, 0x42, 0x42, 0x7E, 0x42, 0x42, 0x00, 0x00 ], # 'I'
-  [ 0x30, 0x40, 0x40, 0x40, 0x40, 0x3E, 0x00, 0x00 ], # 'J'
-  [ 0x7E, 0x08, 0x08, 0x14, 0x22, 0x40, 0x00, 0x00 ], # 'K'
-  [ 0x7E, 0x40, 0x40, 0x40, 0x40, 0x40, 0x00, 0x00 ], # 'L'
-  [ 0x7E, 0x04, 0x08, 0x08, 0x04, 0x7E, 0x00, 0x00 ], # 'M'
-  [ 0x7E, 0x04, 0x08, 0x10, 0x20, 0x7E, 0x00, 0x00 ], # 'N'
-  [ 0x3C, 0x42, 0x42, 0x42, 0x42, 0x3C, 0x00, 0x00 ], # 'O'
-  [ 0x7E, 0x12, 0x12, 0x12, 0x12, 0x0C, 0x00, 0x00 ], # 'P'
-  [ 0x3C, 0x42, 0x52, 0x62, 0x42, 0x3C, 0x00, 0x00 ], # 'Q'
-  [ 0x7E, 0x12, 0x12, 0x12, 0x32, 0x4C, 0x00, 0x00 ], # 'R'
-  [ 0x24, 0x4A, 0x4A, 0x4A, 0x4A, 0x30, 0x00, 0x00 ], # 'S'
-  [ 0x02, 0x02, 0x02, 0x7E, 0x02, 0x02, 0x02, 0x00 ], # 'T'
-  [ 0x3E, 0x40, 0x40, 0x40, 0x40, 0x3E, 0x00, 0x00 ], # 'U'
-  [ 0x1E, 0x20, 0x40, 0x40, 0x20, 0x1E, 0x00, 0x00 ], # 'V'
-  [ 0x3E, 0x40, 0x20, 0x20, 0x40, 0x3E, 0x00, 0x00 ], # 'W'
-  [ 0x42, 0x24, 0x18, 0x18, 0x24, 0x42, 0x00, 0x00 ], # 'X'
-  [ 0x02, 0x04, 0x08, 0x70, 0x08, 0x04, 0x02, 0x00 ], # 'Y'
-  [ 0x42, 0x62, 0x52, 0x4A, 0x46, 0x42, 0x00, 0x00 ], # 'Z'
-  [ 0x00, 0x00, 0x7E, 0x42, 0x42, 0x00, 0x00, 0x00 ], # '['
-  [ 0x00, 0x04, 0x08, 0x10, 0x20, 0x40, 0x00, 0x00 ], # backslash
-  [ 0x00, 0x00, 0x42, 0x42, 0x7E, 0x00, 0x00, 0x00 ], # '
-  [ 0x00, 0x08, 0x04, 0x7E, 0x04, 0x08, 0x00, 0x00 ], # '^'
-  [ 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x00 ], # '_'
-  [ 0x3C, 0x42, 0x99, 0xA5, 0xA5, 0x81, 0x42, 0x3C ], # '`'
-  [ 0x00, 0x20, 0x54, 0x54, 0x54, 0x78, 0x00, 0x00 ], # 'a'
-  [ 0x00, 0x7E, 0x48, 0x48, 0x48, 0x30, 0x00, 0x00 ], # 'b'
-  [ 0x00, 0x00, 0x38, 0x44, 0x44, 0x44, 0x00, 0x00 ], # 'c'
-  [ 0x00, 0x30, 0x48, 0x48, 0x48, 0x7E, 0x00, 0x00 ], # 'd'
-  [ 0x00, 0x38, 0x54, 0x54, 0x54, 0x48, 0x00, 0x00 ], # 'e'
-  [ 0x00, 0x00, 0x00, 0x7C, 0x0A, 0x02, 0x00, 0x00 ], # 'f'
-  [ 0x00, 0x18, 0xA4, 0xA4, 0xA4, 0xA4, 0x7C, 0x00 ], # 'g'
-  [ 0x00, 0x7E, 0x08, 0x08, 0x08, 0x70, 0x00, 0x00 ], # 'h'
-  [ 0x00, 0x00, 0x00, 0x48, 0x7A, 0x40, 0x00, 0x00 ], # 'i'
-  [ 0x00, 0x00, 0x40, 0x80, 0x80, 0x7A, 0x00, 0x00 ], # 'j'
-  [ 0x00, 0x7E, 0x18, 0x24, 0x40, 0x00, 0x00, 0x00 ], # 'k'
-  [ 0x00, 0x00, 0x00, 0x3E, 0x40, 0x40, 0x00, 0x00 ], # 'l'
-  [ 0x00, 0x7C, 0x04, 0x78, 0x04, 0x78, 0x00, 0x00 ], # 'm'
-  [ 0x00, 0x7C, 0x04, 0x04, 0x04, 0x78, 0x00, 0x00 ], # 'n'
-  [ 0x00, 0x38, 0x44, 0x44, 0x44, 0x38, 0x00, 0x00 ], # 'o'
-  [ 0x00, 0xFC, 0x24, 0x24, 0x24, 0x18, 0x00, 0x00 ], # 'p'
-  [ 0x00, 0x18, 0x24, 0x24, 0x24, 0xFC, 0x80, 0x00 ], # 'q'
-  [ 0x00, 0x00, 0x78, 0x04, 0x04, 0x04, 0x00, 0x00 ], # 'r'
-  [ 0x00, 0x48, 0x54, 0x54, 0x54, 0x20, 0x00, 0x00 ], # 's'
-  [ 0x00, 0x00, 0x04, 0x3E, 0x44, 0x40, 0x00, 0x00 ], # 't'
-  [ 0x00, 0x3C, 0x40, 0x40, 0x40, 0x3C, 0x00, 0x00 ], # 'u'
-  [ 0x00, 0x0C, 0x30, 0x40, 0x30, 0x0C, 0x00, 0x00 ], # 'v'
-  [ 0x00, 0x3C, 0x40, 0x38, 0x40, 0x3C, 0x00, 0x00 ], # 'w'
-  [ 0x00, 0x44, 0x28, 0x10, 0x28, 0x44, 0x00, 0x00 ], # 'x'
-  [ 0x00, 0x1C, 0xA0, 0xA0, 0xA0, 0x7C, 0x00, 0x00 ], # 'y'
-  [ 0x00, 0x44, 0x64, 0x54, 0x4C, 0x44, 0x00, 0x00 ], # 'z'
-  [ 0x00, 0x08, 0x08, 0x76, 0x42, 0x42, 0x00, 0x00 ], # '{'
-  [ 0x00, 0x00, 0x00, 0x7E, 0x00, 0x00, 0x00, 0x00 ], # '|'
-  [ 0x00, 0x42, 0x42, 0x76, 0x08, 0x08, 0x00, 0x00 ], # '}'
-  [ 0x00, 0x00, 0x04, 0x02, 0x04, 0x02, 0x00, 0x00 ], # '~'
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x7F
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x80
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x81
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x82
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x83
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x84
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x85
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x86
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x87
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x88
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x89
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x8A
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x8B
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x8C
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x8D
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x8E
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x8F
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x90
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x91
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x92
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x93
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x94
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x95
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x96
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x97
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x98
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x99
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x9A
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x9B
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x9C
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x9D
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x9E
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x9F
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA0
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA1
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA2
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA3
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA4
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA5
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA6
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA7
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA8
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA9
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xAA
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xAB
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xAC
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xAD
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xAE
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xAF
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB0
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB1
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB2
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB3
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB4
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB5
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB6
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB7
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB8
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB9
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xBA
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xBB
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xBC
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xBD
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xBE
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xBF
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC0
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC1
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC2
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC3
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC4
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC5
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC6
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC7
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC8
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC9
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xCA
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xCB
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xCC
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xCD
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xCE
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xCF
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD0
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD1
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD2
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD3
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD4
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD5
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD6
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD7
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD8
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD9
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xDA
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xDB
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xDC
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xDD
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xDE
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xDF
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE0
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE1
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE2
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE3
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE4
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE5
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE6
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE7
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE8
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE9
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xEA
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xEB
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xEC
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xED
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xEE
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xEF
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF0
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF1
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF2
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF3
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF4
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF5
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF6
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF7
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF8
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF9
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xFA
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xFB
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xFC
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xFD
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xFE
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xFF
-];  #  end of SINCLAIRS_FONT
\ No newline at end of file
+from piledmatrix.font.binary import Font
+
+SINCLAIRS_FONT = Font("sinclairs", (
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x00
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x01
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x02
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x03
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x04
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x05
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x06
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x07
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x08
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x09
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x0A
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x0B
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x0C
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x0D
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x0E
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x0F
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x10
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x11
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x12
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x13
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x14
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x15
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x16
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x17
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x18
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x19
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x1A
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x1B
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x1C
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x1D
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x1E
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x1F
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # ' '
+  b"\x00\x00\x00\x00\x5F\x00\x00\x00"  # '!'
+  b"\x00\x00\x00\x03\x00\x03\x00\x00"  # '"'
+  b"\x00\x24\x7E\x24\x24\x7E\x24\x00"  # '#'
+  b"\x00\x2E\x2A\x7F\x2A\x3A\x00\x00"  # '$'
+  b"\x00\x46\x26\x10\x08\x64\x62\x00"  # '%'
+  b"\x00\x20\x54\x4A\x54\x20\x50\x00"  # '&'
+  b"\x00\x00\x00\x04\x02\x00\x00\x00"  # '''
+  b"\x00\x00\x00\x3C\x42\x00\x00\x00"  # '('
+  b"\x00\x00\x00\x42\x3C\x00\x00\x00"  # ')'
+  b"\x00\x10\x54\x38\x54\x10\x00\x00"  # '*'
+  b"\x00\x10\x10\x7C\x10\x10\x00\x00"  # '+'
+  b"\x00\x00\x00\x80\x60\x00\x00\x00"  # '
+  b"\x00\x10\x10\x10\x10\x10\x00\x00"  # '-'
+  b"\x00\x00\x00\x60\x60\x00\x00\x00"  # '.'
+  b"\x00\x40\x20\x10\x08\x04\x00\x00"  # '/'
+  b"\x3C\x62\x52\x4A\x46\x3C\x00\x00"  # '0'
+  b"\x44\x42\x7E\x40\x40\x00\x00\x00"  # '1'
+  b"\x64\x52\x52\x52\x52\x4C\x00\x00"  # '2'
+  b"\x24\x42\x42\x4A\x4A\x34\x00\x00"  # '3'
+  b"\x30\x28\x24\x7E\x20\x20\x00\x00"  # '4'
+  b"\x2E\x4A\x4A\x4A\x4A\x32\x00\x00"  # '5'
+  b"\x3C\x4A\x4A\x4A\x4A\x30\x00\x00"  # '6'
+  b"\x02\x02\x62\x12\x0A\x06\x00\x00"  # '7'
+  b"\x34\x4A\x4A\x4A\x4A\x34\x00\x00"  # '8'
+  b"\x0C\x52\x52\x52\x52\x3C\x00\x00"  # '9'
+  b"\x00\x00\x00\x48\x00\x00\x00\x00"  # ':'
+  b"\x00\x00\x80\x64\x00\x00\x00\x00"  # ';'
+  b"\x00\x00\x10\x28\x44\x00\x00\x00"  # '<'
+  b"\x00\x28\x28\x28\x28\x28\x00\x00"  # '='
+  b"\x00\x00\x44\x28\x10\x00\x00\x00"  # '>'
+  b"\x00\x04\x02\x02\x52\x0A\x04\x00"  # '?'
+  b"\x00\x3C\x42\x5A\x56\x5A\x1C\x00"  # '@'
+  b"\x7C\x12\x12\x12\x12\x7C\x00\x00"  # 'A'
+  b"\x7E\x4A\x4A\x4A\x4A\x34\x00\x00"  # 'B'
+  b"\x3C\x42\x42\x42\x42\x24\x00\x00"  # 'C'
+  b"\x7E\x42\x42\x42\x24\x18\x00\x00"  # 'D'
+  b"\x7E\x4A\x4A\x4A\x4A\x42\x00\x00"  # 'E'
+  b"\x7E\x0A\x0A\x0A\x0A\x02\x00\x00"  # 'F'
+  b"\x3C\x42\x42\x52\x52\x34\x00\x00"  # 'G'
+  b"\x7E\x08\x08\x08\x08\x7E\x00\x00"  # 'H'
+  b"\x00\x42\x42\x7E\x42\x42\x00\x00"  # 'I'
+  b"\x30\x40\x40\x40\x40\x3E\x00\x00"  # 'J'
+  b"\x7E\x08\x08\x14\x22\x40\x00\x00"  # 'K'
+  b"\x7E\x40\x40\x40\x40\x40\x00\x00"  # 'L'
+  b"\x7E\x04\x08\x08\x04\x7E\x00\x00"  # 'M'
+  b"\x7E\x04\x08\x10\x20\x7E\x00\x00"  # 'N'
+  b"\x3C\x42\x42\x42\x42\x3C\x00\x00"  # 'O'
+  b"\x7E\x12\x12\x12\x12\x0C\x00\x00"  # 'P'
+  b"\x3C\x42\x52\x62\x42\x3C\x00\x00"  # 'Q'
+  b"\x7E\x12\x12\x12\x32\x4C\x00\x00"  # 'R'
+  b"\x24\x4A\x4A\x4A\x4A\x30\x00\x00"  # 'S'
+  b"\x02\x02\x02\x7E\x02\x02\x02\x00"  # 'T'
+  b"\x3E\x40\x40\x40\x40\x3E\x00\x00"  # 'U'
+  b"\x1E\x20\x40\x40\x20\x1E\x00\x00"  # 'V'
+  b"\x3E\x40\x20\x20\x40\x3E\x00\x00"  # 'W'
+  b"\x42\x24\x18\x18\x24\x42\x00\x00"  # 'X'
+  b"\x02\x04\x08\x70\x08\x04\x02\x00"  # 'Y'
+  b"\x42\x62\x52\x4A\x46\x42\x00\x00"  # 'Z'
+  b"\x00\x00\x7E\x42\x42\x00\x00\x00"  # '['
+  b"\x00\x04\x08\x10\x20\x40\x00\x00"  # backslash
+  b"\x00\x00\x42\x42\x7E\x00\x00\x00"  # '
+  b"\x00\x08\x04\x7E\x04\x08\x00\x00"  # '^'
+  b"\x80\x80\x80\x80\x80\x80\x80\x00"  # '_'
+  b"\x3C\x42\x99\xA5\xA5\x81\x42\x3C"  # '`'
+  b"\x00\x20\x54\x54\x54\x78\x00\x00"  # 'a'
+  b"\x00\x7E\x48\x48\x48\x30\x00\x00"  # 'b'
+  b"\x00\x00\x38\x44\x44\x44\x00\x00"  # 'c'
+  b"\x00\x30\x48\x48\x48\x7E\x00\x00"  # 'd'
+  b"\x00\x38\x54\x54\x54\x48\x00\x00"  # 'e'
+  b"\x00\x00\x00\x7C\x0A\x02\x00\x00"  # 'f'
+  b"\x00\x18\xA4\xA4\xA4\xA4\x7C\x00"  # 'g'
+  b"\x00\x7E\x08\x08\x08\x70\x00\x00"  # 'h'
+  b"\x00\x00\x00\x48\x7A\x40\x00\x00"  # 'i'
+  b"\x00\x00\x40\x80\x80\x7A\x00\x00"  # 'j'
+  b"\x00\x7E\x18\x24\x40\x00\x00\x00"  # 'k'
+  b"\x00\x00\x00\x3E\x40\x40\x00\x00"  # 'l'
+  b"\x00\x7C\x04\x78\x04\x78\x00\x00"  # 'm'
+  b"\x00\x7C\x04\x04\x04\x78\x00\x00"  # 'n'
+  b"\x00\x38\x44\x44\x44\x38\x00\x00"  # 'o'
+  b"\x00\xFC\x24\x24\x24\x18\x00\x00"  # 'p'
+  b"\x00\x18\x24\x24\x24\xFC\x80\x00"  # 'q'
+  b"\x00\x00\x78\x04\x04\x04\x00\x00"  # 'r'
+  b"\x00\x48\x54\x54\x54\x20\x00\x00"  # 's'
+  b"\x00\x00\x04\x3E\x44\x40\x00\x00"  # 't'
+  b"\x00\x3C\x40\x40\x40\x3C\x00\x00"  # 'u'
+  b"\x00\x0C\x30\x40\x30\x0C\x00\x00"  # 'v'
+  b"\x00\x3C\x40\x38\x40\x3C\x00\x00"  # 'w'
+  b"\x00\x44\x28\x10\x28\x44\x00\x00"  # 'x'
+  b"\x00\x1C\xA0\xA0\xA0\x7C\x00\x00"  # 'y'
+  b"\x00\x44\x64\x54\x4C\x44\x00\x00"  # 'z'
+  b"\x00\x08\x08\x76\x42\x42\x00\x00"  # '{'
+  b"\x00\x00\x00\x7E\x00\x00\x00\x00"  # '|'
+  b"\x00\x42\x42\x76\x08\x08\x00\x00"  # '}'
+  b"\x00\x00\x04\x02\x04\x02\x00\x00"  # '~'
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x7F
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x80
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x81
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x82
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x83
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x84
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x85
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x86
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x87
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x88
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x89
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x8A
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x8B
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x8C
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x8D
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x8E
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x8F
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x90
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x91
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x92
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x93
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x94
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x95
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x96
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x97
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x98
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x99
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x9A
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x9B
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x9C
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x9D
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x9E
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x9F
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA0
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA1
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA2
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA3
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA4
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA5
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA6
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA7
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA8
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA9
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xAA
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xAB
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xAC
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xAD
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xAE
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xAF
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB0
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB1
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB2
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB3
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB4
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB5
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB6
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB7
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB8
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB9
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xBA
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xBB
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xBC
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xBD
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xBE
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xBF
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC0
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC1
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC2
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC3
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC4
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC5
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC6
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC7
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC8
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC9
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xCA
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xCB
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xCC
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xCD
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xCE
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xCF
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD0
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD1
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD2
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD3
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD4
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD5
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD6
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD7
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD8
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD9
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xDA
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xDB
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xDC
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xDD
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xDE
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xDF
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE0
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE1
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE2
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE3
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE4
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE5
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE6
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE7
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE8
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE9
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xEA
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xEB
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xEC
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xED
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xEE
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xEF
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF0
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF1
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF2
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF3
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF4
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF5
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF6
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF7
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF8
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF9
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xFA
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xFB
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xFC
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xFD
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xFE
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xFF
+))  #  end of SINCLAIRS_FONT
\ No newline at end of file
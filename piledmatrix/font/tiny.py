@@ -5,261 +5,263 @@
 # Note: Only contains characters 0x20 - 0x7E inclusive
 #       All others will appear as blanks
 
-TINY_FONT = [
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x00
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x01
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x02
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x03
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x04
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x05
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x06
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x07
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x08
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x09
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x0A
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x0B
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x0C
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x0D
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x0E
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x0F
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x10
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x11
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x12
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x13
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x14
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x15
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x16
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x17
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x18
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x19
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x1A
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x1B
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x1C
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x1D
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x1E
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x1F
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # ' '
-  [ 0x00, 0x00, 0x06, 0x5F, 0x5F, 0x06, 0x00, 0x00 ], # '!'
-  [ 0x00, 0x03, 0x07, 0x00, 0x00, 0x07, 0x03, 0x00 ], # '"'
-  [ 0x14, 0x7F, 0x7F, 0x14, 0x7F, 0x7F, 0x14, 0x00 ], # '#'
-  [ 0x00, 0x24, 0x2E, 0x6B, 0x6B, 0x3A, 0x12, 0x00 ], # '$'
-  [ 0x46, 0x66, 0x30, 0x18, 0x0C, 0x66, 0x62, 0x00 ], # '%'
-  [ 0x30, 0x7A, 0x4F, 0x5D, 0x37, 0x7A, 0x48, 0x00 ], # '&'
-  [ 0x00, 0x00, 0x04, 0x07, 0x03, 0x00, 0x00, 0x00 ], # '''
-  [ 0x00, 0x00, 0x1C, 0x3E, 0x63, 0x41, 0x00, 0x00 ], # '('
-  [ 0x00, 0x00, 0x41, 0x63, 0x3E, 0x1C, 0x00, 0x00 ], # ')'
-  [ 0x08, 0x2A, 0x3E, 0x1C, 0x1C, 0x3E, 0x2A, 0x08 ], # '*'
-  [ 0x00, 0x08, 0x08, 0x3E, 0x3E, 0x08, 0x08, 0x00 ], # '+'
-  [ 0x00, 0x00, 0x80, 0xE0, 0x60, 0x00, 0x00, 0x00 ], # '
-  [ 0x00, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x00 ], # '-'
-  [ 0x00, 0x00, 0x00, 0x60, 0x60, 0x00, 0x00, 0x00 ], # '.'
-  [ 0x60, 0x30, 0x18, 0x0C, 0x06, 0x03, 0x01, 0x00 ], # '/'
-  [ 0x3E, 0x7F, 0x51, 0x49, 0x45, 0x7F, 0x3E, 0x00 ], # '0'
-  [ 0x00, 0x40, 0x42, 0x7F, 0x7F, 0x40, 0x40, 0x00 ], # '1'
-  [ 0x42, 0x63, 0x71, 0x59, 0x49, 0x6F, 0x66, 0x00 ], # '2'
-  [ 0x22, 0x63, 0x49, 0x49, 0x49, 0x7F, 0x36, 0x00 ], # '3'
-  [ 0x18, 0x1C, 0x16, 0x53, 0x7F, 0x7F, 0x50, 0x00 ], # '4'
-  [ 0x2F, 0x6F, 0x49, 0x49, 0x49, 0x79, 0x31, 0x00 ], # '5'
-  [ 0x3C, 0x7E, 0x4B, 0x49, 0x49, 0x78, 0x30, 0x00 ], # '6'
-  [ 0x03, 0x03, 0x71, 0x79, 0x0D, 0x07, 0x03, 0x00 ], # '7'
-  [ 0x36, 0x7F, 0x49, 0x49, 0x49, 0x7F, 0x36, 0x00 ], # '8'
-  [ 0x06, 0x4F, 0x49, 0x49, 0x69, 0x3F, 0x1E, 0x00 ], # '9'
-  [ 0x00, 0x00, 0x00, 0x66, 0x66, 0x00, 0x00, 0x00 ], # ':'
-  [ 0x00, 0x00, 0x80, 0xE6, 0x66, 0x00, 0x00, 0x00 ], # ';'
-  [ 0x00, 0x00, 0x08, 0x1C, 0x36, 0x63, 0x41, 0x00 ], # '<'
-  [ 0x00, 0x24, 0x24, 0x24, 0x24, 0x24, 0x24, 0x00 ], # '='
-  [ 0x00, 0x41, 0x63, 0x36, 0x1C, 0x08, 0x00, 0x00 ], # '>'
-  [ 0x02, 0x03, 0x01, 0x59, 0x5D, 0x07, 0x02, 0x00 ], # '?'
-  [ 0x3E, 0x7F, 0x41, 0x5D, 0x5D, 0x1F, 0x1E, 0x00 ], # '@'
-  [ 0x7C, 0x7E, 0x0B, 0x09, 0x0B, 0x7E, 0x7C, 0x00 ], # 'A'
-  [ 0x41, 0x7F, 0x7F, 0x49, 0x49, 0x7F, 0x36, 0x00 ], # 'B'
-  [ 0x1C, 0x3E, 0x63, 0x41, 0x41, 0x63, 0x22, 0x00 ], # 'C'
-  [ 0x41, 0x7F, 0x7F, 0x41, 0x63, 0x3E, 0x1C, 0x00 ], # 'D'
-  [ 0x41, 0x7F, 0x7F, 0x49, 0x5D, 0x41, 0x63, 0x00 ], # 'E'
-  [ 0x41, 0x7F, 0x7F, 0x49, 0x1D, 0x01, 0x03, 0x00 ], # 'F'
-  [ 0x1C, 0x3E, 0x63, 0x41, 0x51, 0x33, 0x72, 0x00 ], # 'G'
-  [ 0x7F, 0x7F, 0x08, 0x08, 0x08, 0x7F, 0x7F, 0x00 ], # 'H'
-  [ 0x00, 0x00, 0x41, 0x7F, 0x7F, 0x41, 0x00, 0x00 ], # 'I'
-  [ 0x30, 0x70, 0x40, 0x41, 0x7F, 0x3F, 0x01, 0x00 ], # 'J'
-  [ 0x41, 0x7F, 0x7F, 0x08, 0x1C, 0x77, 0x63, 0x00 ], # 'K'
-  [ 0x41, 0x7F, 0x7F, 0x41, 0x40, 0x60, 0x70, 0x00 ], # 'L'
-  [ 0x7F, 0x7F, 0x0E, 0x1C, 0x0E, 0x7F, 0x7F, 0x00 ], # 'M'
-  [ 0x7F, 0x7F, 0x06, 0x0C, 0x18, 0x7F, 0x7F, 0x00 ], # 'N'
-  [ 0x3E, 0x7F, 0x41, 0x41, 0x41, 0x7F, 0x3E, 0x00 ], # 'O'
-  [ 0x41, 0x7F, 0x7F, 0x49, 0x09, 0x0F, 0x06, 0x00 ], # 'P'
-  [ 0x3E, 0x7F, 0x41, 0x41, 0xE1, 0xFF, 0xBE, 0x00 ], # 'Q'
-  [ 0x41, 0x7F, 0x7F, 0x09, 0x19, 0x7F, 0x66, 0x00 ], # 'R'
-  [ 0x22, 0x67, 0x4D, 0x49, 0x59, 0x73, 0x22, 0x00 ], # 'S'
-  [ 0x00, 0x07, 0x43, 0x7F, 0x7F, 0x43, 0x07, 0x00 ], # 'T'
-  [ 0x3F, 0x7F, 0x40, 0x40, 0x40, 0x7F, 0x3F, 0x00 ], # 'U'
-  [ 0x1F, 0x3F, 0x60, 0x40, 0x60, 0x3F, 0x1F, 0x00 ], # 'V'
-  [ 0x3F, 0x7F, 0x60, 0x38, 0x60, 0x7F, 0x3F, 0x00 ], # 'W'
-  [ 0x63, 0x77, 0x1C, 0x08, 0x1C, 0x77, 0x63, 0x00 ], # 'X'
-  [ 0x00, 0x07, 0x4F, 0x78, 0x78, 0x4F, 0x07, 0x00 ], # 'Y'
-  [ 0x47, 0x63, 0x71, 0x59, 0x4D, 0x67, 0x73, 0x00 ], # 'Z'
-  [ 0x00, 0x00, 0x7F, 0x7F, 0x41, 0x41, 0x00, 0x00 ], # '['
-  [ 0x01, 0x03, 0x06, 0x0C, 0x18, 0x30, 0x60, 0x00 ], # backslash
-  [ 0x00, 0x00, 0x41, 0x41, 0x7F, 0x7F, 0x00, 0x00 ], # '
-  [ 0x08, 0x0C, 0x06, 0x03, 0x06, 0x0C, 0x08, 0x00 ], # '^'
-  [ 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80 ], # '_'
-  [ 0x00, 0x00, 0x01, 0x03, 0x06, 0x04, 0x00, 0x00 ], # '`'
-  [ 0x20, 0x74, 0x54, 0x54, 0x3C, 0x78, 0x40, 0x00 ], # 'a'
-  [ 0x41, 0x7F, 0x3F, 0x44, 0x44, 0x7C, 0x38, 0x00 ], # 'b'
-  [ 0x38, 0x7C, 0x44, 0x44, 0x44, 0x6C, 0x28, 0x00 ], # 'c'
-  [ 0x38, 0x7C, 0x44, 0x45, 0x3F, 0x7F, 0x40, 0x00 ], # 'd'
-  [ 0x38, 0x7C, 0x54, 0x54, 0x54, 0x5C, 0x18, 0x00 ], # 'e'
-  [ 0x48, 0x7E, 0x7F, 0x49, 0x09, 0x03, 0x02, 0x00 ], # 'f'
-  [ 0x98, 0xBC, 0xA4, 0xA4, 0xF8, 0x7C, 0x04, 0x00 ], # 'g'
-  [ 0x41, 0x7F, 0x7F, 0x08, 0x04, 0x7C, 0x78, 0x00 ], # 'h'
-  [ 0x00, 0x00, 0x44, 0x7D, 0x7D, 0x40, 0x00, 0x00 ], # 'i'
-  [ 0x00, 0x60, 0xE0, 0x80, 0x80, 0xFD, 0x7D, 0x00 ], # 'j'
-  [ 0x41, 0x7F, 0x7F, 0x10, 0x38, 0x6C, 0x44, 0x00 ], # 'k'
-  [ 0x00, 0x00, 0x41, 0x7F, 0x7F, 0x40, 0x00, 0x00 ], # 'l'
-  [ 0x7C, 0x7C, 0x0C, 0x78, 0x0C, 0x7C, 0x78, 0x00 ], # 'm'
-  [ 0x04, 0x7C, 0x78, 0x04, 0x04, 0x7C, 0x78, 0x00 ], # 'n'
-  [ 0x38, 0x7C, 0x44, 0x44, 0x44, 0x7C, 0x38, 0x00 ], # 'o'
-  [ 0x84, 0xFC, 0xF8, 0xA4, 0x24, 0x3C, 0x18, 0x00 ], # 'p'
-  [ 0x18, 0x3C, 0x24, 0xA4, 0xF8, 0xFC, 0x84, 0x00 ], # 'q'
-  [ 0x44, 0x7C, 0x78, 0x4C, 0x04, 0x0C, 0x08, 0x00 ], # 'r'
-  [ 0x48, 0x5C, 0x54, 0x54, 0x54, 0x74, 0x24, 0x00 ], # 's'
-  [ 0x04, 0x04, 0x3F, 0x7F, 0x44, 0x64, 0x20, 0x00 ], # 't'
-  [ 0x3C, 0x7C, 0x40, 0x40, 0x3C, 0x7C, 0x40, 0x00 ], # 'u'
-  [ 0x1C, 0x3C, 0x60, 0x40, 0x60, 0x3C, 0x1C, 0x00 ], # 'v'
-  [ 0x3C, 0x7C, 0x60, 0x38, 0x60, 0x7C, 0x3C, 0x00 ], # 'w'
-  [ 0x44, 0x6C, 0x38, 0x10, 0x38, 0x6C, 0x44, 0x00 ], # 'x'
-  [ 0x9C, 0xBC, 0xA0, 0xA0, 0xA0, 0xFC, 0x7C, 0x00 ], # 'y'
-  [ 0x00, 0x4C, 0x64, 0x74, 0x5C, 0x4C, 0x64, 0x00 ], # 'z'
-  [ 0x00, 0x08, 0x08, 0x3E, 0x77, 0x41, 0x41, 0x00 ], # '{'
-  [ 0x00, 0x00, 0x00, 0x7F, 0x7F, 0x00, 0x00, 0x00 ], # '|'
-  [ 0x00, 0x41, 0x41, 0x77, 0x3E, 0x08, 0x08, 0x00 ], # '}'
-  [ 0x02, 0x03, 0x01, 0x03, 0x02, 0x03, 0x01, 0x00 ], # '~'
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x7F
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x80
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x81
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x82
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x83
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x84
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x85
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x86
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x87
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x88
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x89
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x8A
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x8B
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x8C
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x8D
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x8E
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x8F
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x90
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x91
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x92
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x93
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x94
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x95
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x96
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x97
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x98
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x99
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x9A
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x9B
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x9C
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x9D
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x9E
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0x9F
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA0
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA1
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA2
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA3
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA4
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA5
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA6
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA7
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA8
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xA9
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xAA
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xAB
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xAC
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xAD
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xAE
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xAF
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB0
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB1
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB2
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB3
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB4
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB5
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB6
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB7
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB8
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xB9
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xBA
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xBB
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xBC
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xBD
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xBE
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xBF
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC0
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC1
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC2
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC3
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC4
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC5
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC6
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC7
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC8
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xC9
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xCA
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xCB
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xCC
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xCD
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xCE
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xCF
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD0
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD1
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD2
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD3
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD4
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD5
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD6
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD7
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD8
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xD9
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xDA
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xDB
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xDC
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xDD
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xDE
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xDF
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE0
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE1
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE2
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE3
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE4
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE5
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE6
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE7
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE8
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xE9
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xEA
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xEB
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xEC
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xED
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xEE
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xEF
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF0
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF1
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF2
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF3
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF4
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF5
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF6
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF7
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF8
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xF9
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xFA
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xFB
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xFC
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xFD
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xFE
-  [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00 ], # 0xFF
-];  #  end of TINY_FONT
\ No newline at end of file
+from piledmatrix.font.binary import Font
+
+TINY_FONT = Font("tiny", (
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x00
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x01
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x02
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x03
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x04
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x05
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x06
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x07
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x08
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x09
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x0A
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x0B
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x0C
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x0D
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x0E
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x0F
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x10
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x11
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x12
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x13
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x14
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x15
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x16
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x17
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x18
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x19
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x1A
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x1B
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x1C
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x1D
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x1E
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x1F
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # ' '
+  b"\x00\x00\x06\x5F\x5F\x06\x00\x00"  # '!'
+  b"\x00\x03\x07\x00\x00\x07\x03\x00"  # '"'
+  b"\x14\x7F\x7F\x14\x7F\x7F\x14\x00"  # '#'
+  b"\x00\x24\x2E\x6B\x6B\x3A\x12\x00"  # '$'
+  b"\x46\x66\x30\x18\x0C\x66\x62\x00"  # '%'
+  b"\x30\x7A\x4F\x5D\x37\x7A\x48\x00"  # '&'
+  b"\x00\x00\x04\x07\x03\x00\x00\x00"  # '''
+  b"\x00\x00\x1C\x3E\x63\x41\x00\x00"  # '('
+  b"\x00\x00\x41\x63\x3E\x1C\x00\x00"  # ')'
+  b"\x08\x2A\x3E\x1C\x1C\x3E\x2A\x08"  # '*'
+  b"\x00\x08\x08\x3E\x3E\x08\x08\x00"  # '+'
+  b"\x00\x00\x80\xE0\x60\x00\x00\x00"  # '
+  b"\x00\x08\x08\x08\x08\x08\x08\x00"  # '-'
+  b"\x00\x00\x00\x60\x60\x00\x00\x00"  # '.'
+  b"\x60\x30\x18\x0C\x06\x03\x01\x00"  # '/'
+  b"\x3E\x7F\x51\x49\x45\x7F\x3E\x00"  # '0'
+  b"\x00\x40\x42\x7F\x7F\x40\x40\x00"  # '1'
+  b"\x42\x63\x71\x59\x49\x6F\x66\x00"  # '2'
+  b"\x22\x63\x49\x49\x49\x7F\x36\x00"  # '3'
+  b"\x18\x1C\x16\x53\x7F\x7F\x50\x00"  # '4'
+  b"\x2F\x6F\x49\x49\x49\x79\x31\x00"  # '5'
+  b"\x3C\x7E\x4B\x49\x49\x78\x30\x00"  # '6'
+  b"\x03\x03\x71\x79\x0D\x07\x03\x00"  # '7'
+  b"\x36\x7F\x49\x49\x49\x7F\x36\x00"  # '8'
+  b"\x06\x4F\x49\x49\x69\x3F\x1E\x00"  # '9'
+  b"\x00\x00\x00\x66\x66\x00\x00\x00"  # ':'
+  b"\x00\x00\x80\xE6\x66\x00\x00\x00"  # ';'
+  b"\x00\x00\x08\x1C\x36\x63\x41\x00"  # '<'
+  b"\x00\x24\x24\x24\x24\x24\x24\x00"  # '='
+  b"\x00\x41\x63\x36\x1C\x08\x00\x00"  # '>'
+  b"\x02\x03\x01\x59\x5D\x07\x02\x00"  # '?'
+  b"\x3E\x7F\x41\x5D\x5D\x1F\x1E\x00"  # '@'
+  b"\x7C\x7E\x0B\x09\x0B\x7E\x7C\x00"  # 'A'
+  b"\x41\x7F\x7F\x49\x49\x7F\x36\x00"  # 'B'
+  b"\x1C\x3E\x63\x41\x41\x63\x22\x00"  # 'C'
+  b"\x41\x7F\x7F\x41\x63\x3E\x1C\x00"  # 'D'
+  b"\x41\x7F\x7F\x49\x5D\x41\x63\x00"  # 'E'
+  b"\x41\x7F\x7F\x49\x1D\x01\x03\x00"  # 'F'
+  b"\x1C\x3E\x63\x41\x51\x33\x72\x00"  # 'G'
+  b"\x7F\x7F\x08\x08\x08\x7F\x7F\x00"  # 'H'
+  b"\x00\x00\x41\x7F\x7F\x41\x00\x00"  # 'I'
+  b"\x30\x70\x40\x41\x7F\x3F\x01\x00"  # 'J'
+  b"\x41\x7F\x7F\x08\x1C\x77\x63\x00"  # 'K'
+  b"\x41\x7F\x7F\x41\x40\x60\x70\x00"  # 'L'
+  b"\x7F\x7F\x0E\x1C\x0E\x7F\x7F\x00"  # 'M'
+  b"\x7F\x7F\x06\x0C\x18\x7F\x7F\x00"  # 'N'
+  b"\x3E\x7F\x41\x41\x41\x7F\x3E\x00"  # 'O'
+  b"\x41\x7F\x7F\x49\x09\x0F\x06\x00"  # 'P'
+  b"\x3E\x7F\x41\x41\xE1\xFF\xBE\x00"  # 'Q'
+  b"\x41\x7F\x7F\x09\x19\x7F\x66\x00"  # 'R'
+  b"\x22\x67\x4D\x49\x59\x73\x22\x00"  # 'S'
+  b"\x00\x07\x43\x7F\x7F\x43\x07\x00"  # 'T'
+  b"\x3F\x7F\x40\x40\x40\x7F\x3F\x00"  # 'U'
+  b"\x1F\x3F\x60\x40\x60\x3F\x1F\x00"  # 'V'
+  b"\x3F\x7F\x60\x38\x60\x7F\x3F\x00"  # 'W'
+  b"\x63\x77\x1C\x08\x1C\x77\x63\x00"  # 'X'
+  b"\x00\x07\x4F\x78\x78\x4F\x07\x00"  # 'Y'
+  b"\x47\x63\x71\x59\x4D\x67\x73\x00"  # 'Z'
+  b"\x00\x00\x7F\x7F\x41\x41\x00\x00"  # '['
+  b"\x01\x03\x06\x0C\x18\x30\x60\x00"  # backslash
+  b"\x00\x00\x41\x41\x7F\x7F\x00\x00"  # '
+  b"\x08\x0C\x06\x03\x06\x0C\x08\x00"  # '^'
+  b"\x80\x80\x80\x80\x80\x80\x80\x80"  # '_'
+  b"\x00\x00\x01\x03\x06\x04\x00\x00"  # '`'
+  b"\x20\x74\x54\x54\x3C\x78\x40\x00"  # 'a'
+  b"\x41\x7F\x3F\x44\x44\x7C\x38\x00"  # 'b'
+  b"\x38\x7C\x44\x44\x44\x6C\x28\x00"  # 'c'
+  b"\x38\x7C\x44\x45\x3F\x7F\x40\x00"  # 'd'
+  b"\x38\x7C\x54\x54\x54\x5C\x18\x00"  # 'e'
+  b"\x48\x7E\x7F\x49\x09\x03\x02\x00"  # 'f'
+  b"\x98\xBC\xA4\xA4\xF8\x7C\x04\x00"  # 'g'
+  b"\x41\x7F\x7F\x08\x04\x7C\x78\x00"  # 'h'
+  b"\x00\x00\x44\x7D\x7D\x40\x00\x00"  # 'i'
+  b"\x00\x60\xE0\x80\x80\xFD\x7D\x00"  # 'j'
+  b"\x41\x7F\x7F\x10\x38\x6C\x44\x00"  # 'k'
+  b"\x00\x00\x41\x7F\x7F\x40\x00\x00"  # 'l'
+  b"\x7C\x7C\x0C\x78\x0C\x7C\x78\x00"  # 'm'
+  b"\x04\x7C\x78\x04\x04\x7C\x78\x00"  # 'n'
+  b"\x38\x7C\x44\x44\x44\x7C\x38\x00"  # 'o'
+  b"\x84\xFC\xF8\xA4\x24\x3C\x18\x00"  # 'p'
+  b"\x18\x3C\x24\xA4\xF8\xFC\x84\x00"  # 'q'
+  b"\x44\x7C\x78\x4C\x04\x0C\x08\x00"  # 'r'
+  b"\x48\x5C\x54\x54\x54\x74\x24\x00"  # 's'
+  b"\x04\x04\x3F\x7F\x44\x64\x20\x00"  # 't'
+  b"\x3C\x7C\x40\x40\x3C\x7C\x40\x00"  # 'u'
+  b"\x1C\x3C\x60\x40\x60\x3C\x1C\x00"  # 'v'
+  b"\x3C\x7C\x60\x38\x60\x7C\x3C\x00"  # 'w'
+  b"\x44\x6C\x38\x10\x38\x6C\x44\x00"  # 'x'
+  b"\x9C\xBC\xA0\xA0\xA0\xFC\x7C\x00"  # 'y'
+  b"\x00\x4C\x64\x74\x5C\x4C\x64\x00"  # 'z'
+  b"\x00\x08\x08\x3E\x77\x41\x41\x00"  # '{'
+  b"\x00\x00\x00\x7F\x7F\x00\x00\x00"  # '|'
+  b"\x00\x41\x41\x77\x3E\x08\x08\x00"  # '}'
+  b"\x02\x03\x01\x03\x02\x03\x01\x00"  # '~'
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x7F
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x80
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x81
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x82
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x83
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x84
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x85
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x86
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x87
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x88
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x89
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x8A
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x8B
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x8C
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x8D
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x8E
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x8F
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x90
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x91
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x92
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x93
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x94
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x95
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x96
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x97
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x98
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x99
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x9A
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x9B
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x9C
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x9D
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x9E
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0x9F
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA0
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA1
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA2
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA3
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA4
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA5
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA6
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA7
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA8
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xA9
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xAA
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xAB
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xAC
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xAD
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xAE
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xAF
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB0
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB1
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB2
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB3
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB4
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB5
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB6
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB7
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB8
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xB9
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xBA
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xBB
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xBC
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xBD
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xBE
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xBF
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC0
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC1
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC2
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC3
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC4
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC5
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC6
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC7
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC8
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xC9
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xCA
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xCB
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xCC
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xCD
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xCE
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xCF
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD0
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD1
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD2
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD3
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD4
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD5
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD6
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD7
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD8
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xD9
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xDA
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xDB
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xDC
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xDD
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xDE
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xDF
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE0
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE1
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE2
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE3
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE4
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE5
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE6
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE7
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE8
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xE9
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xEA
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xEB
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xEC
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xED
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xEE
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xEF
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF0
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF1
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF2
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF3
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF4
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF5
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF6
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF7
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF8
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xF9
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xFA
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xFB
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xFC
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xFD
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xFE
+  b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 0xFF
+))  #  end of TINY_FONT
\ No newline at end of file
@@ -1 +1 @@
-from graphics import *
\ No newline at end of file
+from piledmatrix.graphics.graphics import *
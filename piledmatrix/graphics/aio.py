@@ -0,0 +1,91 @@
+"""asyncio counterparts of the rendering and animation methods of Graphics
+
+The frame is taken in the event loop thread and handed to the display's send_buffer in an executor, which packs
+and transmits it under the display's bus lock (or passes it on to the flush thread of a double buffered display),
+so one loop can drive several displays next to network I/O.
+Cancelling the task stops an animation after its current frame.
+"""
+import asyncio
+from weakref import WeakKeyDictionary
+from piledmatrix.directions import DIR_L, DIR_R
+from piledmatrix.driver.framebuffer import PIXEL_OFF
+from piledmatrix.graphics import transitions
+from piledmatrix.graphics.animation import speed_interval
+
+# One lock per render target: its frames are sent in the order they were taken
+_locks = WeakKeyDictionary()
+
+
+def _lock(display):
+    lock = _locks.get(display)
+    if lock is None:
+        lock = _locks[display] = asyncio.Lock()
+    return lock
+
+
+async def render(graphics, mode=None, executor=None):
+    # Flush the framebuffer of 'graphics' like Graphics.render, transmitting in 'executor' (None: the loop's default)
+    if mode is None:
+        mode = graphics.send_mode
+    target = graphics.display
+    async with _lock(target):
+        data = target.frame_data()
+        await asyncio.get_running_loop().run_in_executor(executor, target.send_buffer, mode, data)
+
+
+async def play(graphics, frames, speed=3, mode=None, executor=None, max_lag=1.0):
+    # Run a frame generator (see the *_frames methods of Graphics) to its end, rendering each frame
+    # Frames are due at fixed intervals from the start, so render time does not accumulate as drift;
+    # more than 'max_lag' seconds behind the schedule it is restarted from the current time
+    loop = asyncio.get_running_loop()
+    interval = speed_interval(speed)
+    next_time = loop.time()
+    try:
+        for _frame in frames:
+            await render(graphics, mode, executor)
+            next_time += interval
+            now = loop.time()
+            if now - next_time > max_lag:
+                next_time = now + interval
+            await asyncio.sleep(max(0.0, next_time - now))
+    finally:
+        frames.close()
+
+
+async def scroll_bitmap(graphics, bitmap=PIXEL_OFF, direction=DIR_L, speed=3, repeats=0, executor=None):
+    await play(graphics, graphics.scroll_bitmap_frames(bitmap, direction, repeats), speed, executor=executor)
+
+
+async def scroll_vector(graphics, bitmap=PIXEL_OFF, dx=-1, dy=0, speed=3, repeats=0, executor=None):
+    await play(graphics, graphics.scroll_vector_frames(bitmap, dx, dy, repeats), speed, executor=executor)
+
+
+async def animate_wipe(graphics, bitmap=PIXEL_OFF, speed=3, transition=DIR_L, executor=None):
+    await play(graphics, graphics.wipe_frames(bitmap, transition), speed, executor=executor)
+
+
+async def animate_dissolve(graphics, bitmap=PIXEL_OFF, speed=3, frames=16, seed=0, executor=None):
+    masks = transitions.dissolve(*graphics._size(), frames=frames, seed=seed)
+    await play(graphics, graphics.transition_frames(bitmap, masks), speed, executor=executor)
+
+
+async def animate_iris(graphics, bitmap=PIXEL_OFF, speed=3, opening=True, executor=None):
+    masks = transitions.iris(*graphics._size(), opening=opening)
+    await play(graphics, graphics.transition_frames(bitmap, masks), speed, executor=executor)
+
+
+async def animate_blinds(graphics, bitmap=PIXEL_OFF, speed=3, transition=DIR_R, size=8, executor=None):
+    masks = transitions.blinds(*graphics._size(), direction=transition, size=size)
+    await play(graphics, graphics.transition_frames(bitmap, masks), speed, executor=executor)
+
+
+async def animate_slide(graphics, bitmap=PIXEL_OFF, speed=3, transition=DIR_L, executor=None):
+    await play(graphics, graphics.slide_frames(bitmap, transition), speed, executor=executor)
+
+
+async def animate_rain(graphics, bitmap=PIXEL_OFF, speed=3, executor=None):
+    await play(graphics, graphics.rain_frames(bitmap), speed, executor=executor)
+
+
+async def marquee(graphics, source, y=0, speed=3, direction=DIR_L, repeats=1, step=1, executor=None):
+    await play(graphics, graphics.marquee_frames(source, y, direction, repeats, step), speed, executor=executor)
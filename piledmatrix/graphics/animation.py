@@ -0,0 +1,103 @@
+"""Non-blocking frame scheduling for animations"""
+from time import monotonic, sleep
+
+
+def speed_interval(speed):
+    # Seconds between frames for the 'speed' argument of the animations (0-9 for practical purposes)
+    return 0.5 ** speed
+
+
+class Animation(object):
+    # A frame generator scheduled by a Scheduler; every step of 'frames' draws one frame into the
+    # framebuffer of 'graphics', which the scheduler then renders
+
+    def __init__(self, frames, interval, graphics, next_time, on_done=None):
+        self.frames = frames
+        self.interval = interval
+        self.graphics = graphics
+        self.next_time = next_time
+        self.on_done = on_done
+        self.done = False
+        self.cancelled = False
+
+    def cancel(self):
+        # Stop the animation before its next frame; the generator is closed so its cleanup code runs
+        if not self.done:
+            self.cancelled = True
+            self._finish()
+
+    def _finish(self):
+        self.done = True
+        self.frames.close()
+        if self.on_done is not None:
+            self.on_done(self)
+
+
+class Scheduler(object):
+    # Runs any number of animations at their own frame rate without blocking in between.
+    # Deadlines advance by the interval from the previous deadline, not from the end of the frame, so render time
+    # does not accumulate as drift. A late frame is drawn on the next tick; an animation more than 'max_lag'
+    # seconds behind its schedule is resynchronised instead of rushing through the missed frames.
+    # Drive it with run(), or call tick() from an existing loop and come back after the returned delay.
+
+    def __init__(self, max_lag=1.0, clock=monotonic, sleep=sleep):
+        self.max_lag = max_lag
+        self.clock = clock
+        self.sleep = sleep
+        self.animations = []
+
+    def add(self, frames, interval, graphics, on_done=None):
+        # Schedule a frame generator; its first frame is drawn on the next tick. Returns the Animation
+        animation = Animation(frames, interval, graphics, self.clock(), on_done)
+        self.animations.append(animation)
+        return animation
+
+    def cancel_all(self):
+        for animation in list(self.animations):
+            animation.cancel()
+        self.animations = []
+
+    @property
+    def active(self):
+        return any(not animation.done for animation in self.animations)
+
+    def tick(self, now=None):
+        # Advance every animation that is due and render the displays they drew on, each one once
+        # Returns the seconds until the next frame is due, or None when no animation is left
+        if now is None:
+            now = self.clock()
+        to_render = []
+        for animation in list(self.animations):
+            if animation.done or animation.next_time > now:
+                continue
+            try:
+                next(animation.frames)
+            except StopIteration:
+                animation._finish()
+                continue
+            if animation.graphics not in to_render:
+                to_render.append(animation.graphics)
+            animation.next_time += animation.interval
+            if now - animation.next_time > self.max_lag:
+                animation.next_time = now + animation.interval
+        for graphics in to_render:
+            graphics.render()
+        self.animations = [animation for animation in self.animations if not animation.done]
+        if not self.animations:
+            return None
+        return max(0.0, min(animation.next_time for animation in self.animations) - self.clock())
+
+    def run(self, timeout=None):
+        # Tick until all animations finished (or for 'timeout' seconds at most), sleeping in between
+        end = None if timeout is None else self.clock() + timeout
+        while True:
+            delay = self.tick()
+            if delay is None:
+                return
+            if end is not None:
+                remaining = end - self.clock()
+                if remaining <= 0:
+                    return
+                delay = min(delay, remaining)
+            if delay > 0:
+                self.sleep(delay)
@@ -0,0 +1,73 @@
+"""Immutable packed bitmaps"""
+
+
+class Bitmap(object):
+    # An immutable bitmap packed like PackedFramebuffer: column by column, 'stride' bytes per column,
+    # top pixel in the MSB. bitmap[x][y] reads like the 2d lists accepted by draw_bitmap.
+
+    __slots__ = ("width", "height", "stride", "data")
+
+    def __init__(self, width, height, data):
+        stride = (height + 7) // 8
+        data = bytes(data)
+        if len(data) != width * stride:
+            raise ValueError("{0}x{1} bitmap needs {2} bytes, got {3}".format(width, height, width * stride, len(data)))
+        object.__setattr__(self, "width", width)
+        object.__setattr__(self, "height", height)
+        object.__setattr__(self, "stride", stride)
+        object.__setattr__(self, "data", data)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Bitmap is immutable")
+
+    @classmethod
+    def from_list(cls, bitmap):
+        # Pack a 2d list [x][y] of truthy/falsy pixels
+        width = len(bitmap)
+        height = len(bitmap[0]) if width else 0
+        stride = (height + 7) // 8
+        data = bytearray(width * stride)
+        for x, column in enumerate(bitmap):
+            for y, pixel in enumerate(column):
+                if pixel:
+                    data[x * stride + (y >> 3)] |= 0x80 >> (y & 7)
+        return cls(width, height, data)
+
+    @property
+    def nbytes(self):
+        return len(self.data)
+
+    def column(self, x):
+        # Pixels of column 'x' as an int of 'height' bits, the top pixel in the MSB
+        stride = self.stride
+        bits = int.from_bytes(self.data[x * stride:(x + 1) * stride], "big")
+        return bits >> (stride * 8 - self.height)
+
+    def get_pixel(self, x, y):
+        return (self.data[x * self.stride + (y >> 3)] >> (7 - (y & 7))) & 1
+
+    def to_list(self):
+        return [[self.get_pixel(x, y) for y in range(self.height)] for x in range(self.width)]
+
+    def __len__(self):
+        return self.width
+
+    def __getitem__(self, x):
+        if x < 0:
+            x += self.width
+        if not 0 <= x < self.width:
+            raise IndexError("bitmap column out of range")
+        return tuple(self.get_pixel(x, y) for y in range(self.height))
+
+    def __eq__(self, other):
+        return (isinstance(other, Bitmap) and self.width == other.width and self.height == other.height
+                and self.data == other.data)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.width, self.height, self.data))
+
+    def __repr__(self):
+        return "Bitmap({0}x{1})".format(self.width, self.height)
@@ -0,0 +1,70 @@
+"""A virtual canvas larger than the display, shown through a movable viewport
+
+Draw a whole page once with Graphics(canvas), then pan over it: moving the viewport only changes its offset, and
+a flush packs just the visible window of the canvas:
+
+    canvas = Canvas(display, 256, 32)
+    gfx = Graphics(canvas)
+    gfx.draw_string(0, 0, "a long page of text ...")
+    gfx.play(canvas.pan_frames(128, 0))
+"""
+
+
+class Canvas(object):
+    # A framebuffer of any size (at least the display's) of which the viewport, a window of the display's size
+    # with its upper left corner at 'x'/'y', is sent to 'display'; Graphics(canvas) draws into the whole canvas
+
+    def __init__(self, display, width, height, x=0, y=0):
+        framebuffer = display.framebuffer
+        self.display = display
+        self.framebuffer = type(framebuffer)(max(width, framebuffer.width), max(height, framebuffer.height))
+        self.columns = range(self.framebuffer.width)
+        self.rows = range(self.framebuffer.height)
+        self.x = 0
+        self.y = 0
+        self.pan_to(x, y)
+
+    @property
+    def buffer(self):
+        return self.framebuffer
+
+    def pan_to(self, x, y):
+        # Move the viewport to 'x'/'y', kept inside the canvas
+        self.x = max(0, min(int(x), self.framebuffer.width - self.display.framebuffer.width))
+        self.y = max(0, min(int(y), self.framebuffer.height - self.display.framebuffer.height))
+
+    def pan(self, dx, dy):
+        self.pan_to(self.x + dx, self.y + dy)
+
+    def pan_frames(self, x, y, step=1):
+        # Frame generator moving the viewport to 'x'/'y' by 'step' pixel per frame along each axis, to be run by a
+        # Scheduler (or Graphics(canvas).play); the canvas is not drawn again
+        while True:
+            dx, dy = x - self.x, y - self.y
+            if not dx and not dy:
+                return
+            self.pan(max(-step, min(dx, step)), max(-step, min(dy, step)))
+            if (self.x, self.y) == (x - dx, y - dy):
+                # The target lies outside the canvas
+                return
+            yield
+
+    def window(self):
+        # The viewport in the format of the display framebuffer's packed()
+        display = self.display.framebuffer
+        return self.framebuffer.window(self.x, self.y, display.width, display.height)
+
+    def clear_buffer(self):
+        self.framebuffer.clear()
+
+    def clone_buffer(self):
+        return self.framebuffer.to_list()
+
+    def frame_data(self):
+        # Snapshot of the viewport for send_buffer, see DisplayUnit.frame_data
+        return bytes(self.window())
+
+    def send_buffer(self, mode=None, data=None):
+        # Flush the viewport (or 'data' returned by frame_data) to the display, see DisplayUnit.send_buffer;
+        # the display's framebuffer is left alone
+        self.display.send_buffer(mode, self.window() if data is None else data)
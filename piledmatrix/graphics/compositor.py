@@ -0,0 +1,202 @@
+"""Layers and sprites composed into the framebuffer of a display
+
+Every layer has a framebuffer of its own size, drawn with Graphics(layer) like a display, an offset on the display,
+a z order, visibility and a blend mode. The compositor keeps the composed frame below every layer, so a change only
+recomposes the layers from the lowest changed one up:
+
+    compositor = Compositor(display)
+    label = Graphics(compositor.add_layer("label"))
+    label.draw_string(0, 0, "CPU")
+    dot = compositor.add_sprite("dot", [[1, 1], [1, 1]], x=30, y=3)
+    dot.visible = False
+    compositor.render()
+"""
+from piledmatrix.driver.framebuffer import PIXEL_OFF, PIXEL_ON, PIXEL_INVERT
+from piledmatrix.graphics.bitmap import Bitmap
+
+# Blend mode of a layer replacing the pixels below it where its mask is set (everywhere without a mask)
+LAYER_MASK = 3
+
+
+class Layer(object):
+    # A picture composed over the layers below it, see Compositor.add_layer
+    # mode: PIXEL_ON switches the pixels of the layer on, PIXEL_OFF switches them off, PIXEL_INVERT inverts them,
+    # LAYER_MASK copies the layer (on and off pixels) where its mask is set
+    # x, y, z, visible and mode can be changed at any time, the next compose picks them up
+
+    def __init__(self, compositor, name, width, height, x=0, y=0, z=0, mode=PIXEL_ON, visible=True):
+        framebuffer = compositor.display.framebuffer
+        self.compositor = compositor
+        self.name = name
+        self.framebuffer = type(framebuffer)(width, height)
+        self.columns = range(width)
+        self.rows = range(height)
+        self.x = x
+        self.y = y
+        self.z = z
+        self.mode = mode
+        self.visible = visible
+        self.mask = None
+
+    @property
+    def buffer(self):
+        return self.framebuffer
+
+    def move_to(self, x, y):
+        self.x = x
+        self.y = y
+
+    def set_mask(self, mask):
+        # Pixels of the layer copied in LAYER_MASK mode: a 2d [x][y] bitmap or Bitmap of the layer's size,
+        # None for all of them
+        if mask is not None:
+            if not isinstance(mask, Bitmap):
+                mask = Bitmap.from_list(mask)
+            mask = tuple(mask.column(x) if x < mask.width else 0 for x in self.columns)
+        self.mask = mask
+
+    def clear_buffer(self):
+        self.framebuffer.clear()
+
+    def clone_buffer(self):
+        return self.framebuffer.to_list()
+
+    def frame_data(self):
+        return self.compositor.frame_data()
+
+    def send_buffer(self, mode=None, data=None):
+        # Graphics.render of a layer composes and flushes the whole display, see Compositor.send_buffer
+        self.compositor.send_buffer(mode, data)
+
+    def _signature(self):
+        # Everything the composed frame depends on; the layer is recomposed when it differs from the last compose
+        return (self.x, self.y, self.visible, self.mode, self.mask, bytes(self.framebuffer.packed()))
+
+
+class Compositor(object):
+    # Composes layers into the framebuffer of 'display', the lowest z first (layers of the same z in the order they
+    # were added); whatever is drawn into the display's framebuffer directly is replaced by the next compose
+    # send_mode: the send mode (see DisplayUnit.send_buffer) of the renders which do not ask for one; a mode
+    # passed to render or send_buffer, e.g. "full" to resync the chips, always wins
+
+    def __init__(self, display, send_mode="delta"):
+        self.display = display
+        self.send_mode = send_mode
+        self._layers = []
+        # (signature, composed frame up to this layer) of every layer of the last compose, bottom up
+        self._composed = []
+
+    def add_layer(self, name, width=None, height=None, x=0, y=0, z=None, mode=PIXEL_ON, visible=True):
+        # New empty layer named 'name' (replacing a layer of that name), by default of the display's size and on top
+        if width is None:
+            width = len(self.display.columns)
+        if height is None:
+            height = len(self.display.rows)
+        if z is None:
+            z = max([layer.z for layer in self._layers] or [-1]) + 1
+        self.remove_layer(name)
+        layer = Layer(self, name, width, height, x, y, z, mode, visible)
+        self._layers.append(layer)
+        return layer
+
+    def add_sprite(self, name, bitmap, x=0, y=0, z=None, mode=PIXEL_ON, visible=True):
+        # New layer of the size of 'bitmap' (a 2d [x][y] sequence or Bitmap) holding it
+        if isinstance(bitmap, Bitmap):
+            width, height = bitmap.width, bitmap.height
+        else:
+            width, height = len(bitmap), max(len(column) for column in bitmap) if len(bitmap) else 0
+        layer = self.add_layer(name, width, height, x, y, z, mode, visible)
+        if isinstance(bitmap, Bitmap):
+            for column in range(width):
+                layer.framebuffer.blit_column(column, 0, bitmap.column(column), height)
+        else:
+            layer.framebuffer.blit_bitmap(0, 0, bitmap)
+        return layer
+
+    def remove_layer(self, name):
+        self._layers = [layer for layer in self._layers if layer.name != name]
+
+    def layer(self, name):
+        for layer in self._layers:
+            if layer.name == name:
+                return layer
+        raise KeyError(name)
+
+    def __getitem__(self, name):
+        return self.layer(name)
+
+    def __iter__(self):
+        # The layers from bottom to top
+        return iter(self._ordered())
+
+    def _ordered(self):
+        order = dict((id(layer), index) for index, layer in enumerate(self._layers))
+        return sorted(self._layers, key=lambda layer: (layer.z, order[id(layer)]))
+
+    def compose(self):
+        # Write the composed layers into the display's framebuffer
+        # Layers below the lowest changed one are not composed again, their result is kept from the last compose
+        framebuffer = self.display.framebuffer
+        layers = self._ordered()
+        signatures = [layer._signature() for layer in layers]
+        composed = self._composed
+        first = 0
+        while first < len(layers) and first < len(composed) and composed[first][0] == signatures[first]:
+            first += 1
+        if first:
+            framebuffer.load(composed[first - 1][1])
+        else:
+            framebuffer.clear()
+        del composed[first:]
+        for layer, signature in zip(layers[first:], signatures[first:]):
+            if layer.visible:
+                self._blend(framebuffer, layer)
+            composed.append((signature, bytes(framebuffer.packed())))
+
+    def render(self, mode=None):
+        # Compose and flush the display; with the default send_mode only the changed digit registers are sent
+        self.send_buffer(mode)
+
+    def frame_data(self):
+        # Compose and return a snapshot of the display's frame for send_buffer, see DisplayUnit.frame_data
+        self.compose()
+        return self.display.frame_data()
+
+    def send_buffer(self, mode=None, data=None):
+        # Flush the composed layers, or 'data' returned by frame_data, to the display
+        if data is None:
+            self.compose()
+        self.display.send_buffer(self.send_mode if mode is None else mode, data)
+
+    @staticmethod
+    def _blend(framebuffer, layer):
+        # Compose one layer onto the frame in 'framebuffer', column by column, clipped to the frame
+        source = layer.framebuffer
+        left, right = max(layer.x, 0), min(layer.x + source.width, framebuffer.width)
+        top, bottom = max(layer.y, 0), min(layer.y + source.height, framebuffer.height)
+        if left >= right or top >= bottom:
+            return
+        count = bottom - top
+        full = (1 << count) - 1
+        # Bits of a layer column (MSB = its top row) below the frame's bottom row
+        cut = source.height - (top - layer.y) - count
+        mode = layer.mode
+        for x in range(left, right):
+            bits = source.get_column(x - layer.x, top - layer.y, count)
+            if mode == PIXEL_INVERT:
+                framebuffer.blit_column(x, top, bits, count, True)
+                continue
+            if mode == LAYER_MASK and layer.mask is None:
+                framebuffer.blit_column(x, top, bits, count)
+                continue
+            under = framebuffer.get_column(x, top, count)
+            if mode == PIXEL_ON:
+                bits |= under
+            elif mode == PIXEL_OFF:
+                bits = under & ~bits & full
+            elif mode == LAYER_MASK:
+                mask = (layer.mask[x - layer.x] >> cut) & full
+                bits = (under & ~mask) | (bits & mask)
+            else:
+                continue
+            framebuffer.blit_column(x, top, bits, count)
@@ -0,0 +1,60 @@
+"""Pixel effects as frame generators independent of a display
+
+An effect yields, for every frame, the packed columns (ints, MSB = top pixel) of the picture; Graphics draws them.
+"""
+
+
+def rain(bitmap, speeds):
+    # Rain of the 2d [x][y] bitmap 'bitmap': each step brings the next row of the bitmap in at the bottom row and
+    # lets the drops of every column rise by up to 'speeds[x]' rows, until the picture has built up
+    # Yields the packed columns of each of the len(bitmap[0]) frames
+    schedules = {}
+    columns = []
+    for column, speed in zip(bitmap, speeds):
+        key = (tuple(column), speed)
+        if key not in schedules:
+            schedules[key] = rain_column(column, speed)
+        columns.append(schedules[key])
+    for step in range(len(bitmap[0]) if bitmap else 0):
+        yield [schedule[step] for schedule in columns]
+
+
+def rain_column(column, speed):
+    # Drop schedule of one column of the rain: its packed pixels after each step
+    height = len(column)
+    cells = [None] * height
+    schedule = []
+    for new in column:
+        if None in cells:
+            _rain_step(cells, speed, new)
+        bits = 0
+        for cell in cells:
+            bits = bits << 1 | (1 if cell == 1 else 0)
+        schedule.append(bits)
+    return schedule
+
+
+def _rain_step(cells, speed, new):
+    # One step of a column: from the first empty cell down, every cell takes the drop at most 'speed' cells
+    # below it (which is then empty) or turns empty if that cell is empty; then 'new' enters the bottom cell
+    height = len(cells)
+    row = cells.index(None)
+    below = _next_drop(cells, row + 1)
+    while row < height - 1:
+        if below < height:
+            source = min(below, row + speed)
+            cells[row] = cells[source]
+            cells[source] = None
+            if source == below:
+                below = _next_drop(cells, below + 1)
+        row += 1
+        if below <= row:
+            below = _next_drop(cells, row + 1)
+    cells[height - 1] = new
+
+
+def _next_drop(cells, row):
+    # First cell from 'row' down holding a drop, len(cells) if there is none
+    while row < len(cells) and cells[row] is None:
+        row += 1
+    return row
@@ -0,0 +1,72 @@
+"""Fonts compiled into ready-to-blit glyph columns"""
+from piledmatrix.driver.framebuffer import PIXEL_OFF, PIXEL_ON, PIXEL_INVERT
+
+
+class Glyph(object):
+    # One character of a font, as drawn in one draw mode
+    # columns: 8 column bytes (top pixel in the MSB); PIXEL_INVERT XORs them onto the framebuffer
+
+    __slots__ = ("columns",)
+
+    def __init__(self, columns):
+        self.columns = columns
+
+
+class CompiledFont(object):
+    # All glyphs of a font for one draw mode
+
+    def __init__(self, font, mode):
+        self.font = font
+        self.mode = mode
+        self.glyphs = [self._compile(columns, mode) for columns in font]
+        # Column byte of an unlit column in this mode
+        self.blank = b"\xff" if mode == PIXEL_OFF else b"\x00"
+        # (id(metrics), spacing): (metrics, per-glyph proportional columns followed by the spacing)
+        self._proportional = {}
+
+    @staticmethod
+    def _compile(columns, mode):
+        if mode == PIXEL_OFF:
+            columns = [~column & 0xFF for column in columns]
+        return Glyph(bytes(bytearray(columns)))
+
+    def __getitem__(self, char_code):
+        return self.glyphs[char_code]
+
+    def columns(self, text, metrics=None, spacing=1):
+        # Column bytes of 'text' drawn with 8 pixel wide characters, or with FontMetrics of this font
+        # proportionally, 'spacing' columns apart
+        if metrics is None:
+            glyphs = self.glyphs
+            return b"".join([glyphs[ord(char)].columns for char in text])
+        proportional = self.proportional(metrics, spacing)
+        columns = b"".join([proportional[ord(char)] for char in text])
+        return columns[:len(columns) - spacing] if text else columns
+
+    def proportional(self, metrics, spacing=1):
+        # Per-glyph column bytes cut to the metrics of each glyph and followed by 'spacing' blank columns
+        key = (id(metrics), spacing)
+        entry = self._proportional.get(key)
+        if entry is None:
+            gap = self.blank * spacing
+            columns = []
+            for glyph, bearing, width in zip(self.glyphs, metrics.bearings, metrics.widths):
+                glyph_columns = glyph.columns[bearing:bearing + width]
+                columns.append(glyph_columns + self.blank * (width - len(glyph_columns)) + gap)
+            entry = self._proportional[key] = (metrics, columns)
+        return entry[1]
+
+
+# (id(font), mode): CompiledFont; the CompiledFont keeps the font alive, so its id stays unique
+_compiled = {}
+
+
+def compile_font(font, mode=PIXEL_ON):
+    # Return the glyphs of 'font' for draw mode 'mode', compiling them on first use
+    key = (id(font), mode)
+    compiled = _compiled.get(key)
+    if compiled is None:
+        if mode not in (PIXEL_OFF, PIXEL_ON, PIXEL_INVERT):
+            raise ValueError("unknown draw mode: {0}".format(mode))
+        compiled = _compiled[key] = CompiledFont(font, mode)
+    return compiled
@@ -1,18 +1,26 @@
 from copy import deepcopy
+from math import gcd
 from random import randrange
-from time import sleep
-from piledmatrix.font import DEFAULT_FONT
+from piledmatrix.font import as_font, get_font
+from piledmatrix.font.metrics import font_metrics
 from piledmatrix.directions import *
-
-PIXEL_OFF = 0
-PIXEL_ON = 1
-PIXEL_INVERT = 2
+from piledmatrix.driver.framebuffer import PIXEL_OFF, PIXEL_ON, PIXEL_INVERT, _INVERT_TABLE
+from piledmatrix.graphics import effects, raster, transitions
+from piledmatrix.graphics.animation import Scheduler, speed_interval
+from piledmatrix.graphics.bitmap import Bitmap
+from piledmatrix.graphics.glyphs import compile_font
+from piledmatrix.graphics.textcache import default_text_cache
 
 class Graphics(object):
-    def __init__(self, display):
+    def __init__(self, display, text_cache=None):
+        # text_cache: TextCache for render_text, by default the one shared by all Graphics objects
         self.display = display
         self.draw_mode = PIXEL_ON
-        self.font = DEFAULT_FONT
+        self.font = get_font()
+        self.proportional = False
+        self.spacing = 1
+        self.send_mode = None
+        self.text_cache = default_text_cache if text_cache is None else text_cache
 
     def clone_buffer(self):
         return self.display.clone_buffer()
@@ -24,239 +32,300 @@ class Graphics(object):
         self.clear_buffer()
         self.render()
 
-    def render(self):
-        self.display.send_buffer()
+    def render(self, mode=None):
+        # mode: "full", "delta" or "dense", see DisplayUnit.send_buffer; None for the one set with set_send_mode,
+        # if any, else the default of the display ("full", the send_mode of a Compositor for its layers)
+        self.display.send_buffer(self.send_mode if mode is None else mode)
     
     def set_draw_mode(self, mode):
         self.draw_mode = mode
+
+    def set_send_mode(self, mode):
+        # Send mode of every render without a mode, including the frames of play and the animations
+        self.send_mode = mode
     
     def set_font(self, font):
-        self.font = font
+        # font: a Font (see piledmatrix.font), a font in the former list format or the name of a registered font
+        if isinstance(font, str):
+            font = get_font(font)
+        self.font = as_font(font)
+
+    def set_proportional(self, proportional=True, spacing=1):
+        # Draw text with the width of each glyph instead of 8 pixel per character, 'spacing' pixel apart
+        self.proportional = proportional
+        self.spacing = spacing
 
     def fill(self):
         # Set the entire graphics buffer to on, off, or the inverse of its previous state
         display = self.display
-        if self.draw_mode == PIXEL_ON:
-            for x in display.columns:
-                for y in display.rows:
-                    display.buffer[x][y] = 1
-        elif self.draw_mode == PIXEL_OFF:
-            for x in display.columns:
-                for y in display.rows:
-                    display.buffer[x][y] = 0
-        elif self.draw_mode == PIXEL_INVERT:
-            for x in display.columns:
-                for y in display.rows:
-                    display.buffer[x][y] = display.buffer[x][y] ^ 1
+        display.framebuffer.fill_rect(0, 0, len(display.columns), len(display.rows), self.draw_mode)
 
     def draw_pixel(self, x, y):
         # Draw a pixel at the specified 'x'/'y' position. Position (0,0) is at the upper left corner of the display
-        display = self.display
-        if x >= len(display.columns):
-            return
-        if y >= len(display.rows):
-            return
-
-        if self.draw_mode == PIXEL_ON:
-            display.buffer[x][y] = 1
-        elif self.draw_mode == PIXEL_OFF:
-            display.buffer[x][y] = 0
-        elif self.draw_mode == PIXEL_INVERT:
-            display.buffer[x][y] = display.buffer[x][y] ^ 1
+        self.display.framebuffer.fill_rect(int(x), int(y), 1, 1, self.draw_mode)
 
     def draw_horizontal_line(self, x = 0, y = 0, length=None):
         # Draw a horizontal line, starting at 'x'/'y' position (left edge). The length of the line is 'length' pixel
         display = self.display
         x = max(int(x), 0)
-        length = len(self.display.columns) - x if length is None else length
-        max_x = min(x + length, len(self.display.columns))
-        x_range = range(x, max_x)
-        if y < len(display.rows):
-            if self.draw_mode == PIXEL_ON:
-                for x in x_range:
-                    display.buffer[x][y] = 1
-            elif self.draw_mode == PIXEL_OFF:
-                for x in x_range:
-                    display.buffer[x][y] = 0
-            elif self.draw_mode == PIXEL_INVERT:
-                for x in x_range:
-                    display.buffer[x][y] = display.buffer[x][y] ^ 1
+        length = len(display.columns) - x if length is None else int(length)
+        display.framebuffer.fill_rect(x, int(y), length, 1, self.draw_mode)
 
     def draw_vertical_line(self, x=0, y=0, length=None):
         # Draw a vertical line, starting at 'x'/'y' position (upper end). The length of the line is 'length' pixel
         display = self.display
         y = max(int(y), 0)
-        length = len(self.display.rows) - y if length is None else length
-        max_y = min(y + length, len(self.display.rows))
-        y_range = range(y, max_y)
-        if x < len(display.columns):
-            if self.draw_mode == PIXEL_ON:
-                for y in y_range:
-                    display.buffer[x][y] = 1
-            elif self.draw_mode == PIXEL_OFF:
-                for y in y_range:
-                    display.buffer[x][y] = 1
-            elif self.draw_mode == PIXEL_INVERT:
-                for y in y_range:
-                    display.buffer[x][y] = display.buffer[x][y] ^ 1
+        length = len(display.rows) - y if length is None else int(length)
+        display.framebuffer.fill_rect(int(x), y, 1, length, self.draw_mode)
     
-    def draw_line(self, x1, y1, x2, y2):
+    def draw_line(self, x1, y1, x2, y2, last=True):
         # Draw a straight line in the graphics buffer between the specified start- & end-points
         # The line can be drawn by setting each affected pixel to either on, off, or the inverse of its previous state
         # The final point of the line (x2, y2) can either be included (default) or omitted
         # It can be usefully omitted if drawing another line starting from this previous endpoint using PIXEL_INVERT
-        display = self.display
-        x1, x2 = int(x1), int(x2)
-        y1, y2 = int(y1), int(y2)
-        len_x = x2 - x1
-        len_y = y2 - y1
-        if abs(len_x) + abs(len_y) == 0:
-                self.draw_pixel(x1, y1)
-        elif abs(len_x) > abs(len_y):
-            step_x = abs(len_x) / len_x
-            for x in range(x1, x2 + 1 * step_x, step_x):
-                y = int(y1 + float(len_y) * (float(x - x1)) / float(len_x) + 0.5)
-                if x in display.columns and y in display.rows:
-                    self.draw_pixel(x, y)
-        else:
-            step_y = abs(len_y) / len_y
-            for y in range(y1, y2 + 1 * step_y, step_y):
-                x = int(x1 + float(len_x) * (float(y - y1)) / float(len_y) + 0.5)
-                if x in display.columns and y in display.rows:
-                    self.draw_pixel(x, y)
+        self._draw_runs(raster.line(int(x1), int(y1), int(x2), int(y2), *self._size(), last=last))
+
+    def draw_rect(self, x, y, width, height, filled=False):
+        # Draw a rectangle with its upper left corner at 'x'/'y', filled or as a one pixel outline
+        self._draw_runs(raster.rect(int(x), int(y), int(width), int(height), *self._size(), filled=filled))
+
+    def draw_circle(self, x, y, radius, filled=False):
+        # Draw a circle around 'x'/'y', filled or as a one pixel outline
+        self._draw_runs(raster.circle(int(x), int(y), int(radius), *self._size(), filled=filled))
+
+    def draw_ellipse(self, x, y, x_radius, y_radius, filled=False):
+        # Draw an axis aligned ellipse around 'x'/'y', filled or as a one pixel outline
+        self._draw_runs(raster.ellipse(int(x), int(y), int(x_radius), int(y_radius), *self._size(), filled=filled))
+
+    def draw_polyline(self, points, closed=False):
+        # Draw lines joining a sequence of (x, y) points, and the last one to the first if 'closed'
+        # Every pixel is drawn once, so a polyline can also be drawn with PIXEL_INVERT
+        points = [(int(x), int(y)) for x, y in points]
+        self._draw_runs(raster.polyline(points, *self._size(), closed=closed))
+
+    def draw_triangle(self, x1, y1, x2, y2, x3, y3, filled=True):
+        # Draw a triangle between three corners, filled (default) or as its outline
+        corners = (int(x1), int(y1)), (int(x2), int(y2)), (int(x3), int(y3))
+        self._draw_runs(raster.triangle(corners[0], corners[1], corners[2], *self._size(), filled=filled))
+
+    def _size(self):
+        return len(self.display.columns), len(self.display.rows)
+
+    def _draw_runs(self, runs):
+        # Write the (x, y, width, height) runs of a shape from the raster module in the current draw mode
+        fill_rect = self.display.framebuffer.fill_rect
+        mode = self.draw_mode
+        for x, y, width, height in runs:
+            fill_rect(x, y, width, height, mode)
 
     def draw_char(self, x, y, char_code):
         # Overlay one character from the specified font into the graphics buffer, at a specified x-y position
         # The character is drawn by setting each affected pixel to either on, off, or the inverse of its previous state
-        display = self.display
-        x = int(x)
-        y = int(y)
-        font_height = 8
-        char_width = 8
-        for char_y in range(font_height):
-            for char_x in range(char_width):
-                if (char_x + x) in display.columns and (char_y + y) in display.rows:
-                    if self.draw_mode == PIXEL_ON:
-                        display.buffer[char_x + x][char_y + y] = (
-                            (self.font[char_code][char_x] & pow(2, 7 - char_y)) >> (7 - char_y))
-                    elif self.draw_mode == PIXEL_OFF:
-                        display.buffer[char_x + x][char_y + y] = ~(
-                            (self.font[char_code][char_x] & pow(2, 7 - char_y)) >> (7 - char_y))
-                    elif self.draw_mode == PIXEL_INVERT:
-                        display.buffer[char_x + x][char_y + y] = ((self.font[char_code][char_x] & pow(
-                            2, 7 - char_y)) >> (7 - char_y)) ^ display.buffer[char_x + x][char_y + y]
+        # (PIXEL_OFF draws it inverted, i.e. lit background and dark character)
+        # Returns the advance to the next character: 8, or in proportional mode the glyph width plus spacing
+        if self.proportional:
+            char_width = font_metrics(self.font).advance(char_code, self.spacing)
+        else:
+            char_width = 8
+        if self.draw_mode not in (PIXEL_OFF, PIXEL_ON, PIXEL_INVERT):
+            return char_width
+        compiled = compile_font(self.font, self.draw_mode)
+        if self.proportional:
+            columns = compiled.proportional(font_metrics(self.font), self.spacing)[char_code]
+        else:
+            columns = compiled[char_code].columns
+        self.display.framebuffer.blit_columns(int(x), int(y), columns, self.draw_mode == PIXEL_INVERT)
         return char_width
 
     def draw_string(self, x, y, text):
         text = str(text)
-        for char in text:
-            x += self.draw_char(x, y, ord(char))
+        if self.draw_mode not in (PIXEL_OFF, PIXEL_ON, PIXEL_INVERT):
+            return
+        compiled = compile_font(self.font, self.draw_mode)
+        metrics = font_metrics(self.font) if self.proportional else None
+        columns = compiled.columns(text, metrics, self.spacing)
+        self.display.framebuffer.blit_columns(int(x), int(y), columns, self.draw_mode == PIXEL_INVERT)
+
+    def measure_string(self, text):
+        # Width in pixel that draw_string would use for 'text', without drawing it
+        text = str(text)
+        if self.proportional:
+            return font_metrics(self.font).measure(text, self.spacing)
+        return 8 * len(text)
+
+    def render_text(self, text, font=None):
+        # 'text' in 'font' (default: the current font, a name is looked up with get_font) as an immutable Bitmap,
+        # laid out like draw_string with the current proportional setting. draw_bitmap(render_text(text), x, y)
+        # draws the same pixels as draw_string(x, y, text) in every draw mode.
+        # Rendered bitmaps are kept in self.text_cache, so repeated messages are only rasterized once.
+        text = str(text)
+        if font is None:
+            font = self.font
+        elif isinstance(font, str):
+            font = get_font(font)
+        else:
+            font = as_font(font)
+        proportional = self.proportional
+        spacing = self.spacing if proportional else None
+        key = (text, font, spacing)
+
+        def render():
+            metrics = font_metrics(font) if proportional else None
+            columns = compile_font(font, PIXEL_ON).columns(text, metrics, spacing)
+            return Bitmap(len(columns), 8, columns)
+
+        return self.text_cache.get(key, render)
 
     def draw_bitmap(self, bitmap, x=0, y=0):
         # Overlay a specified 2d array[x][y] into the graphics buffer, at a specified position
         # The bitmap is drawn by setting each affected pixel to either on, off, or the inverse of its previous state
         # Sprite is an m-pixel (wide) x n-pixel hide array, eg [[0,0,1,0],[1,1,1,1],[0,0,1,0]] for a cross
-        display = self.display
+        # PIXEL_OFF draws the bitmap inverted. A packed Bitmap (e.g. from render_text) is blitted column by column
+        framebuffer = self.display.framebuffer
         x = int(x)
         y = int(y)
-        bitmap_width = len(bitmap)
-        bitmap_height = len(bitmap[0])
-        for bitmap_x in range(bitmap_width):
-            for bitmap_y in range(bitmap_height):
-                if (bitmap_x + x) < len(display.buffer) and (bitmap_y + y) < len(display.buffer[bitmap_x + x]):
-                    if self.draw_mode == PIXEL_ON:
-                        display.buffer[bitmap_x + x][bitmap_y +
-                                                     y] = bitmap[bitmap_x][bitmap_y]
-                    elif self.draw_mode == PIXEL_OFF:
-                        display.buffer[bitmap_x + x][bitmap_y +
-                                                     y] = ~bitmap[bitmap_x][bitmap_y]
-                    elif self.draw_mode == PIXEL_INVERT:
-                        display.buffer[bitmap_x + x][bitmap_y +
-                                                     y] = bitmap[bitmap_x][bitmap_y] ^ display.buffer[bitmap_x + x][bitmap_y + y]
+        if isinstance(bitmap, Bitmap):
+            self._blit_bitmap(bitmap, x, y)
+            return
+        framebuffer.blit_bitmap(x, y, bitmap, self.draw_mode)
+
+    def _blit_bitmap(self, bitmap, x, y):
+        # PIXEL_ON copies the bitmap, PIXEL_OFF copies it inverted and PIXEL_INVERT XORs it
+        if self.draw_mode not in (PIXEL_OFF, PIXEL_ON, PIXEL_INVERT):
+            return
+        framebuffer = self.display.framebuffer
+        xor = self.draw_mode == PIXEL_INVERT
+        if bitmap.height == 8:
+            columns = bitmap.data
+            if self.draw_mode == PIXEL_OFF:
+                columns = columns.translate(_INVERT_TABLE)
+            framebuffer.blit_columns(x, y, columns, xor)
+            return
+        height = bitmap.height
+        mask = (1 << height) - 1
+        for bitmap_x in range(bitmap.width):
+            bits = bitmap.column(bitmap_x)
+            if self.draw_mode == PIXEL_OFF:
+                bits ^= mask
+            framebuffer.blit_column(x + bitmap_x, y, bits, height, xor)
 
     def _pad_bitmap(self, bitmap, width=None, height=None):
-        new_bitmap = []
+        # 'bitmap' (PIXEL_OFF, PIXEL_ON or a 2d [x][y] sequence) as a 2d list of 'width' x 'height', cut or padded
         if width is None:
             width = len(self.display.columns)
         if height is None:
             height = len(self.display.rows)
 
-        if bitmap == PIXEL_OFF:
-            new_bitmap = [[0 for h in range(height)] for w in range(width)]
-        elif bitmap == PIXEL_ON:
-            new_bitmap = [[1 for h in range(height)] for w in range(width)]
-        else:
-            new_bitmap = [[0 for h in range(height)] for w in range(width)]
-            if (isinstance(bitmap, list)):
-                for x in range(width):
-                    for y in xrange(height):
-                        if x < len(bitmap) and y < len(bitmap[x]):
-                            new_bitmap[x][y] = bitmap[x][y]
+        if isinstance(bitmap, int):
+            value = 1 if bitmap == PIXEL_ON else 0
+            return [[value] * height for w in range(width)]
+        new_bitmap = [[0] * height for w in range(width)]
+        for x in range(min(width, len(bitmap))):
+            column = bitmap[x]
+            for y in range(min(height, len(column))):
+                new_bitmap[x][y] = column[y]
         return new_bitmap
 
-    def move(self, x1=0, y1=0, x2=10, y2=5, direction=DIR_L, distance=1, bitmap=PIXEL_OFF):
+    def _framebuffer_of(self, bitmap):
+        # 'bitmap' drawn into a new framebuffer like the display's, to blend with or shift in
+        framebuffer = self.display.framebuffer
+        target = type(framebuffer)(framebuffer.width, framebuffer.height)
+        target.blit_bitmap(0, 0, bitmap)
+        return target
+
+    def move(self, x1=0, y1=0, x2=10, y2=5, direction=DIR_L, distance=1, bitmap=PIXEL_OFF, columns=None):
         # Scroll the specified area of the graphics buffer by (distance) pixel in the given direction
-        # direction: any of DIR_U, DIR_D, DIR_L, DIR_R
+        # direction: any of DIR_U, DIR_D, DIR_L, DIR_R, or a diagonal like DIR_LU moving both ways
         # Pixels outside the rectangle are unaffected; pixels scrolled outside the rectangle are discarded
         # The 'new' pixels in the bitmap created are either set to on or off or in the new graphic
+        # columns: the new pixels already packed, instead of 'bitmap': ints (MSB = upper pixel) for each new column
+        # from left to right, or for a vertical move for each column of the area; for a diagonal move all columns
+        # of the area after the move, of which the new pixels are taken
         display = self.display
-        x2 += 1
-        y2 += 1
         distance = abs(int(distance))
-        if direction == DIR_L or direction == DIR_R:
-            if distance > x2:
-                distance = x2
-            bitmap = self._pad_bitmap(bitmap, distance, y2 - y1)
-        if direction == DIR_U or direction == DIR_D:
-            if distance > y2:
-                distance = y2
-            bitmap = self._pad_bitmap(bitmap, x2 - x1, distance)
-
+        straight = direction in (DIR_L, DIR_R, DIR_U, DIR_D)
+        framebuffer = display.framebuffer
+        x2 = int(x2) + 1
+        y2 = int(y2) + 1
         x1 = max(0, min(len(display.columns) - 1, int(x1)))
-        x2 = max(0, min(len(display.columns) - x1, int(x2)))
+        width = max(0, min(len(display.columns) - x1, x2))
         y1 = max(0, min(len(display.rows) - 1, int(y1)))
-        y2 = max(0, min(len(display.rows) - y1, int(y2)))
-        range_of_x = range(x1, x1 + x2)
-        range_of_y = range(y1, y1 + y2)
-
-        if direction & DIR_L:
-            for x in range_of_x:
-                for y in range_of_y:
-                    if x + distance < x1 + x2:
-                        display.buffer[x][y] = display.buffer[x + distance][y]
-                    else:
-                        display.buffer[x][y] = bitmap[x - x1 - x2 + distance][y - y1]
-        elif direction & DIR_R:
-            for x in reversed(range_of_x):
-                for y in range_of_y:
-                    if x - distance < x1:
-                        display.buffer[x][y] = bitmap[x - distance][y - y1]
-                    else:
-                        display.buffer[x][y] = display.buffer[x - distance][y]
-        if direction & DIR_U:
-            for x in range_of_x:
-                for y in reversed(range_of_y):
-                    if y - distance < y1:
-                        display.buffer[x][y] = bitmap[x - x1][y - distance]
-                    else:
-                        display.buffer[x][y] = display.buffer[x][y - distance]
-        elif direction & DIR_D:
-            for x in range_of_x:
-                for y in range_of_y:
-                    if y + distance < y1 + y2:
-                        display.buffer[x][y] = display.buffer[x][y + distance]
-                    else:
-                        display.buffer[x][y] = bitmap[x - x1][y - y1 - y2 + distance]
+        height = max(0, min(len(display.rows) - y1, y2))
+
+        # The new pixels come from a 'distance' wide (high) strip next to the rectangle; if that is more than
+        # the rectangle, only the part of the strip which has moved in is visible. Diagonals move in one pass.
+        dx = dy = 0
+        incoming = columns
+        if direction & (DIR_L | DIR_R):
+            distance_x = min(distance, x2)
+            dx = min(distance_x, width)
+            first_x = distance_x - dx if direction & DIR_L else 0
+            if straight and columns is None:
+                incoming = self._strip_columns(bitmap, range(first_x, first_x + dx), range(height))
+            if direction & DIR_L:
+                dx = -dx
+        if direction & (DIR_U | DIR_D):
+            distance_y = min(distance, y2)
+            dy = min(distance_y, height)
+            first_y = distance_y - dy if direction & DIR_D else 0
+            if straight and columns is None:
+                incoming = self._strip_columns(bitmap, range(width), range(first_y, first_y + dy))
+            if direction & DIR_D:
+                dy = -dy
+        if not straight and columns is None:
+            incoming = self._diagonal_columns(bitmap, width, height, dx, dy, first_x, first_y)
+        framebuffer.shift_region(x1, y1, width, height, dx, dy, incoming)
+
+    def _diagonal_columns(self, bitmap, width, height, dx, dy, first_x, first_y):
+        # The new pixels of a diagonal move by 'dx'/'dy' as 'columns' for shift_region: those of a horizontal move
+        # followed by a vertical one, the vacated columns taken from the columns of 'bitmap' from 'first_x' on,
+        # then the vacated rows from its rows from 'first_y' on, like the strips of the straight moves
+        full = (1 << height) - 1
+        count_x, count_y = abs(dx), abs(dy)
+        offset = width - count_x if dx < 0 else 0
+        incoming = [0] * width
+        for column, bits in enumerate(self._strip_columns(bitmap, range(first_x, first_x + count_x), range(height))):
+            # The vertical move shifts the new columns too
+            incoming[offset + column] = (bits >> count_y if dy > 0 else bits << count_y) & full
+        shift = height - count_y if dy > 0 else 0
+        rows = ((1 << count_y) - 1) << shift
+        return [(bits & ~rows) | (row << shift) for bits, row in
+                zip(incoming, self._strip_columns(bitmap, range(width), range(first_y, first_y + count_y)))]
+
+    @staticmethod
+    def _strip_columns(bitmap, columns, rows):
+        # Pixels 'columns' x 'rows' (ranges) of 'bitmap' (PIXEL_OFF, PIXEL_ON or a 2d [x][y] sequence) as packed
+        # column ints (MSB = first row); pixels outside the bitmap are off
+        if isinstance(bitmap, int):
+            return [(1 << len(rows)) - 1 if bitmap == PIXEL_ON else 0] * len(columns)
+        packed = []
+        for x in columns:
+            column = bitmap[x] if 0 <= x < len(bitmap) else ()
+            size = len(column)
+            bits = 0
+            for y in rows:
+                bits = bits << 1 | (1 if 0 <= y < size and column[y] else 0)
+            packed.append(bits)
+        return packed
+
+    def play(self, frames, speed=3):
+        # Run a frame generator (see the *_frames methods) to its end, rendering each frame
+        # speed: 0-9 for practical purposes; speed does not have to integral
+        scheduler = Scheduler()
+        scheduler.add(frames, speed_interval(speed), self)
+        scheduler.run()
 
     def scroll_bitmap(self, bitmap=PIXEL_OFF, direction=DIR_L, speed=3, repeats=0):
         # Scrolls another graphic (2d array, same width and height like display.buffer: (len(display.rows)) x (len(display.columns)) )
-        # to the chosen direction.
+        # to the chosen direction. A bitmap larger than the display is cut to its size, see marquee for long texts
         # repeats=0 gives indefinite scrolling until script is interrupted
         # speed: 0-9 for practical purposes; speed does not have to integral
         # direction: DIR_L, DIR_R, DIR_U, DIR_D
+        self.play(self.scroll_bitmap_frames(bitmap, direction, repeats), speed)
 
-        display = self.display
-        delay = 0.5 ** speed
+    def scroll_bitmap_frames(self, bitmap=PIXEL_OFF, direction=DIR_L, repeats=0):
+        # Frame generator of scroll_bitmap, to be run by a Scheduler; each step draws one frame without rendering it
+        # repeats=0 never ends, cancel the animation to stop it
         if repeats <= 0:
             indef = True
         else:
@@ -266,137 +335,231 @@ class Graphics(object):
         bitmap = self._pad_bitmap(bitmap)
         bitmap_width = len(bitmap)
         bitmap_height = len(bitmap[0])
+        # The incoming edge of every step, packed once: a column, or a row as 1 pixel columns
+        if direction & (DIR_L | DIR_R):
+            packed = Bitmap.from_list(bitmap)
+            edges = [[packed.column(col)] for col in range(bitmap_width)]
+        else:
+            edges = [[1 if bitmap[col][row] else 0 for col in range(bitmap_width)] for row in range(bitmap_height)]
+        if direction not in (DIR_L, DIR_R, DIR_U, DIR_D):
+            # Diagonals: one pixel along both axes per frame, DIR_U moving down like in move
+            dx = -1 if direction & DIR_L else 1 if direction & DIR_R else 0
+            dy = 1 if direction & DIR_U else -1 if direction & DIR_D else 0
+            for frame in self.scroll_vector_frames(bitmap, dx, dy, repeats):
+                yield frame
+            return
         # loop
         while indef or repeats > 0:
             repeats -= 1
             if direction & DIR_L:
-                for col in range(bitmap_width):
-                    graphic = [bitmap[col]]
-                    self.move(0, 0, bitmap_width - 1, bitmap_height - 1, direction, 1, graphic)
-                    self.render()
-                    sleep(delay)
+                steps = range(bitmap_width)
             elif direction & DIR_R:
-                for col in reversed(range(bitmap_width)):
-                    graphic = [bitmap[col]]
-                    self.move(0, 0, bitmap_width - 1, bitmap_height - 1, direction, 1, graphic)
-                    self.render()
-                    sleep(delay)
+                steps = reversed(range(bitmap_width))
             elif direction & DIR_U:
-                for row in reversed(range(bitmap_height)):
-                    graphic = [[0] for x in range(bitmap_width)]
-                    for col in range(bitmap_width):
-                        graphic[col][0] = bitmap[col][row]
-                    self.move(0, 0, bitmap_width - 1, bitmap_height - 1, direction, 1, graphic)
-                    self.render()
-                    sleep(delay)
+                steps = reversed(range(bitmap_height))
             elif direction & DIR_D:
-                for row in range(bitmap_height):
-                    graphic = [[0] for x in range(bitmap_width)]
-                    for col in range(bitmap_width):
-                        graphic[col][0] = bitmap[col][row]
-                    self.move(0, 0, bitmap_width - 1, bitmap_height - 1, direction, 1, graphic)
-                    self.render()
-                    sleep(delay)
-            """elif direction & DIR_LU:
-            
-            elif direction & DIR_RU:
-            
-            elif direction & DIR_LD:
-            
-            elif direction & DIR_RD:"""
+                steps = range(bitmap_height)
+            else:
+                return
+            for step in steps:
+                self.move(0, 0, bitmap_width - 1, bitmap_height - 1, direction, 1, columns=edges[step])
+                yield
+
+    def scroll_vector(self, bitmap=PIXEL_OFF, dx=-1, dy=0, speed=3, repeats=0):
+        # Scrolls another graphic in like scroll_bitmap, along any vector: 'dx' pixel to the right (negative: left)
+        # and 'dy' pixel down (negative: up) per frame. Fractions add up, so dx=-0.5 moves every other frame
+        # repeats=0 gives indefinite scrolling until script is interrupted
+        # speed: 0-9 for practical purposes; speed does not have to integral
+        self.play(self.scroll_vector_frames(bitmap, dx, dy, repeats), speed)
+
+    def scroll_vector_frames(self, bitmap=PIXEL_OFF, dx=-1, dy=0, repeats=0):
+        # Frame generator of scroll_vector, to be run by a Scheduler; each step draws one frame without rendering it
+        # The graphic is tiled beyond the display; a pass lasts until it is in its place again, moved by whole tiles
+        # along both axes. Every frame moves the display once, along both axes at the same time.
+        if not dx and not dy:
+            return
+        framebuffer = self.display.framebuffer
+        width, height = self._size()
+        packed = Bitmap.from_list(self._pad_bitmap(bitmap))
+        columns = [packed.column(x) for x in range(width)]
+        mask = (1 << height) - 1
+        # Imported on first use to keep the import of the library fast
+        from fractions import Fraction
+        rate_x, rate_y = Fraction(dx).limit_denominator(1000), Fraction(dy).limit_denominator(1000)
+        tiles_x, tiles_y = (rate_x / width).denominator, (rate_y / height).denominator
+        frames = tiles_x * tiles_y // gcd(tiles_x, tiles_y)
+        offset_x = offset_y = 0
+        frame = 0
+        while repeats <= 0 or frame < repeats * frames:
+            frame += 1
+            # Whole pixels moved so far, the fractions kept for the next frames
+            total_x, total_y = int(rate_x * frame), int(rate_y * frame)
+            step_x, step_y = total_x - offset_x, total_y - offset_y
+            offset_x, offset_y = total_x, total_y
+            if step_x or step_y:
+                # Display columns at the new offset, rows rotated to where the tiles are cut
+                row = -offset_y % height
+                incoming = []
+                for x in range(width):
+                    bits = columns[(x - offset_x) % width]
+                    incoming.append(((bits << row) | (bits >> (height - row))) & mask)
+                framebuffer.shift_region(0, 0, width, height, step_x, step_y,
+                                         self._vacated(incoming, step_x, step_y, width, height))
+            yield
+
+    @staticmethod
+    def _vacated(columns, dx, dy, width, height):
+        # The incoming argument of a shift_region of the whole display by 'dx'/'dy' from its 'columns' after the move
+        if dx and dy:
+            return columns
+        if dx:
+            distance = min(abs(dx), width)
+            return columns[width - distance:] if dx < 0 else columns[:distance]
+        distance = min(abs(dy), height)
+        return [bits >> (height - distance) for bits in columns] if dy > 0 else \
+            [bits & ((1 << distance) - 1) for bits in columns]
+
+    def marquee(self, source, y=0, speed=3, direction=DIR_L, repeats=1, step=1):
+        # Scroll a text (or a stream of columns) of any length through the 8 pixel high band at row 'y'
+        # speed: 0-9 for practical purposes; speed does not have to integral
+        self.play(self.marquee_frames(source, y, direction, repeats, step), speed)
+
+    def marquee_frames(self, source, y=0, direction=DIR_L, repeats=1, step=1):
+        # Frame generator of marquee, to be run by a Scheduler; each step draws one frame without rendering it
+        # source: a text (drawn in the current font), an 8 pixel high Bitmap, or any iterable of column bytes
+        # (ints, or bytes objects of several columns; top pixel in the MSB)
+        # The columns are produced lazily and enter at the right edge (DIR_R: at the left edge), 'step' per frame;
+        # the band is shifted as whole bytes, and at the end of each pass the message scrolls out completely.
+        # repeats=0 never ends, cancel the animation to stop it; an iterator only runs once
+        framebuffer = self.display.framebuffer
+        right = bool(direction & DIR_R)
+        step = max(1, int(step))
+        pending = b""
+        for chunk in self._marquee_chunks(source, right, repeats):
+            chunk = pending + chunk
+            stop = len(chunk) - len(chunk) % step
+            for start in range(0, stop, step):
+                columns = chunk[start:start + step]
+                framebuffer.shift_columns(columns[::-1] if right else columns, y, right)
+                yield
+            pending = chunk[stop:]
+        if pending:
+            framebuffer.shift_columns(pending[::-1] if right else pending, y, right)
+            yield
+
+    def _marquee_chunks(self, source, right, repeats):
+        # Column bytes of the passes of a marquee in the order they enter the display, each pass followed by
+        # a display width of blank columns; PIXEL_OFF draws them inverted
+        invert = self.draw_mode == PIXEL_OFF
+        blank = (b"\xff" if invert else b"\x00") * len(self.display.columns)
+        once = iter(source) is source
+        passes = 0
+        while repeats <= 0 or passes < repeats:
+            passes += 1
+            for chunk in self._source_columns(source, right):
+                yield chunk.translate(_INVERT_TABLE) if invert else chunk
+            yield blank
+            if once:
+                return
+
+    def _source_columns(self, source, right):
+        if isinstance(source, str):
+            compiled = compile_font(self.font, PIXEL_ON)
+            if self.proportional:
+                glyphs = compiled.proportional(font_metrics(self.font), self.spacing)
+            else:
+                glyphs = [glyph.columns for glyph in compiled.glyphs]
+            for char in (reversed(source) if right else source):
+                yield glyphs[ord(char)][::-1] if right else glyphs[ord(char)]
+        elif isinstance(source, Bitmap):
+            if source.height != 8:
+                raise ValueError("marquee needs an 8 pixel high bitmap, got {0!r}".format(source))
+            yield source.data[::-1] if right else source.data
+        else:
+            for columns in source:
+                columns = bytes((columns,)) if isinstance(columns, int) else bytes(columns)
+                yield columns[::-1] if right else columns
 
     def animate_wipe(self, bitmap=PIXEL_OFF, speed=3, transition=DIR_L):
         # Transition from displayed graphic to another graphic by a 'wipe'
         # speed: 0-9 for practical purposes; speed does not have to integral
         # transition: DIR_U, DIR_D, DIR_L, DIR_R, DIR_RU, DIR_RD, DIR_LU, DIR_LD
-        display = self.display
-        delay = 0.5 ** speed
-        bitmap = self._pad_bitmap(bitmap)
-        maximum = max(len(display.columns), len(display.rows))
-
-        if transition == DIR_L:
-            for col in reversed(display.columns):
-                for row in display.rows:
-                    display.buffer[col][row] = bitmap[col][row]
-                self.render()
-                sleep(delay)
-        elif transition == DIR_R:
-            for col in display.columns:
-                for row in display.rows:
-                    display.buffer[col][row] = bitmap[col][row]
-                self.render()
-                sleep(delay)
-        elif transition == DIR_D:
-            for row in reversed(display.rows):
-                for col in display.columns:
-                    display.buffer[col][row] = bitmap[col][row]
-                self.render()
-                sleep(delay)
-        elif transition == DIR_U:
-            for row in display.rows:
-                for col in display.columns:
-                    display.buffer[col][row] = bitmap[col][row]
-                self.render()
-                sleep(delay)
-        elif transition == DIR_RU:
-            for iter in range(len(display.rows) + len(display.columns) - 1):
-                for stage in range(min(iter + 1,maximum)):
-                    if iter - stage < len(display.columns) and stage < len(display.rows):
-                        display.buffer[iter - stage][stage] = bitmap[iter - stage][stage]
-                self.render()
-                sleep(delay)
-        elif transition == DIR_LD:
-            for iter in reversed(range(len(display.rows) + len(display.columns) - 1)):
-                for stage in range(min(iter + 1, maximum)):
-                    if iter - stage < len(display.columns) and stage < len(display.rows):
-                        display.buffer[iter - stage][stage] = bitmap[iter - stage][stage]
-                self.render()
-                sleep(delay)
-        elif transition == DIR_RD:
-            for iter in range(len(display.rows) + len(display.columns) - 1):
-                for stage in range(min(iter + 1, maximum)):
-                    if len(display.rows)-1 - iter + stage >= 0 and stage < len(display.columns):
-                        display.buffer[stage][len(display.rows)-1 - iter + stage] = bitmap[stage][len(display.rows)-1 - iter + stage]
-                self.render()
-                sleep(delay)
-        elif transition == DIR_LU:
-            for iter in reversed(range(len(display.rows) + len(display.columns) - 1)):
-                for stage in range(min(iter + 1, maximum)):
-                    if len(display.rows)-1 - iter + stage >= 0 and stage < len(display.columns):
-                        display.buffer[stage][len(display.rows)-1 - iter + stage] = bitmap[stage][len(display.rows)-1 - iter + stage]
-                self.render()
-                sleep(delay)
+        self.play(self.wipe_frames(bitmap, transition), speed)
+
+    def wipe_frames(self, bitmap=PIXEL_OFF, transition=DIR_L):
+        # Frame generator of animate_wipe, to be run by a Scheduler; each step draws one frame without rendering it
+        return self.transition_frames(bitmap, transitions.wipe(*self._size(), direction=transition))
+
+    def animate_dissolve(self, bitmap=PIXEL_OFF, speed=3, frames=16, seed=0):
+        # Transition to another graphic in random pixels over 'frames' frames; the pattern only depends on 'seed'
+        self.play(self.transition_frames(bitmap, transitions.dissolve(*self._size(), frames=frames, seed=seed)), speed)
+
+    def animate_iris(self, bitmap=PIXEL_OFF, speed=3, opening=True):
+        # Transition to another graphic in a circle growing from the centre, or shrinking towards it
+        self.play(self.transition_frames(bitmap, transitions.iris(*self._size(), opening=opening)), speed)
+
+    def animate_blinds(self, bitmap=PIXEL_OFF, speed=3, transition=DIR_R, size=8):
+        # Transition to another graphic by a wipe in every slat of 'size' columns (DIR_L, DIR_R) or rows (DIR_U, DIR_D)
+        self.play(self.transition_frames(bitmap, transitions.blinds(*self._size(), direction=transition, size=size)),
+                  speed)
+
+    def transition_frames(self, bitmap, masks):
+        # Frame generator blending from the displayed graphic to 'bitmap' through 'masks' of the transitions module
+        framebuffer = self.display.framebuffer
+        source = type(framebuffer)(framebuffer.width, framebuffer.height)
+        source.load(framebuffer.packed())
+        target = self._framebuffer_of(self._pad_bitmap(bitmap))
+        for mask in masks:
+            framebuffer.blend(source, target, mask)
+            yield
+
+    def animate_slide(self, bitmap=PIXEL_OFF, speed=3, transition=DIR_L):
+        # Transition to another graphic pushing the displayed one out: DIR_L moves both to the left, DIR_U down
+        self.play(self.slide_frames(bitmap, transition), speed)
+
+    def slide_frames(self, bitmap=PIXEL_OFF, transition=DIR_L):
+        # Frame generator of animate_slide, to be run by a Scheduler; each step draws one frame without rendering it
+        framebuffer = self.display.framebuffer
+        width, height = self._size()
+        source = bytes(framebuffer.packed())
+        target = self._framebuffer_of(self._pad_bitmap(bitmap))
+        columns = [target.get_column(x, 0, height) for x in range(width)]
+        if transition in (DIR_L, DIR_R):
+            for step in range(1, width + 1):
+                framebuffer.load(source)
+                if transition == DIR_L:
+                    framebuffer.shift_region(0, 0, width, height, -step, 0, columns[:step])
+                else:
+                    framebuffer.shift_region(0, 0, width, height, step, 0, columns[width - step:])
+                yield
+        elif transition in (DIR_U, DIR_D):
+            for step in range(1, height + 1):
+                framebuffer.load(source)
+                if transition == DIR_U:
+                    incoming = [bits & ((1 << step) - 1) for bits in columns]
+                    framebuffer.shift_region(0, 0, width, height, 0, step, incoming)
+                else:
+                    incoming = [bits >> (height - step) for bits in columns]
+                    framebuffer.shift_region(0, 0, width, height, 0, -step, incoming)
+                yield
 
     def animate_rain(self, bitmap=PIXEL_OFF, speed=3):
         # Sends pixels from top to its position (with random speed for every column)
         # bitmap has to be a 2d array with same width and height like gfx_buffer: len(display.columns) x len(display.rows)
         # speed: 0-9 for practical purposes; speed does not have to integral
+        self.play(self.rain_frames(bitmap), speed)
+
+    def rain_frames(self, bitmap=PIXEL_OFF):
+        # Frame generator of animate_rain, to be run by a Scheduler; each step draws one frame without rendering it
         display = self.display
-        delay = 0.5**speed
+        framebuffer = display.framebuffer
         bitmap = self._pad_bitmap(bitmap)
-        tmp_buffer = [[None for x1 in display.rows] for x2 in display.columns] 
         speeds = [randrange(2,6) for c in display.columns]
 
-        self.clear_display()
-        sleep(delay)
-
-        for iter in display.rows:
-            for l_col in display.columns:
-                emptyCells = [idx for idx,i in enumerate(tmp_buffer[l_col]) if i==None]
-                if emptyCells != []:
-                    firstEmptyCell = emptyCells[0]
-                    for l_row in range(firstEmptyCell, len(display.rows)):
-                        nextNotNone = [idx for idx,i in enumerate(tmp_buffer[l_col]) if (i!=None and idx > l_row)]
-                        if nextNotNone != []:
-                            nxt = min(nextNotNone[0], l_row + speeds[l_col])
-                            if nxt < len(display.rows):
-                                tmp_buffer[l_col][l_row] = tmp_buffer[l_col][nxt]
-                                tmp_buffer[l_col][nxt] = None
-                        elif l_row == len(display.rows)-1:
-                            tmp_buffer[l_col][len(display.rows)-1] = bitmap[l_col][iter]
-            self.clear_display()
-            for col in display.columns:
-                for row in display.rows:
-                    display.buffer[col][row] = 1 if tmp_buffer[col][row] == 1 else 0
-            self.render()
-            sleep(delay)
+        self.clear_buffer()
+        yield
+
+        for columns in effects.rain(bitmap, speeds):
+            for x, bits in enumerate(columns):
+                framebuffer.blit_column(x, 0, bits, len(display.rows))
+            yield
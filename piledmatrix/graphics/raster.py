@@ -0,0 +1,211 @@
+"""Integer rasterizer for lines and shapes
+
+Every function returns the pixels of a shape as runs (x, y, width, height) of whole rectangles, clipped to a
+'width' x 'height' area (the display), to be written with one framebuffer fill_rect per run. No pixel is part
+of two runs, so shapes can be drawn with PIXEL_INVERT as well.
+"""
+
+
+def line(x1, y1, x2, y2, width, height, last=True):
+    # Runs of the straight line from x1/y1 to x2/y2; the end point is left out if 'last' is false
+    # The pixel nearest to the ideal line is taken along the major axis (Bresenham), so a line along x is cut
+    # into horizontal runs and a line along y into vertical ones.
+    dx, dy = x2 - x1, y2 - y1
+    if not last and not dx and not dy:
+        return []
+    if abs(dx) >= abs(dy):
+        runs = _line_runs(x1, y1, dx, dy, width, height, last)
+        return [(x, y, length, 1) for x, y, length in runs]
+    runs = _line_runs(y1, x1, dy, dx, height, width, last)
+    return [(x, y, 1, length) for y, x, length in runs]
+
+
+def _line_runs(a1, b1, da, db, a_size, b_size, last):
+    # Runs (a, b, length) along the major axis 'a' of the line from a1/b1 going da/db; b of a pixel is
+    # b1 + round(db * (a - a1) / da), rounding halves up, in integers
+    if not da:
+        return [(a1, b1, 1)] if 0 <= a1 < a_size and 0 <= b1 < b_size else []
+    step = 1 if da > 0 else -1
+    a2 = a1 + da if last else a1 + da - step
+    start, stop = max(min(a1, a2), 0), min(max(a1, a2), a_size - 1)
+    runs = []
+    run_a, run_b = None, None
+    for a in range(start, stop + 1):
+        b = b1 + (2 * db * (a - a1) + da) // (2 * da)
+        if b != run_b or run_a is None:
+            if run_a is not None and 0 <= run_b < b_size:
+                runs.append((run_a, run_b, a - run_a))
+            run_a, run_b = a, b
+    if run_a is not None and 0 <= run_b < b_size:
+        runs.append((run_a, run_b, stop + 1 - run_a))
+    return runs
+
+
+def _line_pixels(x1, y1, x2, y2, last=True):
+    # All pixels of the line like line() computes them, unclipped
+    dx, dy = x2 - x1, y2 - y1
+    if not dx and not dy:
+        return [(x1, y1)] if last else []
+    if abs(dx) >= abs(dy):
+        step = 1 if dx > 0 else -1
+        stop = x2 + step if last else x2
+        return [(x, y1 + (2 * dy * (x - x1) + dx) // (2 * dx)) for x in range(x1, stop, step)]
+    step = 1 if dy > 0 else -1
+    stop = y2 + step if last else y2
+    return [(x1 + (2 * dx * (y - y1) + dy) // (2 * dy), y) for y in range(y1, stop, step)]
+
+
+def rect(x, y, rect_width, rect_height, width, height, filled=False):
+    # Runs of a rectangle with its upper left corner at x/y, filled or as its one pixel outline
+    if rect_width <= 0 or rect_height <= 0:
+        return []
+    if filled or rect_width <= 2 or rect_height <= 2:
+        return _clip([(x, y, rect_width, rect_height)], width, height)
+    right, bottom = x + rect_width - 1, y + rect_height - 1
+    return _clip([(x, y, rect_width, 1), (x, bottom, rect_width, 1),
+                  (x, y + 1, 1, rect_height - 2), (right, y + 1, 1, rect_height - 2)], width, height)
+
+
+def polyline(points, width, height, closed=False):
+    # Runs of the lines joining 'points' (x, y pairs); a closed polyline also joins the last point to the first
+    # Pixels shared by several lines (corners, crossings) are drawn once
+    points = [point for index, point in enumerate(points) if not index or point != points[index - 1]]
+    if closed and len(points) > 1 and points[-1] == points[0]:
+        points.pop()
+    closed = closed and len(points) > 2
+    if closed:
+        points.append(points[0])
+    runs = []
+    for index in range(len(points) - 1):
+        (x1, y1), (x2, y2) = points[index], points[index + 1]
+        runs.extend(line(x1, y1, x2, y2, width, height, index == len(points) - 2 and not closed))
+    if len(points) == 1:
+        runs = line(points[0][0], points[0][1], points[0][0], points[0][1], width, height)
+    if len(points) > 2:
+        runs = _merge(runs)
+    return runs
+
+
+def circle(cx, cy, radius, width, height, filled=False):
+    # Runs of a circle around cx/cy (midpoint algorithm)
+    if radius < 0:
+        return []
+    # Octant points of the midpoint circle, then the half width of every row
+    half_widths = {}
+    x, y, error = radius, 0, 1 - radius
+    while x >= y:
+        for row, half in ((y, x), (x, y)):
+            if half_widths.get(row, -1) < half:
+                half_widths[row] = half
+        y += 1
+        if error < 0:
+            error += 2 * y + 1
+        else:
+            x -= 1
+            error += 2 * (y - x) + 1
+    return _symmetric_runs(cx, cy, half_widths, width, height, filled)
+
+
+def ellipse(cx, cy, x_radius, y_radius, width, height, filled=False):
+    # Runs of an axis aligned ellipse around cx/cy (Kennedy's integer midpoint algorithm)
+    if x_radius < 0 or y_radius < 0:
+        return []
+    if not x_radius or not y_radius:
+        return rect(cx - x_radius, cy - y_radius, 2 * x_radius + 1, 2 * y_radius + 1, width, height, True)
+    half_widths = {}
+    a2, b2 = x_radius * x_radius, y_radius * y_radius
+    # From the end of the x axis up, while the slope is steep
+    x, y = x_radius, 0
+    x_change, y_change = b2 * (1 - 2 * x_radius), a2
+    error, stop_x, stop_y = 0, 2 * b2 * x_radius, 0
+    while stop_x >= stop_y:
+        half_widths[y] = max(half_widths.get(y, 0), x)
+        y += 1
+        stop_y += 2 * a2
+        error += y_change
+        y_change += 2 * a2
+        if 2 * error + x_change > 0:
+            x -= 1
+            stop_x -= 2 * b2
+            error += x_change
+            x_change += 2 * b2
+    # From the end of the y axis down, while the slope is flat
+    x, y = 0, y_radius
+    x_change, y_change = b2, a2 * (1 - 2 * y_radius)
+    error, stop_x, stop_y = 0, 0, 2 * a2 * y_radius
+    while stop_x <= stop_y:
+        half_widths[y] = max(half_widths.get(y, 0), x)
+        x += 1
+        stop_x += 2 * b2
+        error += x_change
+        x_change += 2 * b2
+        if 2 * error + y_change > 0:
+            y -= 1
+            stop_y -= 2 * a2
+            error += y_change
+            y_change += 2 * a2
+    # Very flat or narrow ellipses can leave a row between the two parts out
+    for row in range(y_radius - 1, -1, -1):
+        if row not in half_widths:
+            half_widths[row] = half_widths[row + 1]
+    return _symmetric_runs(cx, cy, half_widths, width, height, filled)
+
+
+def _symmetric_runs(cx, cy, half_widths, width, height, filled):
+    # Runs of a shape symmetric about cx/cy given the half width of its outline on each row below the centre
+    rows = sorted(half_widths)
+    runs = []
+    for row in rows:
+        half = half_widths[row]
+        if filled:
+            spans = [(cx - half, 2 * half + 1)]
+        else:
+            # Outline pixels between this row's outer edge and the next row's, so steep parts stay connected
+            inner = min(half_widths[row + 1] + 1, half) if row + 1 in half_widths else 0
+            if inner == 0:
+                spans = [(cx - half, 2 * half + 1)]
+            else:
+                spans = [(cx - half, half - inner + 1), (cx + inner, half - inner + 1)]
+        for y in ((cy + row, cy - row) if row else (cy,)):
+            runs.extend((x, y, length, 1) for x, length in spans)
+    return _clip(runs, width, height)
+
+
+def triangle(point1, point2, point3, width, height, filled=True):
+    # Runs of a triangle, filled (every row between its edges, edges included) or as its outline
+    if not filled:
+        return polyline([point1, point2, point3], width, height, closed=True)
+    top = max(min(point1[1], point2[1], point3[1]), 0)
+    bottom = min(max(point1[1], point2[1], point3[1]), height - 1)
+    extents = {}
+    for (x1, y1), (x2, y2) in ((point1, point2), (point2, point3), (point3, point1)):
+        for x, y in _line_pixels(x1, y1, x2, y2):
+            if top <= y <= bottom:
+                left, right = extents.get(y, (x, x))
+                extents[y] = (min(left, x), max(right, x))
+    return _clip([(left, y, right - left + 1, 1) for y, (left, right) in sorted(extents.items())], width, height)
+
+
+def _merge(runs):
+    # Overlapping runs as horizontal runs covering every pixel once
+    pixels = set()
+    for x, y, run_width, run_height in runs:
+        pixels.update((y + row, x + column) for row in range(run_height) for column in range(run_width))
+    merged = []
+    for y, x in sorted(pixels):
+        if merged and merged[-1][1] == y and merged[-1][0] + merged[-1][2] == x:
+            merged[-1][2] += 1
+        else:
+            merged.append([x, y, 1, 1])
+    return [tuple(run) for run in merged]
+
+
+def _clip(runs, width, height):
+    # Runs cut to the 'width' x 'height' area, dropping those entirely outside
+    clipped = []
+    for x, y, run_width, run_height in runs:
+        left, top = max(x, 0), max(y, 0)
+        right, bottom = min(x + run_width, width), min(y + run_height, height)
+        if left < right and top < bottom:
+            clipped.append((left, top, right - left, bottom - top))
+    return clipped
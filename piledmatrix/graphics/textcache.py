@@ -0,0 +1,67 @@
+"""LRU cache of rendered text bitmaps"""
+from collections import OrderedDict
+from threading import Lock
+
+DEFAULT_MAX_BYTES = 64 * 1024
+
+
+class TextCache(object):
+    # Least recently used cache of Bitmap objects, bounded by the total size of their pixel data
+    # hits, misses and evictions count the lookups since creation (or the last reset_stats)
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, render):
+        # Return the bitmap cached for 'key', or render(), cache and return it
+        with self._lock:
+            bitmap = self._entries.get(key)
+            if bitmap is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return bitmap
+            self.misses += 1
+        bitmap = render()
+        if bitmap.nbytes <= self.max_bytes:
+            with self._lock:
+                if key not in self._entries:
+                    self._entries[key] = bitmap
+                    self.size += bitmap.nbytes
+                    self._evict()
+        return bitmap
+
+    def resize(self, max_bytes):
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _evict(self):
+        while self.size > self.max_bytes:
+            _key, bitmap = self._entries.popitem(last=False)
+            self.size -= bitmap.nbytes
+            self.evictions += 1
+
+    def stats(self):
+        return {"entries": len(self._entries), "bytes": self.size, "max_bytes": self.max_bytes,
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+# Shared by all Graphics objects unless they are given their own
+default_text_cache = TextCache()
@@ -0,0 +1,85 @@
+"""Transitions from one picture to another as sequences of masks
+
+A transition is a mask per frame, in the format of PackedFramebuffer.packed() with a bit set for every pixel
+which shows the new picture; the framebuffer's blend draws a frame from the old picture, the new one and the mask.
+The masks are computed once per display size and transition and then taken from a cache.
+"""
+from functools import lru_cache
+from math import sqrt
+from random import Random
+from piledmatrix.directions import DIR_U, DIR_R, DIR_D, DIR_L, DIR_RU, DIR_RD, DIR_LU, DIR_LD
+
+
+@lru_cache(maxsize=64)
+def wipe(width, height, direction=DIR_L):
+    # The new picture is uncovered from one edge (or corner) on, a column, row or diagonal per frame:
+    # DIR_L from the right edge to the left, DIR_U from the top down, DIR_RD from the lower left corner, ...
+    last = width + height - 2
+    ranks = {
+        DIR_R: lambda x, y: x,
+        DIR_L: lambda x, y: width - 1 - x,
+        DIR_U: lambda x, y: y,
+        DIR_D: lambda x, y: height - 1 - y,
+        DIR_RU: lambda x, y: x + y,
+        DIR_LD: lambda x, y: last - x - y,
+        DIR_RD: lambda x, y: x - y + height - 1,
+        DIR_LU: lambda x, y: last - (x - y + height - 1),
+    }.get(direction)
+    if ranks is None:
+        return ()
+    return _masks(width, height, ranks)
+
+
+@lru_cache(maxsize=64)
+def dissolve(width, height, frames=16, seed=0):
+    # The new picture appears in random pixels, about the same number in each of 'frames' frames
+    # The pattern only depends on 'seed'
+    order = list(range(width * height))
+    Random(seed).shuffle(order)
+    ranks = [0] * len(order)
+    for position, pixel in enumerate(order):
+        ranks[pixel] = position * frames // len(order)
+    return _masks(width, height, lambda x, y: ranks[x * height + y])
+
+
+@lru_cache(maxsize=64)
+def iris(width, height, opening=True):
+    # The new picture appears in a circle growing from the centre, or (opening=False) shrinking towards it
+    radius = int(sqrt((width - 1) ** 2 + (height - 1) ** 2) / 2)
+
+    def distance(x, y):
+        return int(sqrt((2 * x - width + 1) ** 2 + (2 * y - height + 1) ** 2) / 2)
+    if opening:
+        return _masks(width, height, distance)
+    return _masks(width, height, lambda x, y: radius - distance(x, y))
+
+
+@lru_cache(maxsize=64)
+def blinds(width, height, direction=DIR_R, size=8):
+    # A wipe within every slat of 'size' columns (DIR_L, DIR_R) or rows (DIR_U, DIR_D) at the same time
+    ranks = {
+        DIR_R: lambda x, y: x % size,
+        DIR_L: lambda x, y: size - 1 - x % size,
+        DIR_U: lambda x, y: y % size,
+        DIR_D: lambda x, y: size - 1 - y % size,
+    }.get(direction)
+    if ranks is None:
+        return ()
+    return _masks(width, height, ranks)
+
+
+def _masks(width, height, rank):
+    # Masks of the frames of a transition in which pixel x/y shows the new picture from frame rank(x, y) on;
+    # frames before the lowest rank would show nothing new (blinds wider than the display) and are left out
+    stride = (height + 7) // 8
+    pixels = {}
+    for x in range(width):
+        for y in range(height):
+            pixels.setdefault(rank(x, y), []).append(((x * stride + (y >> 3)) << 3) | (y & 7))
+    mask = bytearray(width * stride)
+    masks = []
+    for frame in range(min(pixels), max(pixels) + 1) if pixels else ():
+        for bit in pixels.get(frame, ()):
+            mask[bit >> 3] |= 0x80 >> (bit & 7)
+        masks.append(bytes(mask))
+    return tuple(masks)
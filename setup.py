@@ -8,12 +8,16 @@ setup(
     author="Jonayet Hossain",
     author_email="jonayet.bu@gmail.com",
     description="Python library for RaspberryPi for interfacing LED matrix array with MAX7219 chip.",
-    packages=["piledmatrix"],
+    packages=find_packages(exclude=["tests", "tests.*"]),
     zip_safe=False,
     include_package_data=True,
     platforms="raspberry-pi",
     license="MIT",
+    python_requires=">=3.7",
     install_requires=[
 
-    ]
+    ],
+    extras_require={
+        "numpy": ["numpy"],
+    }
 )
\ No newline at end of file
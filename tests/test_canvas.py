@@ -0,0 +1,111 @@
+"""Canvas viewports against windows cut out of a plain [x][y] list of pixels"""
+from random import Random
+
+import pytest
+
+from piledmatrix.driver import DisplayUnit, PackedFramebuffer
+from piledmatrix.driver.simulator import SimulatedTransport
+from piledmatrix.font import get_font
+from piledmatrix.graphics import Graphics
+from piledmatrix.graphics.canvas import Canvas
+
+
+def random_pixels(random, width, height):
+    return [[random.randrange(2) for _y in range(height)] for _x in range(width)]
+
+
+def packed_pixels(pixels, height):
+    # The pixels in the wire format: column by column, 8 rows per byte, the top row in the MSB
+    stride = (height + 7) // 8
+    data = bytearray(len(pixels) * stride)
+    for x, column in enumerate(pixels):
+        for y, pixel in enumerate(column):
+            if pixel:
+                data[x * stride + y // 8] |= 0x80 >> (y % 8)
+    return bytes(data)
+
+
+def chip_digits(transport):
+    return [transport.digits(position) for position in range(len(transport.chips))]
+
+
+def simulated_display(blocks_per_row, blocks_per_column, framebuffer):
+    if framebuffer == "numpy":
+        pytest.importorskip("numpy")
+        from piledmatrix.driver.npframebuffer import NumpyFramebuffer as framebuffer_class
+    else:
+        framebuffer_class = PackedFramebuffer
+    transport = SimulatedTransport()
+    display = DisplayUnit(blocks_per_row, blocks_per_column, framebuffer=framebuffer_class, transport=transport)
+    display.init()
+    return display, transport
+
+
+@pytest.mark.parametrize("framebuffer", ["packed", "numpy"])
+@pytest.mark.parametrize("blocks_per_row, blocks_per_column, width, height", [
+    (1, 1, 8, 8), (1, 1, 30, 21), (4, 1, 100, 8), (2, 2, 37, 45)])
+def test_viewport(framebuffer, blocks_per_row, blocks_per_column, width, height):
+    random = Random(width * height)
+    display, transport = simulated_display(blocks_per_row, blocks_per_column, framebuffer)
+    # The chips of a display showing the window itself
+    reference, reference_transport = simulated_display(blocks_per_row, blocks_per_column, "packed")
+    display_width, display_height = blocks_per_row * 8, blocks_per_column * 8
+    canvas = Canvas(display, width, height)
+    pixels = random_pixels(random, width, height)
+    canvas.framebuffer.blit_bitmap(0, 0, pixels)
+    for _pan in range(20):
+        x, y = random.randrange(-5, width + 5), random.randrange(-5, height + 5)
+        canvas.pan_to(x, y)
+        # The viewport is kept inside the canvas
+        assert canvas.x == max(0, min(x, width - display_width))
+        assert canvas.y == max(0, min(y, height - display_height))
+        window = [column[canvas.y:canvas.y + display_height] for column in pixels[canvas.x:canvas.x + display_width]]
+        assert bytes(canvas.window()) == packed_pixels(window, display_height)
+        canvas.send_buffer(random.choice(["full", "delta", "dense"]))
+        reference.framebuffer.load(packed_pixels(window, display_height))
+        reference.send_buffer()
+        assert chip_digits(transport) == chip_digits(reference_transport)
+    # The display's own framebuffer is left alone
+    assert bytes(display.framebuffer.packed()) == bytes(len(display.framebuffer.packed()))
+
+
+def test_canvas_is_at_least_as_large_as_the_display():
+    display, _transport = simulated_display(4, 1, "packed")
+    canvas = Canvas(display, 10, 4, x=5, y=5)
+    assert (canvas.framebuffer.width, canvas.framebuffer.height) == (32, 8)
+    assert (canvas.x, canvas.y) == (0, 0)
+    assert len(canvas.columns) == 32 and len(canvas.rows) == 8
+
+
+def test_pan_frames():
+    display, _transport = simulated_display(1, 1, "packed")
+    canvas = Canvas(display, 40, 20)
+    positions = [(canvas.x, canvas.y) for _frame in canvas.pan_frames(10, 4, 3)]
+    assert positions == [(3, 3), (6, 4), (9, 4), (10, 4)]
+    positions = [(canvas.x, canvas.y) for _frame in canvas.pan_frames(0, 0, 4)]
+    assert positions == [(6, 0), (2, 0), (0, 0)]
+    # A target outside the canvas stops at its edge
+    positions = [(canvas.x, canvas.y) for _frame in canvas.pan_frames(100, 0, 10)]
+    assert positions == [(10, 0), (20, 0), (30, 0), (32, 0)]
+    assert list(canvas.pan_frames(32, 0)) == []
+
+
+def test_graphics_draws_the_whole_canvas_and_renders_the_viewport():
+    display, transport = simulated_display(2, 1, "packed")
+    canvas = Canvas(display, 64, 16)
+    gfx = Graphics(canvas)
+    gfx.draw_string(0, 8, "ABCDEFGH")
+    gfx.draw_line(0, 0, 63, 0)
+    reference = PackedFramebuffer(64, 16)
+    reference.blit_columns(0, 8, b"".join(bytes(get_font()[ord(char)]) for char in "ABCDEFGH"))
+    reference.fill_rect(0, 0, 64, 1)
+    assert bytes(canvas.framebuffer.packed()) == bytes(reference.packed())
+    canvas.pan_to(24, 8)
+    gfx.render("delta")
+    assert [transport.digits(position) for position in range(2)] == \
+        [bytes(reference.window(24 + 8 * block, 8, 8, 8)) for block in range(2)]
+    data = canvas.frame_data()
+    canvas.pan_to(0, 0)
+    canvas.send_buffer("full", data)
+    assert [transport.digits(position) for position in range(2)] == \
+        [bytes(reference.window(24 + 8 * block, 8, 8, 8)) for block in range(2)]
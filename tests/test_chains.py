@@ -0,0 +1,104 @@
+"""Displays split over several chains, flushed in parallel, checked on simulated MAX7219 cascades"""
+import threading
+from random import Random
+
+import pytest
+
+from piledmatrix.driver import Chain, DisplayUnit
+from piledmatrix.driver.simulator import SimulatedTransport
+
+
+class ThreadRecordingTransport(SimulatedTransport):
+    # Remembers the threads the frames were transmitted from
+
+    def __init__(self, **kwargs):
+        SimulatedTransport.__init__(self, **kwargs)
+        self.threads = set()
+
+    def send_segments(self, frame, segments):
+        self.threads.add(threading.current_thread().name)
+        SimulatedTransport.send_segments(self, frame, segments)
+
+
+def expected_digits(display, block):
+    # Digit registers of 'block' in the default wiring: its 8 columns, the top pixel in the MSB
+    pixels = display.framebuffer.to_list()
+    left = block // display.blocks_per_column * 8
+    top = block % display.blocks_per_column * 8
+    return bytes(bytearray(sum((1 if pixels[left + digit][top + row] else 0) << (7 - row) for row in range(8))
+                           for digit in range(8)))
+
+
+def chip_digits(display):
+    # Digit registers of every block as the simulated chips hold them
+    digits = []
+    for chain in display.chains:
+        digits += [chain.transport.digits(position) for position in range(len(chain.blocks))]
+    return digits
+
+
+def random_frame(display, random):
+    for x in display.columns:
+        for y in display.rows:
+            display.framebuffer.set_pixel(x, y, random.random() < 0.5)
+
+
+@pytest.mark.parametrize("blocks_per_row, blocks_per_column, sizes", [(4, 1, (2, 2)), (2, 2, (1, 3)),
+                                                                       (4, 2, (3, 2, 3))])
+@pytest.mark.parametrize("mode", ["full", "delta", "dense"])
+def test_every_chain_gets_its_blocks(blocks_per_row, blocks_per_column, sizes, mode):
+    chains = [Chain(blocks=size, transport=SimulatedTransport()) for size in sizes]
+    display = DisplayUnit(blocks_per_row, blocks_per_column, chains=chains)
+    display.init()
+    random = Random(4)
+    for _frame in range(5):
+        random_frame(display, random)
+        display.send_buffer(mode)
+        assert chip_digits(display) == [expected_digits(display, block) for block in display.blocks]
+    display.release()
+
+
+def test_chains_are_flushed_from_worker_threads():
+    chains = [Chain(blocks=2, transport=ThreadRecordingTransport()) for _chain in range(3)]
+    display = DisplayUnit(6, 1, chains=chains)
+    display.init()
+    display.framebuffer.fill(1)
+    display.send_buffer()
+    for chain in chains:
+        assert chain.transport.threads
+        assert threading.current_thread().name not in chain.transport.threads
+    display.release()
+
+
+def test_single_chain_is_flushed_directly():
+    transport = ThreadRecordingTransport()
+    display = DisplayUnit(4, 1, transport=transport)
+    display.init()
+    display.send_buffer()
+    assert transport.threads == {threading.current_thread().name}
+    assert display._executor is None
+    display.release()
+
+
+def test_last_chain_takes_the_remaining_blocks():
+    chains = [Chain(blocks=3, transport=SimulatedTransport()), Chain(transport=SimulatedTransport())]
+    DisplayUnit(4, 2, chains=chains)
+    assert list(chains[0].blocks) == [0, 1, 2]
+    assert list(chains[1].blocks) == [3, 4, 5, 6, 7]
+
+
+@pytest.mark.parametrize("sizes", [(3, 3), (2, 1), (0, 4)])
+def test_chains_have_to_cover_the_display(sizes):
+    chains = [Chain(blocks=size, transport=SimulatedTransport()) for size in sizes]
+    with pytest.raises(ValueError):
+        DisplayUnit(4, 1, chains=chains)
+
+
+def test_send_to_reaches_the_chip_of_its_chain():
+    chains = [Chain(blocks=2, transport=SimulatedTransport()), Chain(blocks=2, transport=SimulatedTransport())]
+    display = DisplayUnit(4, 1, chains=chains)
+    display.init()
+    display.send_to(3, 0x1, 0xA5)
+    assert chains[1].transport.digits(1)[0] == 0xA5
+    assert all(digits == bytes(8) for digits in chip_digits(display)[:3])
+    display.release()
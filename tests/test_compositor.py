@@ -0,0 +1,130 @@
+"""Compositor layers against a plain [x][y] list of pixels composed layer by layer"""
+from random import Random
+
+import pytest
+
+from piledmatrix.driver import DisplayUnit
+from piledmatrix.driver.framebuffer import PIXEL_OFF, PIXEL_ON, PIXEL_INVERT
+from piledmatrix.driver.simulator import SimulatedTransport
+from piledmatrix.graphics import Graphics
+from piledmatrix.graphics.compositor import Compositor, LAYER_MASK
+
+MODES = [PIXEL_ON, PIXEL_OFF, PIXEL_INVERT, LAYER_MASK]
+
+
+def random_pixels(random, width, height):
+    return [[random.randrange(2) for _y in range(height)] for _x in range(width)]
+
+
+def simulated_compositor(blocks_per_row, blocks_per_column, send_mode="delta"):
+    transport = SimulatedTransport()
+    display = DisplayUnit(blocks_per_row, blocks_per_column, transport=transport)
+    display.init()
+    transport.reset()
+    return Compositor(display, send_mode), transport
+
+
+def pixels_of(display):
+    return [[1 if pixel else 0 for pixel in column] for column in display.framebuffer.to_list()]
+
+
+def composed(width, height, layers):
+    # The reference of compose: (pixels, mask, x, y, mode, visible) of every layer from the bottom up
+    result = [[0] * height for _x in range(width)]
+    for pixels, mask, x, y, mode, visible in layers:
+        if not visible:
+            continue
+        for layer_x, column in enumerate(pixels):
+            for layer_y, pixel in enumerate(column):
+                if not (0 <= x + layer_x < width and 0 <= y + layer_y < height):
+                    continue
+                if mode == PIXEL_ON:
+                    result[x + layer_x][y + layer_y] |= pixel
+                elif mode == PIXEL_OFF:
+                    result[x + layer_x][y + layer_y] &= 1 - pixel
+                elif mode == PIXEL_INVERT:
+                    result[x + layer_x][y + layer_y] ^= pixel
+                elif mask is None or mask[layer_x][layer_y]:
+                    result[x + layer_x][y + layer_y] = pixel
+    return result
+
+
+@pytest.mark.parametrize("blocks_per_row, blocks_per_column", [(1, 1), (4, 1), (3, 2)])
+def test_layers_are_composed_bottom_up(blocks_per_row, blocks_per_column):
+    random = Random(blocks_per_row * 10 + blocks_per_column)
+    width, height = blocks_per_row * 8, blocks_per_column * 8
+    compositor, _transport = simulated_compositor(blocks_per_row, blocks_per_column)
+    layers = {}
+    for name in range(6):
+        layer_width, layer_height = random.randrange(1, width + 6), random.randrange(1, height + 6)
+        x, y = random.randrange(-5, width), random.randrange(-5, height)
+        mode = random.choice(MODES)
+        pixels = random_pixels(random, layer_width, layer_height)
+        layer = compositor.add_sprite(name, pixels, x=x, y=y, z=random.randrange(3), mode=mode)
+        mask = None
+        if mode == LAYER_MASK and random.random() < 0.5:
+            mask = random_pixels(random, layer_width, layer_height)
+            layer.set_mask(mask)
+        layers[name] = [pixels, mask, x, y, mode, True]
+    for _change in range(20):
+        compositor.render()
+        expected = composed(width, height, [layers[layer.name] for layer in compositor])
+        assert pixels_of(compositor.display) == expected
+        # Change one layer: its pixels, offset or visibility
+        layer = compositor[random.randrange(6)]
+        change = random.randrange(3)
+        if change == 0:
+            x, y = random.randrange(layer.framebuffer.width), random.randrange(layer.framebuffer.height)
+            layer.framebuffer.invert_pixel(x, y)
+            layers[layer.name][0][x][y] ^= 1
+        elif change == 1:
+            layer.move_to(random.randrange(-5, width), random.randrange(-5, height))
+            layers[layer.name][2:4] = [layer.x, layer.y]
+        else:
+            layer.visible = not layer.visible
+            layers[layer.name][5] = layer.visible
+
+
+def test_layers_of_the_same_z_keep_the_order_they_were_added():
+    compositor, _transport = simulated_compositor(1, 1)
+    compositor.add_sprite("on", [[1] * 8] * 8, z=0)
+    compositor.add_sprite("off", [[1] * 4] * 8, z=0, mode=PIXEL_OFF)
+    compositor.render()
+    assert pixels_of(compositor.display) == [[0] * 4 + [1] * 4] * 8
+    compositor.add_layer("on", z=0)
+    compositor.render()
+    assert [layer.name for layer in compositor] == ["off", "on"]
+    assert pixels_of(compositor.display) == [[0] * 8] * 8
+
+
+def test_graphics_of_a_layer_renders_the_composition():
+    compositor, transport = simulated_compositor(4, 1)
+    Graphics(compositor.add_layer("text")).draw_string(0, 0, "AB")
+    compositor.add_sprite("bar", [[1] * 8] * 3, x=10, mode=PIXEL_INVERT)
+    Graphics(compositor["text"]).render()
+    assert transport.digits(1) == bytes(compositor.display.framebuffer.packed()[8:16])
+    assert compositor.display.framebuffer.get_pixel(11, 7) != compositor["text"].framebuffer.get_pixel(11, 7)
+
+
+def test_an_explicit_mode_wins_over_the_send_mode():
+    compositor, transport = simulated_compositor(4, 1)
+    compositor.add_sprite("dot", [[1]], x=9)
+    compositor.render()
+    transport.reset()
+    compositor["dot"].move_to(9, 1)
+    # send_mode "delta" for the renders without a mode: one digit row
+    compositor.render()
+    assert transport.transaction_count == 1
+    transport.reset()
+    compositor.render("full")
+    assert transport.transaction_count == 8
+    transport.reset()
+    compositor["dot"].move_to(9, 2)
+    Graphics(compositor["dot"]).render()
+    assert transport.transaction_count == 1
+    transport.reset()
+    Graphics(compositor["dot"]).render("full")
+    assert transport.transaction_count == 8
+    transport.reset()
+    compositor.send_buffer("full", compositor.frame_data())
+    assert transport.transaction_count == 8
@@ -0,0 +1,149 @@
+"""Double buffered displays: frames handed to the flush thread, coalesced while it is busy"""
+import asyncio
+import threading
+
+import pytest
+
+from piledmatrix.driver import DisplayUnit
+from piledmatrix.driver.simulator import SimulatedTransport
+from piledmatrix.graphics import Graphics, aio
+
+TIMEOUT = 5.0
+
+
+class GatedTransport(SimulatedTransport):
+    # Holds every frame transmission until 'gate' is set; 'entered' is set when one is waiting
+
+    def __init__(self, **kwargs):
+        SimulatedTransport.__init__(self, **kwargs)
+        self.gate = threading.Event()
+        self.gate.set()
+        self.entered = threading.Event()
+        self.frames = []
+        self.threads = set()
+        self.error = None
+
+    def send_segments(self, frame, segments):
+        self.threads.add(threading.current_thread().name)
+        self.entered.set()
+        assert self.gate.wait(TIMEOUT)
+        if self.error is not None:
+            raise self.error
+        SimulatedTransport.send_segments(self, frame, segments)
+        self.frames.append([self.digits(position) for position in range(len(self.chips))])
+
+
+def double_buffered_display():
+    transport = GatedTransport()
+    display = DisplayUnit(4, 1, transport=transport, double_buffered=True)
+    display.init()
+    return display, transport
+
+
+def expected_chips(data):
+    # Digit registers of the 4 x 1 blocks of the framebuffer bytes 'data'
+    return [bytes(data[block * 8:block * 8 + 8]) for block in range(4)]
+
+
+def test_frames_waiting_for_the_flush_thread_are_coalesced():
+    display, transport = double_buffered_display()
+    try:
+        transport.gate.clear()
+        display.framebuffer.fill(1)
+        display.send_buffer("delta")
+        assert transport.entered.wait(TIMEOUT)
+        # The flush thread is busy with the first frame, the next ones replace each other in the front buffer
+        sent = []
+        for x in range(5):
+            display.framebuffer.clear()
+            display.framebuffer.set_pixel(x * 3, 0, 1)
+            display.send_buffer("delta")
+            sent.append(bytes(display.framebuffer.packed()))
+        transport.gate.set()
+        display.wait_flushed()
+        assert len(transport.frames) == 2
+        assert transport.frames[0] == [b"\xff" * 8] * 4
+        assert transport.frames[-1] == expected_chips(sent[-1])
+    finally:
+        transport.gate.set()
+        display.release()
+
+
+def test_drawing_goes_on_while_a_frame_is_transmitted():
+    display, transport = double_buffered_display()
+    try:
+        transport.gate.clear()
+        display.framebuffer.fill(1)
+        display.send_buffer()
+        assert transport.entered.wait(TIMEOUT)
+        # The flush thread sends the snapshot, not what is drawn afterwards
+        display.framebuffer.clear()
+        transport.gate.set()
+        display.wait_flushed()
+        assert [transport.digits(position) for position in range(4)] == [b"\xff" * 8] * 4
+    finally:
+        transport.gate.set()
+        display.release()
+
+
+def test_a_coalesced_full_frame_stays_full():
+    display, transport = double_buffered_display()
+    try:
+        display.send_buffer()
+        display.wait_flushed()
+        transport.gate.clear()
+        transport.entered.clear()
+        display.framebuffer.set_pixel(0, 0, 1)
+        display.send_buffer("delta")
+        assert transport.entered.wait(TIMEOUT)
+        transport.reset()
+        display.send_buffer("full")
+        display.framebuffer.set_pixel(9, 0, 1)
+        display.send_buffer("delta")
+        transport.gate.set()
+        display.wait_flushed()
+        # The delta frame replaced a full one, so all 8 digit rows went out
+        assert transport.transaction_count == 1 + 8
+    finally:
+        transport.gate.set()
+        display.release()
+
+
+def test_flush_errors_are_raised_in_the_drawing_thread():
+    display, transport = double_buffered_display()
+    try:
+        transport.error = IOError("bus error")
+        display.send_buffer()
+        with pytest.raises(IOError):
+            display.wait_flushed()
+        transport.error = None
+        display.send_buffer()
+        display.wait_flushed()
+    finally:
+        display.release()
+
+
+def test_release_sends_the_last_frame():
+    display, transport = double_buffered_display()
+    display.framebuffer.fill(1)
+    display.send_buffer()
+    display.release()
+    assert [transport.digits(position) for position in range(4)] == [b"\xff" * 8] * 4
+
+
+def test_asyncio_renders_go_through_the_flush_thread():
+    display, transport = double_buffered_display()
+    gfx = Graphics(display)
+    try:
+        gfx.draw_string(0, 0, "AB")
+
+        async def render_twice():
+            await aio.render(gfx, "delta")
+            gfx.draw_string(16, 0, "CD")
+            await aio.render(gfx, "delta")
+        asyncio.run(render_twice())
+        display.wait_flushed()
+        assert transport.frames[-1] == expected_chips(bytes(display.framebuffer.packed()))
+        assert transport.threads == {"piledmatrix-flush"}
+    finally:
+        display.release()
@@ -0,0 +1,76 @@
+"""The rain effect against a cell by cell simulation of the drops on [x][y] lists"""
+import random as module_random
+from random import Random
+
+import pytest
+
+from piledmatrix.driver import DisplayUnit
+from piledmatrix.driver.simulator import RecordingTransport
+from piledmatrix.graphics import Graphics, effects
+
+
+def random_pixels(random, width, height):
+    return [[random.randrange(2) for _y in range(height)] for _x in range(width)]
+
+
+def simulated_rain(bitmap, speeds):
+    # The reference of the rain: the pictures of every step, each drop looked up by searching the column
+    width, height = len(bitmap), len(bitmap[0])
+    cells = [[None] * height for _x in range(width)]
+    frames = []
+    for step in range(height):
+        for x in range(width):
+            column = cells[x]
+            if None not in column:
+                continue
+            for row in range(column.index(None), height):
+                below = [index for index in range(row + 1, height) if column[index] is not None]
+                if below:
+                    source = min(below[0], row + speeds[x])
+                    column[row] = column[source]
+                    column[source] = None
+                elif row == height - 1:
+                    column[row] = bitmap[x][step]
+        frames.append([[1 if cell == 1 else 0 for cell in column] for column in cells])
+    return frames
+
+
+def column_pixels(bits, height):
+    return [(bits >> (height - 1 - row)) & 1 for row in range(height)]
+
+
+@pytest.mark.parametrize("width, height", [(1, 1), (8, 8), (16, 8), (5, 24)])
+def test_rain(width, height):
+    random = Random(width * height)
+    for _rain in range(5):
+        bitmap = random_pixels(random, width, height)
+        speeds = [random.randrange(1, 7) for _x in range(width)]
+        frames = [[column_pixels(bits, height) for bits in columns] for columns in effects.rain(bitmap, speeds)]
+        assert frames == simulated_rain(bitmap, speeds)
+
+
+def test_rain_ends_with_the_picture():
+    bitmap = random_pixels(Random(1), 16, 16)
+    frames = list(effects.rain(bitmap, [5] * 16))
+    assert len(frames) == 16
+    # Drops rising 5 rows a step reach the top in time
+    assert [column_pixels(bits, 16) for bits in frames[-1]] == bitmap
+    assert list(effects.rain([], [])) == []
+
+
+def test_rain_frames():
+    bitmap = random_pixels(Random(2), 24, 16)
+    display = DisplayUnit(3, 2, transport=RecordingTransport())
+    display.framebuffer.fill(1)
+    gfx = Graphics(display)
+    module_random.seed(3)
+    speeds = [module_random.randrange(2, 6) for _x in range(24)]
+    module_random.seed(3)
+    frames = gfx.rain_frames(bitmap)
+    next(frames)
+    assert display.framebuffer.to_list() == [[0] * 16] * 24
+    expected = simulated_rain(bitmap, speeds)
+    for index, _frame in enumerate(frames):
+        assert [[1 if pixel else 0 for pixel in column] for column in display.framebuffer.to_list()] == \
+            expected[index]
+    assert index == 15
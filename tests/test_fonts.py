@@ -0,0 +1,147 @@
+"""The font registry and the PSF/BDF loader against glyphs given as lists of pixel rows"""
+import gzip
+import struct
+import subprocess
+import sys
+from random import Random
+
+import pytest
+
+from piledmatrix.font import Font, font_names, get_font, load_font_file, register_font
+from piledmatrix.font.loader import parse_bdf, parse_psf
+
+
+def random_glyphs(random, count, width, height):
+    # Glyphs as [y][x] lists of pixels
+    return [[[random.randrange(2) for _x in range(width)] for _y in range(height)] for _code in range(count)]
+
+
+def cell_columns(glyph, left=0, top=0):
+    # Column bytes of 'glyph' placed at 'left'/'top' in the 8x8 cell, cut to it
+    columns = bytearray(8)
+    for y, row in enumerate(glyph):
+        for x, pixel in enumerate(row):
+            if pixel and 0 <= left + x < 8 and 0 <= top + y < 8:
+                columns[left + x] |= 0x80 >> (top + y)
+    return bytes(columns)
+
+
+def row_bytes(row):
+    # A row of pixels as big endian bytes, the leftmost pixel in the MSB of the first byte
+    length = (len(row) + 7) // 8
+    bits = sum(pixel << (length * 8 - 1 - x) for x, pixel in enumerate(row))
+    return bits.to_bytes(length, "big")
+
+
+def psf1(glyphs, height):
+    data = b"\x36\x04" + struct.pack("<BB", 0x01 if len(glyphs) == 512 else 0, height)
+    return data + b"".join(row_bytes(row) for glyph in glyphs for row in glyph)
+
+
+def psf2(glyphs, width, height):
+    glyph_size = height * ((width + 7) // 8)
+    data = b"\x72\xb5\x4a\x86" + struct.pack("<7I", 0, 32, 0, len(glyphs), glyph_size, height, width)
+    return data + b"".join(row_bytes(row) for glyph in glyphs for row in glyph)
+
+
+@pytest.mark.parametrize("count, height", [(256, 8), (256, 16), (512, 6)])
+def test_psf1(count, height):
+    glyphs = random_glyphs(Random(count + height), count, 8, height)
+    font = parse_psf(psf1(glyphs, height), "psf1")
+    assert font.name == "psf1"
+    assert [bytes(font[code]) for code in range(256)] == [cell_columns(glyph) for glyph in glyphs[:256]]
+
+
+@pytest.mark.parametrize("count, width, height", [(256, 8, 8), (300, 5, 7), (256, 10, 12), (100, 16, 4)])
+def test_psf2(count, width, height):
+    glyphs = random_glyphs(Random(count + width + height), count, width, height)
+    font = parse_psf(psf2(glyphs, width, height))
+    expected = [cell_columns(glyph) for glyph in glyphs[:256]] + [bytes(8)] * (256 - count)
+    assert [bytes(font[code]) for code in range(256)] == expected
+
+
+def test_psf_errors():
+    with pytest.raises(ValueError):
+        parse_psf(b"not a font")
+    with pytest.raises(ValueError):
+        parse_psf(psf1(random_glyphs(Random(1), 256, 8, 8), 8)[:1000])
+
+
+def bdf(glyphs, font_box):
+    # BDF text of (code, glyph, x offset, y offset) glyphs on the font bounding box (width, height, x, y)
+    lines = ["STARTFONT 2.1", "FONT test", "FONTBOUNDINGBOX {0} {1} {2} {3}".format(*font_box),
+             "CHARS {0}".format(len(glyphs))]
+    for code, glyph, x_offset, y_offset in glyphs:
+        lines += ["STARTCHAR c{0}".format(code), "ENCODING {0}".format(code),
+                  "BBX {0} {1} {2} {3}".format(len(glyph[0]), len(glyph), x_offset, y_offset), "BITMAP"]
+        lines += [row_bytes(row).hex().upper() for row in glyph]
+        lines.append("ENDCHAR")
+    return "\n".join(lines + ["ENDFONT", ""])
+
+
+@pytest.mark.parametrize("font_box", [(8, 8, 0, -1), (6, 10, -1, -2), (12, 12, 0, 0)])
+def test_bdf_glyphs_are_placed_on_the_font_box(font_box):
+    random = Random(sum(font_box))
+    glyphs = []
+    for code in random.sample(range(300), 60):
+        width, height = random.randrange(1, font_box[0] + 1), random.randrange(1, font_box[1] + 1)
+        x_offset = font_box[2] + random.randrange(font_box[0] - width + 1)
+        y_offset = font_box[3] + random.randrange(font_box[1] - height + 1)
+        glyphs.append((code, random_glyphs(random, 1, width, height)[0], x_offset, y_offset))
+    font = parse_bdf(bdf(glyphs, font_box))
+    expected = [bytes(8)] * 256
+    for code, glyph, x_offset, y_offset in glyphs:
+        if code < 256:
+            top = font_box[1] + font_box[3] - (y_offset + len(glyph))
+            expected[code] = cell_columns(glyph, x_offset - font_box[2], top)
+    assert [bytes(font[code]) for code in range(256)] == expected
+
+
+def test_load_font_file(tmp_path):
+    glyphs = random_glyphs(Random(2), 256, 8, 8)
+    psf_path = tmp_path / "small.psf.gz"
+    with gzip.open(str(psf_path), "wb") as font_file:
+        font_file.write(psf2(glyphs, 8, 8))
+    font = load_font_file(str(psf_path))
+    assert font.name == "small"
+    assert [bytes(font[code]) for code in range(256)] == [cell_columns(glyph) for glyph in glyphs]
+    bdf_path = tmp_path / "other.bdf"
+    bdf_path.write_text(bdf([(65, glyphs[0], 0, -1)], (8, 8, 0, -1)))
+    assert bytes(load_font_file(str(bdf_path), "bdf")[65]) == cell_columns(glyphs[0])
+    text_path = tmp_path / "text.txt"
+    text_path.write_text("hello")
+    with pytest.raises(ValueError):
+        load_font_file(str(text_path))
+
+
+def test_registered_fonts_are_loaded_on_first_use():
+    calls = []
+    data = bytes(Random(3).getrandbits(8) for _byte in range(2048))
+
+    def load():
+        calls.append(1)
+        return Font("lazy", data)
+    register_font("test-lazy", load)
+    assert calls == []
+    assert "test-lazy" in font_names()
+    font = get_font("test-lazy")
+    assert get_font("test-lazy") is font
+    assert calls == [1]
+    assert font.data == data
+    register_font("test-list", [[0x80 + code % 0x80] * 8 for code in range(256)])
+    assert bytes(get_font("test-list")[3]) == b"\x83" * 8
+    with pytest.raises(KeyError):
+        get_font("no such font")
+
+
+def test_builtin_fonts_are_imported_on_first_access():
+    script = "\n".join([
+        "import sys",
+        "import piledmatrix.font as font",
+        "builtin = ['piledmatrix.font.' + name for name in ('cp437', 'lcd', 'sinclairs', 'tiny', 'loader')]",
+        "assert not [name for name in builtin if name in sys.modules]",
+        "assert len(font.LCD_FONT.data) == 2048",
+        "assert 'piledmatrix.font.lcd' in sys.modules and 'piledmatrix.font.tiny' not in sys.modules",
+        "assert font.DEFAULT_FONT is font.get_font('cp437')",
+    ])
+    subprocess.check_call([sys.executable, "-c", script])
@@ -0,0 +1,207 @@
+"""The framebuffers against a plain [x][y] list of pixels"""
+from random import Random
+
+import pytest
+
+from piledmatrix.driver.framebuffer import PIXEL_OFF, PIXEL_ON, PIXEL_INVERT, PackedFramebuffer
+
+
+def numpy_framebuffer(width, height):
+    pytest.importorskip("numpy")
+    from piledmatrix.driver.npframebuffer import NumpyFramebuffer
+    return NumpyFramebuffer(width, height)
+
+
+FRAMEBUFFERS = [PackedFramebuffer, numpy_framebuffer]
+SIZES = [(8, 8), (16, 13), (24, 24)]
+
+
+def random_pixels(random, width, height):
+    return [[random.randrange(2) for _y in range(height)] for _x in range(width)]
+
+
+def load_pixels(framebuffer, pixels):
+    for x, column in enumerate(pixels):
+        for y, pixel in enumerate(column):
+            framebuffer.set_pixel(x, y, pixel)
+
+
+def packed_pixels(pixels, height):
+    # The pixels in the wire format: column by column, 8 rows per byte, the top row in the MSB
+    stride = (height + 7) // 8
+    data = bytearray(len(pixels) * stride)
+    for x, column in enumerate(pixels):
+        for y, pixel in enumerate(column):
+            if pixel:
+                data[x * stride + y // 8] |= 0x80 >> (y % 8)
+    return bytes(data)
+
+
+def apply(pixels, x, y, mode):
+    if mode == PIXEL_ON:
+        pixels[x][y] = 1
+    elif mode == PIXEL_OFF:
+        pixels[x][y] = 0
+    else:
+        pixels[x][y] ^= 1
+
+
+@pytest.fixture(params=FRAMEBUFFERS, ids=["packed", "numpy"])
+def framebuffer_class(request):
+    return request.param
+
+
+@pytest.mark.parametrize("width, height", SIZES)
+def test_pixels_and_packed_format(framebuffer_class, width, height):
+    random = Random(1)
+    framebuffer = framebuffer_class(width, height)
+    pixels = random_pixels(random, width, height)
+    load_pixels(framebuffer, pixels)
+    assert [[1 if pixel else 0 for pixel in column] for column in framebuffer.to_list()] == pixels
+    assert bytes(framebuffer.packed()) == packed_pixels(pixels, height)
+    for _pixel in range(50):
+        x, y = random.randrange(width), random.randrange(height)
+        framebuffer.invert_pixel(x, y)
+        pixels[x][y] ^= 1
+        assert framebuffer.get_pixel(x, y) == pixels[x][y]
+    assert bytes(framebuffer.packed()) == packed_pixels(pixels, height)
+
+
+@pytest.mark.parametrize("width, height", SIZES)
+def test_fill_and_invert_keep_the_padding_off(framebuffer_class, width, height):
+    framebuffer = framebuffer_class(width, height)
+    framebuffer.fill(1)
+    assert bytes(framebuffer.packed()) == packed_pixels([[1] * height] * width, height)
+    framebuffer.invert()
+    assert bytes(framebuffer.packed()) == bytes(len(framebuffer.packed()))
+
+
+@pytest.mark.parametrize("width, height", SIZES)
+@pytest.mark.parametrize("mode", [PIXEL_ON, PIXEL_OFF, PIXEL_INVERT])
+def test_fill_rect_is_clipped(framebuffer_class, width, height, mode):
+    random = Random(2)
+    framebuffer = framebuffer_class(width, height)
+    pixels = random_pixels(random, width, height)
+    load_pixels(framebuffer, pixels)
+    for _rect in range(30):
+        x, y = random.randrange(-4, width + 2), random.randrange(-4, height + 2)
+        rect_width, rect_height = random.randrange(0, width + 4), random.randrange(0, height + 4)
+        framebuffer.fill_rect(x, y, rect_width, rect_height, mode)
+        for column in range(max(x, 0), min(x + rect_width, width)):
+            for row in range(max(y, 0), min(y + rect_height, height)):
+                apply(pixels, column, row, mode)
+        assert bytes(framebuffer.packed()) == packed_pixels(pixels, height)
+
+
+@pytest.mark.parametrize("mode", [PIXEL_ON, PIXEL_OFF, PIXEL_INVERT])
+def test_blit_bitmap_is_clipped(framebuffer_class, mode):
+    random = Random(3)
+    width, height = 16, 13
+    framebuffer = framebuffer_class(width, height)
+    pixels = random_pixels(random, width, height)
+    load_pixels(framebuffer, pixels)
+    for _bitmap in range(20):
+        bitmap = random_pixels(random, random.randrange(1, 10), random.randrange(1, 12))
+        if random.random() < 0.3:
+            # Ragged: columns of different lengths, empty ones included
+            bitmap = [column[:random.randrange(len(column) + 1)] for column in bitmap]
+        x, y = random.randrange(-5, width), random.randrange(-5, height)
+        framebuffer.blit_bitmap(x, y, bitmap, mode)
+        for bitmap_x, column in enumerate(bitmap):
+            for bitmap_y, pixel in enumerate(column):
+                if 0 <= x + bitmap_x < width and 0 <= y + bitmap_y < height:
+                    if mode == PIXEL_ON:
+                        pixels[x + bitmap_x][y + bitmap_y] = pixel
+                    elif mode == PIXEL_OFF:
+                        pixels[x + bitmap_x][y + bitmap_y] = 1 - pixel
+                    else:
+                        pixels[x + bitmap_x][y + bitmap_y] ^= pixel
+        assert bytes(framebuffer.packed()) == packed_pixels(pixels, height)
+
+
+def test_columns(framebuffer_class):
+    random = Random(4)
+    width, height = 16, 21
+    framebuffer = framebuffer_class(width, height)
+    pixels = random_pixels(random, width, height)
+    load_pixels(framebuffer, pixels)
+    for _column in range(50):
+        x, y = random.randrange(width), random.randrange(height)
+        count = random.randrange(1, height - y + 1)
+        bits = sum(pixels[x][row] << (y + count - 1 - row) for row in range(y, y + count))
+        assert framebuffer.get_column(x, y, count) == bits
+        new = random.getrandbits(count)
+        xor = random.random() < 0.5
+        framebuffer.blit_column(x, y, new, count, xor)
+        for row in range(count):
+            bit = (new >> (count - 1 - row)) & 1
+            pixels[x][y + row] = pixels[x][y + row] ^ bit if xor else bit
+        assert bytes(framebuffer.packed()) == packed_pixels(pixels, height)
+
+
+def shifted(pixels, x, y, width, height, dx, dy, incoming):
+    # The reference of shift_region: every pixel of the rectangle taken from 'dx'/'dy' back, or from 'incoming'
+    result = [list(column) for column in pixels]
+    for column in range(width):
+        for row in range(height):
+            source_column, source_row = column - dx, row - dy
+            if 0 <= source_column < width and 0 <= source_row < height:
+                pixel = pixels[x + source_column][y + source_row]
+            elif dx and dy:
+                pixel = (incoming[column] >> (height - 1 - row)) & 1
+            elif dx:
+                strip = column if dx > 0 else column - (width + dx)
+                pixel = (incoming[strip] >> (height - 1 - row)) & 1
+            else:
+                strip = row if dy > 0 else row - (height + dy)
+                pixel = (incoming[column] >> (abs(dy) - 1 - strip)) & 1
+            result[x + column][y + row] = pixel
+    return result
+
+
+@pytest.mark.parametrize("dx, dy", [(-1, 0), (3, 0), (0, 1), (0, -5), (8, 0), (0, 8), (-2, 3), (1, -1), (4, 9)])
+def test_shift_region(framebuffer_class, dx, dy):
+    random = Random(5)
+    width, height = 24, 24
+    framebuffer = framebuffer_class(width, height)
+    for x, y, region_width, region_height in [(0, 0, 24, 24), (3, 2, 13, 11), (8, 8, 9, 16), (0, 5, 24, 7)]:
+        if abs(dx) > region_width or abs(dy) > region_height:
+            continue
+        pixels = random_pixels(random, width, height)
+        load_pixels(framebuffer, pixels)
+        if dx and dy:
+            incoming = [random.getrandbits(region_height) for _column in range(region_width)]
+        elif dx:
+            incoming = [random.getrandbits(region_height) for _column in range(abs(dx))]
+        else:
+            incoming = [random.getrandbits(abs(dy)) for _column in range(region_width)]
+        framebuffer.shift_region(x, y, region_width, region_height, dx, dy, incoming)
+        expected = shifted(pixels, x, y, region_width, region_height, dx, dy, incoming)
+        assert bytes(framebuffer.packed()) == packed_pixels(expected, height)
+
+
+@pytest.mark.parametrize("x, y, width, height", [(0, 0, 16, 13), (3, 0, 8, 13), (2, 8, 9, 5), (5, 3, 7, 8),
+                                                 (1, 1, 1, 1)])
+def test_window(framebuffer_class, x, y, width, height):
+    random = Random(6)
+    framebuffer = framebuffer_class(16, 13)
+    pixels = random_pixels(random, 16, 13)
+    load_pixels(framebuffer, pixels)
+    window = [column[y:y + height] for column in pixels[x:x + width]]
+    assert bytes(framebuffer.window(x, y, width, height)) == packed_pixels(window, height)
+
+
+def test_load_and_blend(framebuffer_class):
+    random = Random(7)
+    width, height = 16, 13
+    source, target, framebuffer = [framebuffer_class(width, height) for _framebuffer in range(3)]
+    source_pixels, target_pixels, mask_pixels = [random_pixels(random, width, height) for _pixels in range(3)]
+    load_pixels(source, source_pixels)
+    load_pixels(target, target_pixels)
+    framebuffer.blend(source, target, packed_pixels(mask_pixels, height))
+    expected = [[target_pixels[x][y] if mask_pixels[x][y] else source_pixels[x][y] for y in range(height)]
+                for x in range(width)]
+    assert bytes(framebuffer.packed()) == packed_pixels(expected, height)
+    framebuffer.clear()
+    framebuffer.load(packed_pixels(source_pixels, height))
+    assert bytes(framebuffer.packed()) == bytes(source.packed())
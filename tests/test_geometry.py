@@ -0,0 +1,105 @@
+"""Turned, mirrored and rewired modules checked LED by LED on simulated MAX7219 cascades"""
+from random import Random
+
+import pytest
+
+from piledmatrix.driver import Chain, DisplayUnit, Geometry
+from piledmatrix.driver.geometry import Module
+from piledmatrix.driver.simulator import SimulatedTransport
+
+
+def led(module, digit, bit):
+    # The reference position in its block of the LED driven by bit 'bit' (0 = MSB) of register 'digit':
+    # column 'digit', row 'bit' in the default orientation, mirrored, then turned clockwise in 90 degree steps
+    x, y = digit, bit
+    if module.flip_x:
+        x = 7 - x
+    if module.flip_y:
+        y = 7 - y
+    for _turn in range(module.rotation // 90):
+        x, y = 7 - y, x
+    return x, y
+
+
+def simulated_display(geometry, chain_count=1):
+    chains = [Chain(transport=SimulatedTransport()) for _chain in range(chain_count)]
+    display = DisplayUnit(geometry.blocks_per_row, geometry.blocks_per_column, chains=chains, geometry=geometry)
+    display.init()
+    return display
+
+
+def check_chips(display, geometry, pixels):
+    # Every register bit of every chip against the pixel its LED shows
+    positions = [0] * len(display.chains)
+    for module in geometry.modules:
+        digits = display.chains[module.chain].transport.digits(positions[module.chain])
+        positions[module.chain] += 1
+        for digit in range(8):
+            for bit in range(8):
+                x, y = led(module, digit, bit)
+                assert (digits[digit] >> (7 - bit)) & 1 == pixels[module.x * 8 + x][module.y * 8 + y], \
+                    "{0!r} digit {1} bit {2}".format(module, digit, bit)
+
+
+def random_geometry(random, blocks_per_row, blocks_per_column, chain_count):
+    positions = [(x, y) for x in range(blocks_per_row) for y in range(blocks_per_column)]
+    random.shuffle(positions)
+    chains = list(range(chain_count)) + [random.randrange(chain_count) for _module in positions[chain_count:]]
+    return Geometry(blocks_per_row, blocks_per_column, [
+        Module(x, y, random.choice([0, 90, 180, 270]), random.random() < 0.5, random.random() < 0.5, chain)
+        for (x, y), chain in zip(positions, chains)])
+
+
+@pytest.mark.parametrize("blocks_per_row, blocks_per_column, chain_count", [
+    (1, 1, 1), (4, 1, 1), (3, 2, 1), (4, 3, 2), (2, 4, 3)])
+def test_random_geometries(blocks_per_row, blocks_per_column, chain_count):
+    random = Random(blocks_per_row * 100 + blocks_per_column * 10 + chain_count)
+    width, height = blocks_per_row * 8, blocks_per_column * 8
+    for _geometry in range(10):
+        geometry = random_geometry(random, blocks_per_row, blocks_per_column, chain_count)
+        display = simulated_display(geometry, chain_count)
+        for mode in ["full", "delta", "dense"]:
+            pixels = [[random.randrange(2) for _y in range(height)] for _x in range(width)]
+            display.framebuffer.blit_bitmap(0, 0, pixels)
+            display.send_buffer(mode)
+            check_chips(display, geometry, pixels)
+
+
+@pytest.mark.parametrize("rotation, flip_x, flip_y, corner", [
+    (0, False, False, (0, 0)), (90, False, False, (7, 0)), (180, False, False, (7, 7)), (270, False, False, (0, 7)),
+    (0, True, False, (7, 0)), (0, False, True, (0, 7)), (90, True, False, (7, 7))])
+def test_the_first_led_of_a_turned_module(rotation, flip_x, flip_y, corner):
+    # Bit 7 of digit register 0 lights the upper left LED of a module in the default orientation
+    geometry = Geometry.default(1, 1, rotation, flip_x, flip_y)
+    display = simulated_display(geometry)
+    display.framebuffer.set_pixel(corner[0], corner[1], 1)
+    display.send_buffer()
+    assert display.chains[0].transport.digits(0) == b"\x80" + bytes(7)
+
+
+@pytest.mark.parametrize("blocks_per_row, blocks_per_column", [(3, 1), (4, 3)])
+@pytest.mark.parametrize("rotation", [0, 90, 180, 270])
+def test_serpentine(blocks_per_row, blocks_per_column, rotation):
+    geometry = Geometry.serpentine(blocks_per_row, blocks_per_column, rotation)
+    assert [(module.x, module.y) for module in geometry.modules] == \
+        [(x if y % 2 == 0 else blocks_per_row - 1 - x, y) for y in range(blocks_per_column)
+         for x in range(blocks_per_row)]
+    random = Random(rotation)
+    display = simulated_display(geometry)
+    pixels = [[random.randrange(2) for _y in range(blocks_per_column * 8)] for _x in range(blocks_per_row * 8)]
+    display.framebuffer.blit_bitmap(0, 0, pixels)
+    display.send_buffer()
+    check_chips(display, geometry, pixels)
+
+
+def test_invalid_geometries():
+    with pytest.raises(ValueError):
+        Module(0, 0, rotation=45)
+    with pytest.raises(ValueError):
+        Geometry(2, 1, [Module(0, 0), Module(0, 0)])
+    with pytest.raises(ValueError):
+        Geometry(2, 1, [Module(0, 0), Module(2, 0)])
+    with pytest.raises(ValueError):
+        DisplayUnit(3, 1, transport=SimulatedTransport(), geometry=Geometry.default(2, 1))
+    with pytest.raises(ValueError):
+        simulated_display(Geometry(2, 1, [Module(0, 0, chain=0), Module(1, 0, chain=1)]), 1)
@@ -0,0 +1,120 @@
+"""marquee_frames against a band cut out of a plain list of the columns passing through it"""
+from random import Random
+
+import pytest
+
+from piledmatrix.directions import DIR_L, DIR_R
+from piledmatrix.driver import DisplayUnit
+from piledmatrix.driver.framebuffer import PIXEL_OFF, PIXEL_ON, PIXEL_INVERT
+from piledmatrix.driver.simulator import RecordingTransport
+from piledmatrix.font import get_font
+from piledmatrix.graphics import Graphics
+from piledmatrix.graphics.bitmap import Bitmap
+
+
+def random_pixels(random, width, height):
+    return [[random.randrange(2) for _y in range(height)] for _x in range(width)]
+
+
+def pixels_of(display):
+    return [[1 if pixel else 0 for pixel in column] for column in display.framebuffer.to_list()]
+
+
+def column_pixels(column):
+    return [(column >> (7 - row)) & 1 for row in range(8)]
+
+
+def marquee_pixels(pixels, y, columns, passes, consumed, direction):
+    # The reference of a marquee after 'consumed' columns entered the band at row 'y': the band is a display wide
+    # window of the line of its former content and the passes (the message, then a display width of blank
+    # columns, entering at the right edge for DIR_L and at the left edge for DIR_R)
+    width = len(pixels)
+    band = [[column[row] for row in range(y, y + 8)] for column in pixels]
+    message = [column_pixels(column) for column in columns]
+    blank = [[0] * 8] * width
+    if direction == DIR_L:
+        line = band + (message + blank) * passes
+        window = line[consumed:consumed + width]
+    else:
+        line = (blank + message) * passes + band
+        window = line[len(line) - width - consumed:len(line) - consumed]
+    result = [list(column) for column in pixels]
+    for x, column in enumerate(window):
+        result[x][y:y + 8] = column
+    return result
+
+
+def inverted(pixels, y):
+    return [column[:y] + [1 - pixel for pixel in column[y:y + 8]] + column[y + 8:] for column in pixels]
+
+
+def text_columns(text):
+    font = get_font()
+    return [column for char in text for column in font[ord(char)]]
+
+
+@pytest.mark.parametrize("direction", [DIR_L, DIR_R])
+@pytest.mark.parametrize("step", [1, 3, 8])
+@pytest.mark.parametrize("y", [0, 3, 8])
+@pytest.mark.parametrize("repeats", [1, 2])
+def test_marquee_of_a_text(direction, step, y, repeats):
+    random = Random(step * 10 + y)
+    text = "HELLO WORLD, THIS IS LONG"
+    columns = text_columns(text)
+    pixels = random_pixels(random, 32, 16)
+    display = DisplayUnit(4, 2, transport=RecordingTransport())
+    display.framebuffer.blit_bitmap(0, 0, pixels)
+    gfx = Graphics(display)
+    total = (len(columns) + 32) * repeats
+    frames = 0
+    for frames, _frame in enumerate(gfx.marquee_frames(text, y, direction, repeats, step), 1):
+        consumed = min(frames * step, total)
+        assert pixels_of(display) == marquee_pixels(pixels, y, columns, repeats, consumed, direction)
+    assert frames == (total + step - 1) // step
+
+
+@pytest.mark.parametrize("source", ["bitmap", "ints", "chunks", "iterator"])
+@pytest.mark.parametrize("mode", [PIXEL_ON, PIXEL_OFF, PIXEL_INVERT])
+def test_marquee_sources_and_modes(source, mode):
+    random = Random(mode)
+    columns = [random.randrange(256) for _column in range(45)]
+    if source == "bitmap":
+        marquee_source = Bitmap(len(columns), 8, bytes(columns))
+    elif source == "ints":
+        marquee_source = columns
+    elif source == "chunks":
+        marquee_source = [bytes(columns[start:start + 7]) for start in range(0, len(columns), 7)]
+    else:
+        marquee_source = iter(columns)
+    pixels = random_pixels(random, 16, 8)
+    display = DisplayUnit(2, 1, transport=RecordingTransport())
+    display.framebuffer.blit_bitmap(0, 0, pixels)
+    gfx = Graphics(display)
+    gfx.set_draw_mode(mode)
+    # An iterator only runs once, whatever the repeats
+    passes = 1 if source == "iterator" else 2
+    frames = 0
+    for frames, _frame in enumerate(gfx.marquee_frames(marquee_source, repeats=2), 1):
+        if mode == PIXEL_OFF:
+            # The message and the blank columns after it are drawn inverted, the former band stays as it was
+            expected = marquee_pixels(inverted(pixels, 0), 0, columns, passes, frames, DIR_L)
+            expected = inverted(expected, 0)
+        else:
+            expected = marquee_pixels(pixels, 0, columns, passes, frames, DIR_L)
+        assert pixels_of(display) == expected
+    assert frames == (len(columns) + 16) * passes
+
+
+def test_marquee_rejects_bitmaps_of_another_height():
+    gfx = Graphics(DisplayUnit(2, 1, transport=RecordingTransport()))
+    with pytest.raises(ValueError):
+        list(gfx.marquee_frames(Bitmap(4, 9, bytes(8))))
+
+
+def test_endless_marquee_streams_the_text():
+    gfx = Graphics(DisplayUnit(2, 1, transport=RecordingTransport()))
+    frames = gfx.marquee_frames("AB", repeats=0)
+    # 2 characters and a display width of blank columns per pass, forever
+    for _frame in range(10 * (16 + 16)):
+        next(frames)
+    assert pixels_of(gfx.display) == marquee_pixels([[0] * 8] * 16, 0, text_columns("AB"), 10, 10 * 32, DIR_L)
@@ -0,0 +1,206 @@
+"""Graphics.move and scroll_vector against a plain [x][y] list of pixels"""
+from fractions import Fraction
+from random import Random
+
+import pytest
+
+from piledmatrix.directions import DIR_U, DIR_D, DIR_L, DIR_R, DIR_LU, DIR_LD, DIR_RU, DIR_RD
+from piledmatrix.driver import DisplayUnit, PackedFramebuffer
+from piledmatrix.driver.framebuffer import PIXEL_OFF, PIXEL_ON
+from piledmatrix.driver.simulator import RecordingTransport
+from piledmatrix.graphics import Graphics
+
+DIAGONALS = [DIR_LU, DIR_LD, DIR_RU, DIR_RD]
+
+
+def display_of(blocks_per_row, blocks_per_column, pixels=None):
+    display = DisplayUnit(blocks_per_row, blocks_per_column, transport=RecordingTransport())
+    if pixels is not None:
+        display.framebuffer.blit_bitmap(0, 0, pixels)
+    return display
+
+
+def pixels_of(display):
+    return [[1 if pixel else 0 for pixel in column] for column in display.framebuffer.to_list()]
+
+
+def random_pixels(random, width, height):
+    return [[random.randrange(2) for _y in range(height)] for _x in range(width)]
+
+
+def bitmap_pixel(bitmap, x, y):
+    # A pixel of the 'bitmap' argument of move: PIXEL_ON/PIXEL_OFF everywhere, off outside a 2d bitmap
+    if isinstance(bitmap, int):
+        return 1 if bitmap == PIXEL_ON else 0
+    if 0 <= x < len(bitmap) and 0 <= y < len(bitmap[x]):
+        return 1 if bitmap[x][y] else 0
+    return 0
+
+
+def area(pixels, x1, y1, x2, y2):
+    # The rectangle x1/y1 - x2/y2 of move, clipped to the display of 'pixels', as x1, y1, width, height
+    display_width, display_height = len(pixels), len(pixels[0])
+    x2, y2 = x2 + 1, y2 + 1
+    x1 = max(0, min(display_width - 1, x1))
+    width = max(0, min(display_width - x1, x2))
+    y1 = max(0, min(display_height - 1, y1))
+    height = max(0, min(display_height - y1, y2))
+    return x1, y1, width, height
+
+
+def moved(pixels, x1, y1, x2, y2, direction, distance, bitmap):
+    # The reference of move: a horizontal move, then a vertical one, the new pixels of each taken from the
+    # 'distance' wide strip of 'bitmap' next to the rectangle (only its part which moved in if it is wider)
+    x2, y2 = x2 + 1, y2 + 1
+    x1, y1, width, height = area(pixels, x1, y1, x2 - 1, y2 - 1)
+    result = [list(column) for column in pixels]
+    if direction & (DIR_L | DIR_R):
+        step = min(min(distance, x2), width)
+        first = min(distance, x2) - step if direction & DIR_L else 0
+        before = [list(column) for column in result]
+        for x in range(width):
+            source = x + step if direction & DIR_L else x - step
+            for y in range(height):
+                if 0 <= source < width:
+                    result[x1 + x][y1 + y] = before[x1 + source][y1 + y]
+                else:
+                    strip = x - (width - step) if direction & DIR_L else x
+                    result[x1 + x][y1 + y] = bitmap_pixel(bitmap, first + strip, y)
+    if direction & (DIR_U | DIR_D):
+        step = min(min(distance, y2), height)
+        first = min(distance, y2) - step if direction & DIR_D else 0
+        before = [list(column) for column in result]
+        for x in range(width):
+            for y in range(height):
+                source = y - step if direction & DIR_U else y + step
+                if 0 <= source < height:
+                    result[x1 + x][y1 + y] = before[x1 + x][y1 + source]
+                else:
+                    strip = y if direction & DIR_U else y - (height - step)
+                    result[x1 + x][y1 + y] = bitmap_pixel(bitmap, x, first + strip)
+    return result
+
+
+@pytest.mark.parametrize("direction", DIAGONALS)
+@pytest.mark.parametrize("bitmap_size", [(8, 8), (16, 8), (3, 5)])
+@pytest.mark.parametrize("distance", [1, 3, 8, 10, 16, 20])
+def test_diagonal_move_takes_the_bitmap(direction, bitmap_size, distance):
+    random = Random(distance)
+    pixels = random_pixels(random, 16, 8)
+    display = display_of(2, 1, pixels)
+    bitmap = random_pixels(random, *bitmap_size)
+    Graphics(display).move(0, 0, 15, 7, direction, distance, bitmap)
+    assert pixels_of(display) == moved(pixels, 0, 0, 15, 7, direction, distance, bitmap)
+
+
+@pytest.mark.parametrize("direction", DIAGONALS)
+def test_diagonal_move_of_a_full_bitmap_does_not_raise(direction):
+    display = display_of(2, 1)
+    Graphics(display).move(0, 0, 15, 7, direction, 3, [[1] * 8] * 8)
+    assert pixels_of(display) == moved([[0] * 8] * 16, 0, 0, 15, 7, direction, 3, [[1] * 8] * 8)
+
+
+@pytest.mark.parametrize("blocks_per_row, blocks_per_column", [(1, 1), (2, 1), (3, 2)])
+@pytest.mark.parametrize("direction", [DIR_U, DIR_D, DIR_L, DIR_R] + DIAGONALS)
+def test_move_of_random_areas(blocks_per_row, blocks_per_column, direction):
+    random = Random(blocks_per_row * 10 + blocks_per_column + direction)
+    width, height = blocks_per_row * 8, blocks_per_column * 8
+    for _move in range(25):
+        pixels = random_pixels(random, width, height)
+        display = display_of(blocks_per_row, blocks_per_column, pixels)
+        x1, y1 = random.randrange(width), random.randrange(height)
+        x2, y2 = random.randrange(x1, width + 3), random.randrange(y1, height + 3)
+        distance = random.randrange(0, max(width, height) + 4)
+        bitmap = random.choice([PIXEL_OFF, PIXEL_ON, random_pixels(random, random.randrange(1, width + 4),
+                                                                   random.randrange(1, height + 4))])
+        Graphics(display).move(x1, y1, x2, y2, direction, distance, bitmap)
+        assert pixels_of(display) == moved(pixels, x1, y1, x2, y2, direction, distance, bitmap)
+
+
+def packed_column(pixels, x, rows):
+    bits = 0
+    for y in rows:
+        bits = bits << 1 | pixels[x][y]
+    return bits
+
+
+@pytest.mark.parametrize("framebuffer", ["packed", "numpy"])
+@pytest.mark.parametrize("direction", [DIR_U, DIR_D, DIR_L, DIR_R] + DIAGONALS)
+def test_move_of_packed_columns(framebuffer, direction):
+    # The new pixels given as packed columns instead of a bitmap: the vacated columns of a horizontal move,
+    # the vacated rows of every column of a vertical one, all columns of the area of a diagonal one
+    if framebuffer == "numpy":
+        pytest.importorskip("numpy")
+        from piledmatrix.driver.npframebuffer import NumpyFramebuffer as framebuffer_class
+    else:
+        framebuffer_class = PackedFramebuffer
+    random = Random(direction)
+    width, height = 24, 16
+    for _move in range(25):
+        pixels = random_pixels(random, width, height)
+        display = DisplayUnit(3, 2, framebuffer=framebuffer_class, transport=RecordingTransport())
+        display.framebuffer.blit_bitmap(0, 0, pixels)
+        x1, y1 = random.randrange(width), random.randrange(height)
+        x2, y2 = random.randrange(x1, width + 3), random.randrange(y1, height + 3)
+        distance = random.randrange(0, max(width, height) + 4)
+        expected = moved(pixels, x1, y1, x2, y2, direction, distance, random_pixels(random, width, height))
+        left, top, area_width, area_height = area(pixels, x1, y1, x2, y2)
+        step_x, step_y = min(distance, x2 + 1, area_width), min(distance, y2 + 1, area_height)
+        rows = range(top, top + area_height)
+        if direction == DIR_L:
+            columns = [packed_column(expected, x, rows) for x in range(left + area_width - step_x, left + area_width)]
+        elif direction == DIR_R:
+            columns = [packed_column(expected, x, rows) for x in range(left, left + step_x)]
+        elif direction == DIR_U:
+            columns = [packed_column(expected, x, range(top, top + step_y)) for x in range(left, left + area_width)]
+        elif direction == DIR_D:
+            columns = [packed_column(expected, x, range(top + area_height - step_y, top + area_height))
+                       for x in range(left, left + area_width)]
+        else:
+            columns = [packed_column(expected, x, rows) for x in range(left, left + area_width)]
+        Graphics(display).move(x1, y1, x2, y2, direction, distance, columns=columns)
+        assert pixels_of(display) == expected
+
+
+def scrolled(pixels, graphic, offset_x, offset_y):
+    # The reference of scroll_vector after the content moved by 'offset_x'/'offset_y' pixel in all: the pixels
+    # still on the display where they were moved, everything else from the graphic tiled beyond the display
+    width, height = len(pixels), len(pixels[0])
+    result = []
+    for x in range(width):
+        column = []
+        for y in range(height):
+            source_x, source_y = x - offset_x, y - offset_y
+            if 0 <= source_x < width and 0 <= source_y < height:
+                column.append(pixels[source_x][source_y])
+            else:
+                column.append(graphic[source_x % width][source_y % height])
+        result.append(column)
+    return result
+
+
+@pytest.mark.parametrize("blocks_per_row, blocks_per_column", [(1, 1), (2, 1), (3, 2)])
+@pytest.mark.parametrize("dx, dy", [(-1, 0), (0, 1), (1, -1), (-0.5, 0), (0.25, -0.75), (-1.5, 0.5), (2, 3),
+                                    (0, Fraction(-1, 3))])
+def test_scroll_vector_frames(blocks_per_row, blocks_per_column, dx, dy):
+    random = Random(7)
+    width, height = blocks_per_row * 8, blocks_per_column * 8
+    pixels = random_pixels(random, width, height)
+    graphic = random_pixels(random, width, height)
+    display = display_of(blocks_per_row, blocks_per_column, pixels)
+    rate_x, rate_y = Fraction(dx), Fraction(dy)
+    frame = 0
+    for frame, _frame in enumerate(Graphics(display).scroll_vector_frames(graphic, dx, dy, 1), 1):
+        assert pixels_of(display) == scrolled(pixels, graphic, int(rate_x * frame), int(rate_y * frame))
+    # A pass ends with the graphic in its place, moved by whole tiles along both axes
+    assert frame and int(rate_x * frame) % width == 0 and int(rate_y * frame) % height == 0
+    assert pixels_of(display) == graphic
+
+
+def test_scroll_vector_repeats_whole_passes():
+    display = display_of(2, 1)
+    graphic = random_pixels(Random(8), 16, 8)
+    frames = sum(1 for _frame in Graphics(display).scroll_vector_frames(graphic, -0.5, 0, 1))
+    assert frames == 32
+    assert sum(1 for _frame in Graphics(display).scroll_vector_frames(graphic, -0.5, 0, 3)) == 3 * frames
+    assert list(Graphics(display).scroll_vector_frames(graphic, 0, 0, 1)) == []
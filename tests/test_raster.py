@@ -0,0 +1,239 @@
+"""The rasterizer's runs against pixel sets of the same shapes computed directly"""
+from fractions import Fraction
+from math import floor, hypot
+from random import Random
+
+import pytest
+
+from piledmatrix.driver import DisplayUnit, PackedFramebuffer
+from piledmatrix.driver.framebuffer import PIXEL_OFF, PIXEL_ON, PIXEL_INVERT
+from piledmatrix.driver.simulator import RecordingTransport
+from piledmatrix.graphics import Graphics, raster
+
+# Shapes are rasterized this far from the origin of a large area to get them unclipped
+OFFSET = 100
+AREA = 2 * OFFSET
+
+
+def run_pixels(runs):
+    # The pixels of 'runs' as a set, checking that no pixel is part of two runs
+    pixels = set()
+    count = 0
+    for x, y, width, height in runs:
+        assert width > 0 and height > 0
+        pixels.update((x + column, y + row) for column in range(width) for row in range(height))
+        count += width * height
+    assert len(pixels) == count, "a pixel is part of two runs"
+    return pixels
+
+
+def unclipped(shape, coordinates, *args, **kwargs):
+    # The pixels of raster.'shape' called with 'coordinates' and further 'args' (sizes), without clipping
+    runs = getattr(raster, shape)(*[coordinate + OFFSET for coordinate in coordinates] + list(args) + [AREA, AREA],
+                                  **kwargs)
+    return moved_back(runs)
+
+
+def moved_back(runs):
+    # The pixels of the runs of a shape rasterized OFFSET pixel away from the origin, moved back
+    return set((x - OFFSET, y - OFFSET) for x, y in run_pixels(runs))
+
+
+def clipped(pixels, width, height):
+    return set((x, y) for x, y in pixels if 0 <= x < width and 0 <= y < height)
+
+
+def is_connected(pixels):
+    # True if all 'pixels' are joined through their 8 neighbours
+    if not pixels:
+        return True
+    start = next(iter(pixels))
+    seen, todo = {start}, [start]
+    while todo:
+        x, y = todo.pop()
+        for neighbour in ((x + dx, y + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)):
+            if neighbour in pixels and neighbour not in seen:
+                seen.add(neighbour)
+                todo.append(neighbour)
+    return len(seen) == len(pixels)
+
+
+def line_pixels(x1, y1, x2, y2, last=True):
+    # The pixel nearest to the ideal line at every step along the major axis, halves rounded up
+    dx, dy = x2 - x1, y2 - y1
+    if abs(dx) >= abs(dy):
+        steps = range(abs(dx) + 1 if last else abs(dx))
+        sign = 1 if dx >= 0 else -1
+        return set((x1 + sign * step, y1 + floor(Fraction(dy * sign * step, dx or 1) + Fraction(1, 2)))
+                   for step in steps)
+    sign = 1 if dy >= 0 else -1
+    return set((x1 + floor(Fraction(dx * sign * step, dy) + Fraction(1, 2)), y1 + sign * step)
+               for step in range(abs(dy) + 1 if last else abs(dy)))
+
+
+def random_points(random, count, low=-12, high=28):
+    return [(random.randrange(low, high), random.randrange(low, high)) for _point in range(count)]
+
+
+@pytest.mark.parametrize("width, height", [(8, 8), (16, 8), (32, 24)])
+def test_lines(width, height):
+    random = Random(width + height)
+    for _line in range(300):
+        (x1, y1), (x2, y2) = random_points(random, 2)
+        last = random.random() < 0.8
+        expected = line_pixels(x1, y1, x2, y2, last)
+        assert unclipped("line", (x1, y1, x2, y2), last=last) == expected
+        assert run_pixels(raster.line(x1, y1, x2, y2, width, height, last)) == clipped(expected, width, height)
+        if last:
+            # One pixel per step along the major axis, each touching the next
+            assert (x1, y1) in expected and (x2, y2) in expected
+            assert len(expected) == max(abs(x2 - x1), abs(y2 - y1)) + 1
+            assert is_connected(expected)
+
+
+def test_line_of_one_pixel():
+    assert raster.line(3, 4, 3, 4, 8, 8) == [(3, 4, 1, 1)]
+    assert raster.line(3, 4, 3, 4, 8, 8, last=False) == []
+    assert raster.line(-1, 4, -1, 4, 8, 8) == []
+
+
+@pytest.mark.parametrize("width, height", [(8, 8), (24, 16)])
+def test_rects(width, height):
+    random = Random(width * height)
+    for _rect in range(200):
+        x, y = random.randrange(-10, width + 2), random.randrange(-10, height + 2)
+        rect_width, rect_height = random.randrange(-1, 20), random.randrange(-1, 20)
+        filled = set((x + column, y + row) for column in range(rect_width) for row in range(rect_height))
+        outline = set((column, row) for column, row in filled
+                      if column in (x, x + rect_width - 1) or row in (y, y + rect_height - 1))
+        assert run_pixels(raster.rect(x, y, rect_width, rect_height, width, height, True)) == \
+            clipped(filled, width, height)
+        assert run_pixels(raster.rect(x, y, rect_width, rect_height, width, height)) == \
+            clipped(outline, width, height)
+
+
+def check_round_shape(outline, filled, cx, cy, x_radius, y_radius):
+    # Symmetric about the centre, as wide and high as the radii say, a gapless outline around rows without
+    # gaps, the outline being part of the filled shape
+    for pixels in outline, filled:
+        assert pixels == set((2 * cx - x, y) for x, y in pixels) == set((x, 2 * cy - y) for x, y in pixels)
+        assert min(x for x, _y in pixels) == cx - x_radius and max(x for x, _y in pixels) == cx + x_radius
+        assert min(y for _x, y in pixels) == cy - y_radius and max(y for _x, y in pixels) == cy + y_radius
+    assert is_connected(outline)
+    assert outline <= filled
+    for row in set(y for _x, y in filled):
+        columns = [x for x, y in filled if y == row]
+        assert len(columns) == max(columns) - min(columns) + 1
+        assert (min(columns), row) in outline and (max(columns), row) in outline
+
+
+@pytest.mark.parametrize("radius", range(0, 20))
+def test_circles(radius):
+    cx, cy = 5, 3
+    outline = unclipped("circle", (cx, cy), radius)
+    filled = unclipped("circle", (cx, cy), radius, filled=True)
+    check_round_shape(outline, filled, cx, cy, radius, radius)
+    assert outline == set((y - cy + cx, x - cx + cy) for x, y in outline), "not symmetric about the diagonal"
+    for x, y in outline:
+        assert abs(hypot(x - cx, y - cy) - radius) < 1
+    for x, y in filled:
+        assert hypot(x - cx, y - cy) < radius + 1
+    assert run_pixels(raster.circle(2, 3, radius, 8, 8)) == clipped(unclipped("circle", (2, 3), radius), 8, 8)
+    assert raster.circle(2, 3, -1, 8, 8) == []
+
+
+@pytest.mark.parametrize("x_radius", [0, 1, 2, 5, 11])
+@pytest.mark.parametrize("y_radius", [0, 1, 3, 7, 16])
+def test_ellipses(x_radius, y_radius):
+    cx, cy = -4, 6
+    outline = unclipped("ellipse", (cx, cy), x_radius, y_radius)
+    filled = unclipped("ellipse", (cx, cy), x_radius, y_radius, filled=True)
+    check_round_shape(outline, filled, cx, cy, x_radius, y_radius)
+    for x, y in filled:
+        if x_radius and y_radius:
+            assert ((x - cx) / (x_radius + 0.5)) ** 2 + ((y - cy) / (y_radius + 0.5)) ** 2 <= 1 + 1e-9
+    assert run_pixels(raster.ellipse(cx, cy, x_radius, y_radius, 8, 16, True)) == clipped(filled, 8, 16)
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 5, 8])
+def test_polylines(count):
+    random = Random(count)
+    for _polyline in range(50):
+        points = random_points(random, count)
+        closed = random.random() < 0.5
+        path = points + [points[0]] if closed and count > 2 else points
+        expected = set(line_pixels(*points[0] + points[0]))
+        for (x1, y1), (x2, y2) in zip(path, path[1:]):
+            expected |= line_pixels(x1, y1, x2, y2)
+        runs = raster.polyline([(x + OFFSET, y + OFFSET) for x, y in points], AREA, AREA, closed=closed)
+        assert moved_back(runs) == expected
+        assert run_pixels(raster.polyline(points, 16, 16, closed=closed)) == clipped(expected, 16, 16)
+
+
+def test_triangles():
+    random = Random(9)
+    for _triangle in range(200):
+        corners = random_points(random, 3)
+        edges = set()
+        for (x1, y1), (x2, y2) in zip(corners, corners[1:] + corners[:1]):
+            edges |= line_pixels(x1, y1, x2, y2)
+        moved = [(x + OFFSET, y + OFFSET) for x, y in corners]
+        outline = moved_back(raster.triangle(*moved, AREA, AREA, filled=False))
+        filled = moved_back(raster.triangle(*moved, AREA, AREA))
+        assert outline == edges
+        # Every row from the leftmost to the rightmost edge pixel
+        expected = set()
+        for row in set(y for _x, y in edges):
+            columns = [x for x, y in edges if y == row]
+            expected |= set((x, row) for x in range(min(columns), max(columns) + 1))
+        assert filled == expected
+        assert run_pixels(raster.triangle(*corners, 16, 8)) == clipped(expected, 16, 8)
+
+
+def apply(pixels, shape, mode):
+    # The reference of drawing the pixel set 'shape' in a draw mode
+    result = [list(column) for column in pixels]
+    for x, y in shape:
+        if mode == PIXEL_ON:
+            result[x][y] = 1
+        elif mode == PIXEL_OFF:
+            result[x][y] = 0
+        else:
+            result[x][y] ^= 1
+    return result
+
+
+@pytest.mark.parametrize("framebuffer", ["packed", "numpy"])
+@pytest.mark.parametrize("mode", [PIXEL_ON, PIXEL_OFF, PIXEL_INVERT])
+def test_graphics_draws_the_runs_in_every_mode(framebuffer, mode):
+    if framebuffer == "numpy":
+        pytest.importorskip("numpy")
+        from piledmatrix.driver.npframebuffer import NumpyFramebuffer as framebuffer_class
+    else:
+        framebuffer_class = PackedFramebuffer
+    random = Random(mode)
+    width, height = 24, 16
+    pixels = [[random.randrange(2) for _y in range(height)] for _x in range(width)]
+    display = DisplayUnit(3, 2, framebuffer=framebuffer_class, transport=RecordingTransport())
+    display.framebuffer.blit_bitmap(0, 0, pixels)
+    gfx = Graphics(display)
+    gfx.set_draw_mode(mode)
+    (x1, y1), (x2, y2), (x3, y3) = random_points(random, 3, -4, 28)
+    drawings = [
+        (lambda: gfx.fill(), set((x, y) for x in range(width) for y in range(height))),
+        (lambda: gfx.draw_pixel(x1, y1), clipped({(x1, y1)}, width, height)),
+        (lambda: gfx.draw_horizontal_line(x1, y1), clipped(set((x, y1) for x in range(max(x1, 0), width)),
+                                                            width, height)),
+        (lambda: gfx.draw_vertical_line(x2, y2, 9), clipped(set((x2, y) for y in range(max(y2, 0), max(y2, 0) + 9)),
+                                                             width, height)),
+        (lambda: gfx.draw_line(x1, y1, x2, y2), clipped(line_pixels(x1, y1, x2, y2), width, height)),
+        (lambda: gfx.draw_rect(x1, y1, 9, 7), run_pixels(raster.rect(x1, y1, 9, 7, width, height))),
+        (lambda: gfx.draw_circle(x2, y2, 6, True), run_pixels(raster.circle(x2, y2, 6, width, height, True))),
+        (lambda: gfx.draw_ellipse(x3, y3, 7, 3), run_pixels(raster.ellipse(x3, y3, 7, 3, width, height))),
+        (lambda: gfx.draw_triangle(x1, y1, x2, y2, x3, y3),
+         run_pixels(raster.triangle((x1, y1), (x2, y2), (x3, y3), width, height))),
+    ]
+    for draw, shape in drawings:
+        draw()
+        pixels = apply(pixels, shape, mode)
+        assert [[1 if pixel else 0 for pixel in column] for column in display.framebuffer.to_list()] == pixels
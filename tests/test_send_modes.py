@@ -0,0 +1,117 @@
+"""The send modes of DisplayUnit.send_buffer leave the same picture on simulated MAX7219 chips"""
+from random import Random
+
+import pytest
+
+from piledmatrix.driver import DisplayUnit, Geometry
+from piledmatrix.driver.simulator import SimulatedTransport
+from piledmatrix.graphics import Graphics
+
+MODES = ["full", "delta", "dense"]
+
+
+def simulated_display(blocks_per_row, blocks_per_column, geometry=None):
+    transport = SimulatedTransport()
+    display = DisplayUnit(blocks_per_row, blocks_per_column, transport=transport, geometry=geometry)
+    display.init()
+    transport.reset()
+    return display, transport
+
+
+def chip_digits(transport):
+    return [transport.digits(position) for position in range(len(transport.chips))]
+
+
+def frames(blocks_per_row, blocks_per_column, count=30):
+    # Framebuffer bytes of a sequence of frames: a few changed pixels at a time, now and then a new picture
+    random = Random(blocks_per_row * 10 + blocks_per_column)
+    width, height = blocks_per_row * 8, blocks_per_column * 8
+    display, _transport = simulated_display(blocks_per_row, blocks_per_column)
+    framebuffer = display.framebuffer
+    result = []
+    for frame in range(count):
+        if frame % 10 == 9:
+            for x in range(width):
+                for y in range(height):
+                    framebuffer.set_pixel(x, y, random.random() < 0.3)
+        else:
+            for _pixel in range(random.randrange(0, 6)):
+                framebuffer.invert_pixel(random.randrange(width), random.randrange(height))
+        result.append(bytes(framebuffer.packed()))
+    return result
+
+
+@pytest.mark.parametrize("blocks_per_row, blocks_per_column, geometry", [
+    (1, 1, None), (4, 1, None), (8, 2, None), (3, 2, Geometry.serpentine(3, 2)),
+    (2, 2, Geometry.default(2, 2, rotation=90, flip_x=True))])
+def test_modes_give_the_same_chips(blocks_per_row, blocks_per_column, geometry):
+    sequence = frames(blocks_per_row, blocks_per_column)
+    displays = dict((mode, simulated_display(blocks_per_row, blocks_per_column, geometry)) for mode in MODES)
+    for data in sequence:
+        for mode, (display, _transport) in displays.items():
+            display.framebuffer.load(data)
+            display.send_buffer(mode)
+        full = chip_digits(displays["full"][1])
+        assert chip_digits(displays["delta"][1]) == full
+        assert chip_digits(displays["dense"][1]) == full
+    bytes_sent = dict((mode, transport.bytes_sent) for mode, (_display, transport) in displays.items())
+    transactions = dict((mode, transport.transaction_count) for mode, (_display, transport) in displays.items())
+    assert bytes_sent["delta"] <= bytes_sent["full"]
+    assert bytes_sent["dense"] <= bytes_sent["full"]
+    assert transactions["dense"] <= transactions["delta"] <= transactions["full"]
+
+
+@pytest.mark.parametrize("mode", ["delta", "dense"])
+def test_unchanged_frame_sends_nothing(mode):
+    display, transport = simulated_display(4, 1)
+    Graphics(display).draw_string(0, 0, "ABCD")
+    display.send_buffer(mode)
+    assert transport.bytes_sent == 8 * 2 * 4
+    transport.reset()
+    display.send_buffer(mode)
+    assert transport.bytes_sent == 0
+    display.framebuffer.invert_pixel(9, 2)
+    display.send_buffer(mode)
+    # One register of one chip, the others get a NO-OP
+    assert transport.transaction_count == 1
+    assert transport.transactions[0] == bytes(bytearray([0, 0, 0, 0, 0x2, display.framebuffer.packed()[9], 0, 0]))
+
+
+@pytest.mark.parametrize("mode", ["delta", "dense"])
+def test_written_registers_are_sent_again(mode):
+    display, transport = simulated_display(4, 1)
+    display.framebuffer.fill(1)
+    display.send_buffer(mode)
+    display.clear_all_blocks()
+    assert all(digits == bytes(8) for digits in chip_digits(transport))
+    display.send_buffer(mode)
+    assert all(digits == b"\xff" * 8 for digits in chip_digits(transport))
+
+
+def test_dense_packs_the_changes_of_all_digits():
+    display, transport = simulated_display(4, 1)
+    display.send_buffer("dense")
+    transport.reset()
+    # Digit 0 changes on chip 0, digits 3 and 5 on chip 2: two transactions instead of three digit rows
+    for x in (0, 19, 21):
+        display.framebuffer.set_pixel(x, 0, 1)
+    display.send_buffer("dense")
+    assert transport.transaction_count == 2
+    assert transport.digits(0) == b"\x80" + bytes(7)
+    assert transport.digits(2) == bytes(3) + b"\x80\x00\x80" + bytes(2)
+
+
+def test_animations_use_the_send_mode_of_graphics():
+    chips = {}
+    bytes_sent = {}
+    for mode in MODES:
+        display, transport = simulated_display(8, 1)
+        gfx = Graphics(display)
+        gfx.set_send_mode(mode)
+        for _frame in gfx.marquee_frames("HELLO WORLD"):
+            gfx.render()
+        chips[mode] = chip_digits(transport)
+        bytes_sent[mode] = transport.bytes_sent
+    assert chips["delta"] == chips["full"]
+    assert chips["dense"] == chips["full"]
+    assert bytes_sent["dense"] <= bytes_sent["delta"] < bytes_sent["full"]
@@ -0,0 +1,152 @@
+"""Text drawn with the compiled glyphs against a plain [x][y] list of pixels"""
+from random import Random
+
+import pytest
+
+from piledmatrix.driver import DisplayUnit
+from piledmatrix.driver.framebuffer import PIXEL_OFF, PIXEL_ON, PIXEL_INVERT
+from piledmatrix.driver.simulator import RecordingTransport
+from piledmatrix.font import font_names, get_font
+from piledmatrix.graphics import Graphics
+from piledmatrix.graphics.glyphs import compile_font
+
+MODES = [PIXEL_ON, PIXEL_OFF, PIXEL_INVERT]
+
+
+def random_pixels(random, width, height):
+    return [[random.randrange(2) for _y in range(height)] for _x in range(width)]
+
+
+def display_of(blocks_per_row, blocks_per_column, pixels=None):
+    display = DisplayUnit(blocks_per_row, blocks_per_column, transport=RecordingTransport())
+    if pixels is not None:
+        display.framebuffer.blit_bitmap(0, 0, pixels)
+    return display
+
+
+def pixels_of(display):
+    return [[1 if pixel else 0 for pixel in column] for column in display.framebuffer.to_list()]
+
+
+def random_text(random, length):
+    return "".join(chr(random.randrange(256)) for _char in range(length))
+
+
+def text_columns(font, text):
+    # The column bytes of 'text', 8 columns per character straight from the font
+    return [column for char in text for column in font[ord(char)]]
+
+
+def drawn(pixels, x, y, columns, mode):
+    # The reference of drawing 8 pixel high columns: PIXEL_ON copies them, PIXEL_OFF copies them inverted and
+    # PIXEL_INVERT XORs them, clipped to the display
+    result = [list(column) for column in pixels]
+    width, height = len(pixels), len(pixels[0])
+    for column_x, column in enumerate(columns):
+        for row in range(8):
+            if not (0 <= x + column_x < width and 0 <= y + row < height):
+                continue
+            pixel = (column >> (7 - row)) & 1
+            if mode == PIXEL_ON:
+                result[x + column_x][y + row] = pixel
+            elif mode == PIXEL_OFF:
+                result[x + column_x][y + row] = 1 - pixel
+            else:
+                result[x + column_x][y + row] ^= pixel
+    return result
+
+
+@pytest.mark.parametrize("font_name", font_names())
+@pytest.mark.parametrize("mode", MODES)
+def test_draw_string(font_name, mode):
+    random = Random(1)
+    font = get_font(font_name)
+    for _text in range(20):
+        pixels = random_pixels(random, 24, 16)
+        display = display_of(3, 2, pixels)
+        gfx = Graphics(display)
+        gfx.set_font(font)
+        gfx.set_draw_mode(mode)
+        text = random_text(random, random.randrange(0, 5))
+        x, y = random.randrange(-12, 24), random.randrange(-9, 16)
+        gfx.draw_string(x, y, text)
+        assert pixels_of(display) == drawn(pixels, x, y, text_columns(font, text), mode)
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_draw_char(mode):
+    random = Random(2)
+    font = get_font()
+    pixels = random_pixels(random, 16, 16)
+    display = display_of(2, 2, pixels)
+    gfx = Graphics(display)
+    gfx.set_draw_mode(mode)
+    expected = pixels
+    for code in range(256):
+        x, y = random.randrange(-8, 16), random.randrange(-8, 16)
+        assert gfx.draw_char(x, y, code) == 8
+        expected = drawn(expected, x, y, font[code], mode)
+    assert pixels_of(display) == expected
+
+
+def test_fonts_are_compiled_once_per_mode():
+    font = get_font("lcd")
+    compiled = compile_font(font, PIXEL_OFF)
+    assert compile_font(font, PIXEL_OFF) is compiled
+    assert compile_font(font, PIXEL_ON) is not compiled
+    assert compiled[ord("A")].columns == bytes(~column & 0xFF for column in font[ord("A")])
+    with pytest.raises(ValueError):
+        compile_font(font, 7)
+
+
+def proportional_columns(font, text, spacing):
+    # The column bytes of 'text' with every glyph cut from its first to its last lit column, blank glyphs
+    # (space) half as wide as the widest glyph, 'spacing' blank columns between the characters
+    glyphs = []
+    for code in range(256):
+        lit = [index for index, column in enumerate(font[code]) if column]
+        glyphs.append(list(font[code][lit[0]:lit[-1] + 1]) if lit else None)
+    blank_width = max(1, max(len(glyph) for glyph in glyphs if glyph is not None) // 2)
+    columns = []
+    for index, char in enumerate(text):
+        glyph = glyphs[ord(char)]
+        columns += [0] * blank_width if glyph is None else glyph
+        if index < len(text) - 1:
+            columns += [0] * spacing
+    return columns
+
+
+@pytest.mark.parametrize("font_name", font_names())
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("spacing", [0, 1, 3])
+def test_draw_string_proportional(font_name, mode, spacing):
+    random = Random(3)
+    font = get_font(font_name)
+    for _text in range(10):
+        pixels = random_pixels(random, 32, 8)
+        display = display_of(4, 1, pixels)
+        gfx = Graphics(display)
+        gfx.set_font(font)
+        gfx.set_draw_mode(mode)
+        gfx.set_proportional(True, spacing)
+        text = random_text(random, random.randrange(0, 6))
+        x, y = random.randrange(-8, 24), random.randrange(-4, 5)
+        gfx.draw_string(x, y, text)
+        columns = proportional_columns(font, text, spacing)
+        assert pixels_of(display) == drawn(pixels, x, y, columns, mode)
+        assert gfx.measure_string(text) == len(columns)
+
+
+@pytest.mark.parametrize("font_name", font_names())
+def test_draw_char_proportional_advances_to_the_next_character(font_name):
+    font = get_font(font_name)
+    display = display_of(4, 1)
+    gfx = Graphics(display)
+    gfx.set_font(font)
+    gfx.set_proportional(True, 2)
+    x = 0
+    for char in "Ab i.W ":
+        x += gfx.draw_char(x, 0, ord(char))
+    columns = proportional_columns(font, "Ab i.W ", 2) + [0] * 2
+    assert x == len(columns)
+    assert pixels_of(display) == drawn([[0] * 8] * 32, 0, 0, columns, PIXEL_ON)
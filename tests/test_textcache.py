@@ -0,0 +1,96 @@
+"""TextCache against a plain least recently used list, render_text against draw_string"""
+from collections import OrderedDict
+from random import Random
+
+import pytest
+
+from piledmatrix.driver import DisplayUnit
+from piledmatrix.driver.framebuffer import PIXEL_OFF, PIXEL_ON, PIXEL_INVERT
+from piledmatrix.driver.simulator import RecordingTransport
+from piledmatrix.graphics import Graphics
+from piledmatrix.graphics.bitmap import Bitmap
+from piledmatrix.graphics.textcache import TextCache
+
+
+@pytest.mark.parametrize("max_bytes", [0, 10, 64, 500])
+def test_least_recently_used_bitmaps_are_evicted(max_bytes):
+    random = Random(max_bytes)
+    cache = TextCache(max_bytes)
+    sizes = dict((key, random.randrange(1, 40)) for key in range(30))
+    # key: size of the cached bitmaps, least recently used first
+    reference = OrderedDict()
+    hits = misses = evictions = 0
+    for _lookup in range(500):
+        key = random.randrange(30)
+        rendered = []
+
+        def render():
+            rendered.append(key)
+            return Bitmap(sizes[key], 8, bytes(sizes[key]))
+        bitmap = cache.get(key, render)
+        assert bitmap.width == sizes[key]
+        if key in reference:
+            hits += 1
+            reference.move_to_end(key)
+            assert rendered == []
+        else:
+            misses += 1
+            assert rendered == [key]
+            if sizes[key] <= max_bytes:
+                reference[key] = sizes[key]
+                while sum(reference.values()) > max_bytes:
+                    reference.popitem(last=False)
+                    evictions += 1
+        assert cache.stats() == {"entries": len(reference), "bytes": sum(reference.values()),
+                                 "max_bytes": max_bytes, "hits": hits, "misses": misses, "evictions": evictions}
+
+
+def test_resize_clear_and_reset_stats():
+    cache = TextCache(100)
+    for key in range(10):
+        cache.get(key, lambda: Bitmap(10, 8, bytes(10)))
+    assert len(cache) == 10
+    cache.resize(35)
+    assert cache.stats()["entries"] == 3 and cache.stats()["bytes"] == 30 and cache.evictions == 7
+    # The newest entries are kept
+    cache.get(9, lambda: pytest.fail("9 was evicted"))
+    cache.reset_stats()
+    assert (cache.hits, cache.misses, cache.evictions) == (0, 0, 0)
+    cache.clear()
+    assert len(cache) == 0 and cache.size == 0
+
+
+@pytest.mark.parametrize("mode", [PIXEL_ON, PIXEL_OFF, PIXEL_INVERT])
+@pytest.mark.parametrize("proportional", [False, True])
+def test_render_text_draws_like_draw_string(mode, proportional):
+    random = Random(mode)
+    cache = TextCache()
+    for text in ["", "A", "Hello, world", "0123456789", "Hello, world"]:
+        x, y = random.randrange(-10, 20), random.randrange(-6, 12)
+        pixels = [[random.randrange(2) for _y in range(16)] for _x in range(32)]
+        displays = [DisplayUnit(4, 2, transport=RecordingTransport()) for _display in range(2)]
+        for display in displays:
+            display.framebuffer.blit_bitmap(0, 0, pixels)
+        string_gfx, bitmap_gfx = [Graphics(display, cache) for display in displays]
+        for gfx in string_gfx, bitmap_gfx:
+            gfx.set_draw_mode(mode)
+            gfx.set_proportional(proportional, 2)
+        string_gfx.draw_string(x, y, text)
+        bitmap_gfx.draw_bitmap(bitmap_gfx.render_text(text), x, y)
+        assert displays[1].framebuffer.to_list() == displays[0].framebuffer.to_list()
+    # The repeated message and nothing else came from the cache
+    assert cache.hits == 1 and cache.misses == 4
+
+
+def test_render_text_keys():
+    cache = TextCache()
+    gfx = Graphics(DisplayUnit(4, 1, transport=RecordingTransport()), cache)
+    bitmap = gfx.render_text("CPU")
+    assert gfx.render_text("CPU") is bitmap
+    assert gfx.render_text("CPU", "lcd") is not bitmap
+    gfx.set_proportional(True, 1)
+    proportional = gfx.render_text("CPU")
+    assert proportional.width < bitmap.width
+    gfx.set_proportional(True, 2)
+    assert gfx.render_text("CPU").width == proportional.width + 2
+    assert cache.misses == 4 and cache.hits == 1
@@ -0,0 +1,166 @@
+"""Transition masks and the frames blended through them against plain [x][y] lists of pixels"""
+from random import Random
+
+import pytest
+
+from piledmatrix.directions import DIR_U, DIR_D, DIR_L, DIR_R, DIR_LU, DIR_LD, DIR_RU, DIR_RD
+from piledmatrix.driver import DisplayUnit, PackedFramebuffer
+from piledmatrix.driver.simulator import RecordingTransport
+from piledmatrix.graphics import Graphics, transitions
+
+SIZES = [(8, 8), (16, 8), (24, 16), (5, 13)]
+DIRECTIONS = [DIR_U, DIR_D, DIR_L, DIR_R, DIR_LU, DIR_LD, DIR_RU, DIR_RD]
+
+
+def random_pixels(random, width, height):
+    return [[random.randrange(2) for _y in range(height)] for _x in range(width)]
+
+
+def mask_pixels(mask, width, height):
+    framebuffer = PackedFramebuffer(width, height)
+    framebuffer.load(mask)
+    assert bytes(framebuffer.packed()) == mask, "padding bits set"
+    return [[1 if pixel else 0 for pixel in column] for column in framebuffer.to_list()]
+
+
+def check_masks(masks, width, height):
+    # Every mask shows the new picture wherever the one before did, the last one everywhere; returns the masks
+    # as pixel lists
+    frames = [mask_pixels(mask, width, height) for mask in masks]
+    for before, after in zip(frames, frames[1:]):
+        assert all(old <= new for old_column, new_column in zip(before, after)
+                   for old, new in zip(old_column, new_column))
+        assert before != after
+    assert frames[-1] == [[1] * height] * width
+    return frames
+
+
+def wipe_rank(x, y, width, height, direction):
+    # Frame from which on a wipe shows the new picture at x/y: uncovered from the left edge for DIR_R, from the
+    # right one for DIR_L, from the top for DIR_U, from the bottom for DIR_D, from both for the diagonals
+    rank = 0
+    if direction & DIR_R:
+        rank += x
+    if direction & DIR_L:
+        rank += width - 1 - x
+    if direction & DIR_U:
+        rank += y
+    if direction & DIR_D:
+        rank += height - 1 - y
+    return rank
+
+
+@pytest.mark.parametrize("width, height", SIZES)
+@pytest.mark.parametrize("direction", DIRECTIONS)
+def test_wipe(width, height, direction):
+    frames = check_masks(transitions.wipe(width, height, direction), width, height)
+    for frame, pixels in enumerate(frames):
+        assert pixels == [[1 if wipe_rank(x, y, width, height, direction) <= frame else 0 for y in range(height)]
+                          for x in range(width)]
+
+
+@pytest.mark.parametrize("width, height", SIZES)
+@pytest.mark.parametrize("frames", [1, 4, 16])
+def test_dissolve(width, height, frames):
+    masks = transitions.dissolve(width, height, frames, seed=frames)
+    pixel_frames = check_masks(masks, width, height)
+    assert len(masks) == frames
+    counts = [sum(map(sum, pixels)) for pixels in pixel_frames]
+    new = [after - before for before, after in zip([0] + counts, counts)]
+    assert max(new) - min(new) <= 1
+    assert transitions.dissolve(width, height, frames, seed=frames) == masks
+    assert transitions.dissolve(width, height, frames, seed=frames + 1) != masks or frames == 1
+
+
+@pytest.mark.parametrize("width, height", SIZES)
+@pytest.mark.parametrize("opening", [True, False])
+def test_iris(width, height, opening):
+    frames = check_masks(transitions.iris(width, height, opening), width, height)
+    centre_x, centre_y = (width - 1) / 2.0, (height - 1) / 2.0
+
+    def distance(x, y):
+        return ((x - centre_x) ** 2 + (y - centre_y) ** 2) ** 0.5
+    for pixels in frames[:-1]:
+        shown = [distance(x, y) for x in range(width) for y in range(height) if pixels[x][y]]
+        hidden = [distance(x, y) for x in range(width) for y in range(height) if not pixels[x][y]]
+        # A circle around the centre grows, or the area outside a circle does
+        if opening:
+            assert max(shown) < min(hidden) + 1
+        else:
+            assert min(shown) > max(hidden) - 1
+
+
+@pytest.mark.parametrize("width, height", SIZES)
+@pytest.mark.parametrize("direction", [DIR_U, DIR_D, DIR_L, DIR_R])
+@pytest.mark.parametrize("size", [1, 3, 8])
+def test_blinds(width, height, direction, size):
+    frames = check_masks(transitions.blinds(width, height, direction, size), width, height)
+    # A wipe of the slat each pixel is in; the frames of slat columns (rows) beyond the display are left out
+    across = direction & (DIR_L | DIR_R)
+    ranks = [[wipe_rank(x % size if across else x, y if across else y % size, size if across else width,
+                        height if across else size, direction) for y in range(height)] for x in range(width)]
+    first = min(map(min, ranks))
+    for frame, pixels in enumerate(frames, first):
+        assert pixels == [[1 if rank <= frame else 0 for rank in column] for column in ranks]
+
+
+def test_unknown_directions_have_no_frames():
+    assert transitions.wipe(8, 8, 0) == ()
+    assert transitions.blinds(8, 8, DIR_RU) == ()
+
+
+def display_with(pixels, blocks_per_row, blocks_per_column):
+    display = DisplayUnit(blocks_per_row, blocks_per_column, transport=RecordingTransport())
+    display.framebuffer.blit_bitmap(0, 0, pixels)
+    return display
+
+
+def pixels_of(display):
+    return [[1 if pixel else 0 for pixel in column] for column in display.framebuffer.to_list()]
+
+
+@pytest.mark.parametrize("direction", DIRECTIONS)
+def test_wipe_frames_blend_the_pictures(direction):
+    random = Random(direction)
+    old, new = random_pixels(random, 24, 16), random_pixels(random, 24, 16)
+    display = display_with(old, 3, 2)
+    masks = transitions.wipe(24, 16, direction)
+    frame = 0
+    for frame, _frame in enumerate(Graphics(display).wipe_frames(new, direction), 1):
+        mask = mask_pixels(masks[frame - 1], 24, 16)
+        assert pixels_of(display) == [[new[x][y] if mask[x][y] else old[x][y] for y in range(16)]
+                                      for x in range(24)]
+    assert frame == len(masks)
+
+
+def slid(old, new, direction, step):
+    # The reference of a slide: both pictures side by side, moved by 'step' pixels; DIR_U moves them down
+    width, height = len(old), len(old[0])
+    result = []
+    for x in range(width):
+        column = []
+        for y in range(height):
+            if direction == DIR_L:
+                column.append(old[x + step][y] if x + step < width else new[x + step - width][y])
+            elif direction == DIR_R:
+                column.append(old[x - step][y] if x - step >= 0 else new[x - step + width][y])
+            elif direction == DIR_U:
+                column.append(old[x][y - step] if y - step >= 0 else new[x][y - step + height])
+            else:
+                column.append(old[x][y + step] if y + step < height else new[x][y + step - height])
+        result.append(column)
+    return result
+
+
+@pytest.mark.parametrize("direction", [DIR_U, DIR_D, DIR_L, DIR_R])
+@pytest.mark.parametrize("blocks_per_row, blocks_per_column", [(1, 1), (3, 2)])
+def test_slide_frames(direction, blocks_per_row, blocks_per_column):
+    random = Random(direction + blocks_per_row)
+    width, height = blocks_per_row * 8, blocks_per_column * 8
+    old, new = random_pixels(random, width, height), random_pixels(random, width, height)
+    display = display_with(old, blocks_per_row, blocks_per_column)
+    step = 0
+    for step, _frame in enumerate(Graphics(display).slide_frames(new, direction), 1):
+        assert pixels_of(display) == slid(old, new, direction, step)
+    assert step == (width if direction in (DIR_L, DIR_R) else height)
+    assert pixels_of(display) == new